@@ -1,5 +1,29 @@
-from assignment_1.blocking_queue import BoundedBlockingQueue
-from assignment_1.producer_consumer import Producer, Consumer, _SENTINEL
-
-__all__ = ['BoundedBlockingQueue', 'Producer', 'Consumer', '_SENTINEL']
+from assignment_1.blocking_queue import (
+    BoundedBlockingQueue, SPSCQueue, QueueClosed, QueueEmpty, QueueFull
+)
+from assignment_1.async_queue import AsyncBoundedQueue, ThreadBridge
+from assignment_1.producer_consumer import (
+    Producer, Consumer, ProcessProducer, ProcessConsumer, _SENTINEL
+)
+from assignment_1.priority_queue import BoundedPriorityQueue
+from assignment_1.weighted_queue import WeightedBlockingQueue
+from assignment_1.spill_queue import SpillingQueue
+from assignment_1.lane_queue import MultiLaneQueue, Lane
+from assignment_1.shm_queue import SharedMemoryQueue
+from assignment_1.worker_pool import OrderedWorkerPool, ReorderBuffer, ReorderAborted
+from assignment_1.pipeline import Pipeline, PipelineAborted
+from assignment_1.autoscaler import ConsumerAutoscaler
+from assignment_1.tracing import Tracer
+from assignment_1.sinks import (
+    Sink, ListSink, LockedListSink, CallbackSink, BatchCallbackSink, QueueSink, FileSink,
+    merge_sinks
+)
 
+__all__ = ['BoundedBlockingQueue', 'SPSCQueue', 'QueueClosed', 'QueueEmpty', 'QueueFull',
+           'BoundedPriorityQueue', 'WeightedBlockingQueue', 'SpillingQueue',
+           'MultiLaneQueue', 'Lane', 'AsyncBoundedQueue', 'ThreadBridge',
+           'SharedMemoryQueue', 'Producer', 'Consumer', 'ProcessProducer',
+           'ProcessConsumer', 'Sink', 'ListSink', 'LockedListSink', 'CallbackSink',
+           'BatchCallbackSink', 'QueueSink', 'FileSink', 'merge_sinks',
+           'OrderedWorkerPool', 'ReorderBuffer', 'ReorderAborted', 'Pipeline',
+           'PipelineAborted', 'ConsumerAutoscaler', 'Tracer', '_SENTINEL']
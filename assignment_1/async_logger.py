@@ -0,0 +1,177 @@
+import atexit
+import os
+import sys
+import threading
+import time
+from logging import DEBUG, INFO, WARNING, ERROR
+from queue import Empty, SimpleQueue
+from typing import Any, Dict, Optional, TextIO
+
+_MESSAGE = 0
+_COUNT = 1
+_FLUSH = 2
+_STOP = 3
+_MAX_LINES_PER_WRITE = 10000
+
+
+class AsyncLogger:
+    """Buffered logger whose output is written by a background thread.
+    
+    Worker threads only check the level and push onto an unbounded
+    SimpleQueue, so they never block on stdout. The writer thread drains
+    everything pending and emits it with one write and one flush. Messages use
+    %-style arguments, formatted on the writer thread only if the level passes.
+    
+    quiet=True suppresses everything below ERROR. With progress_interval set,
+    a summary of count() totals is written every progress_interval seconds.
+    """
+    
+    def __init__(self, level: int = INFO, quiet: bool = False,
+                 stream: Optional[TextIO] = None,
+                 progress_interval: Optional[float] = None):
+        self.level = ERROR if quiet else level
+        self.quiet = quiet
+        self.stream = stream
+        self.progress_interval = None if quiet else progress_interval
+        self._start_lock = threading.Lock()
+        self._thread = None
+        self._pid = None
+        self._records = SimpleQueue()
+    
+    def is_enabled_for(self, level: int) -> bool:
+        """True if messages at level would be written."""
+        return level >= self.level
+    
+    def log(self, level: int, message: str, *args: Any) -> None:
+        """Queue message % args for output if level is enabled. Never blocks."""
+        if level >= self.level:
+            self._ensure_started()
+            self._records.put((_MESSAGE, message, args))
+    
+    def debug(self, message: str, *args: Any) -> None:
+        self.log(DEBUG, message, *args)
+    
+    def info(self, message: str, *args: Any) -> None:
+        self.log(INFO, message, *args)
+    
+    def warning(self, message: str, *args: Any) -> None:
+        self.log(WARNING, message, *args)
+    
+    def error(self, message: str, *args: Any) -> None:
+        self.log(ERROR, message, *args)
+    
+    def count(self, key: str, amount: int = 1) -> None:
+        """Add amount to a progress counter. No-op unless progress summaries are on."""
+        if self.progress_interval is not None:
+            self._ensure_started()
+            self._records.put((_COUNT, key, amount))
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until everything queued so far has been written."""
+        if self._thread is None or self._pid != os.getpid():
+            return True
+        done = threading.Event()
+        self._records.put((_FLUSH, done))
+        return done.wait(timeout)
+    
+    def close(self) -> None:
+        """Write everything queued so far and stop the writer thread."""
+        with self._start_lock:
+            thread = self._thread
+            if thread is None or self._pid != os.getpid():
+                return
+            self._records.put((_STOP,))
+            thread.join()
+            self._thread = None
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle the configuration only, so a spawned process starts its own writer."""
+        return {'level': self.level, 'quiet': self.quiet, 'stream': self.stream,
+                'progress_interval': self.progress_interval}
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._start_lock = threading.Lock()
+        self._thread = None
+        self._pid = None
+        self._records = SimpleQueue()
+    
+    def _ensure_started(self) -> None:
+        """Start the writer thread on first use, and again in a forked child."""
+        if self._thread is not None and self._pid == os.getpid():
+            return
+        with self._start_lock:
+            if self._thread is not None and self._pid == os.getpid():
+                return
+            if self._pid != os.getpid():
+                self._records = SimpleQueue()  # Records inherited from a parent are not ours
+            self._pid = os.getpid()
+            self._thread = threading.Thread(target=self._run, name="AsyncLogger", daemon=True)
+            self._thread.start()
+            atexit.register(self.close)
+    
+    def _run(self) -> None:
+        """Writer loop: drain pending records, write them in one go, repeat."""
+        counters: Dict[str, int] = {}
+        interval = self.progress_interval
+        started_at = time.monotonic()
+        next_progress = started_at + interval if interval else None
+        while True:
+            timeout = None if next_progress is None else max(0.0, next_progress - time.monotonic())
+            try:
+                record = self._records.get(timeout=timeout)
+            except Empty:
+                record = None
+            
+            lines = []
+            flushed = []
+            stop = False
+            while record is not None:
+                kind = record[0]
+                if kind == _MESSAGE:
+                    lines.append(self._format(record[1], record[2]))
+                elif kind == _COUNT:
+                    counters[record[1]] = counters.get(record[1], 0) + record[2]
+                elif kind == _FLUSH:
+                    flushed.append(record[1])
+                else:
+                    stop = True
+                    break
+                if len(lines) >= _MAX_LINES_PER_WRITE:
+                    break
+                try:
+                    record = self._records.get_nowait()
+                except Empty:
+                    record = None
+            
+            if next_progress is not None and (stop or time.monotonic() >= next_progress):
+                elapsed = time.monotonic() - started_at
+                summary = ", ".join(f"{key}={value}" for key, value in sorted(counters.items()))
+                lines.append(f"[progress {elapsed:.1f}s] {summary or 'no activity'}")
+                next_progress = time.monotonic() + interval
+            
+            if lines:
+                stream = self.stream or sys.stdout
+                try:
+                    stream.write("\n".join(lines) + "\n")
+                    stream.flush()
+                except (OSError, ValueError):
+                    pass  # Closed or broken stream; keep draining so flush() never hangs
+            for done in flushed:
+                done.set()
+            if stop:
+                return
+    
+    @staticmethod
+    def _format(message: str, args: tuple) -> str:
+        if not args:
+            return message
+        try:
+            return message % args
+        except (TypeError, ValueError):
+            return f"{message} {args!r}"
+
+
+# Shared by every Producer/Consumer built without a logger. Quiet, so library code only
+# reports errors unless the caller opts into INFO/DEBUG output with its own AsyncLogger
+default_logger = AsyncLogger(quiet=True)
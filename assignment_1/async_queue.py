@@ -0,0 +1,195 @@
+import asyncio
+from collections import deque
+from typing import Any, Callable, Iterable, List, Optional
+from assignment_1.blocking_queue import QueueClosed, QueueEmpty, QueueFull
+
+
+class AsyncBoundedQueue:
+    """asyncio bounded queue with the same capacity semantics as BoundedBlockingQueue.
+    
+    put() and get() are coroutines that suspend the calling task instead of
+    blocking the event loop thread. Timeouts and close() follow
+    BoundedBlockingQueue: an expired put()/get() raises QueueFull/QueueEmpty,
+    and after close() puts raise QueueClosed while gets drain what is left.
+    Not thread-safe on its own; threads should go through a ThreadBridge.
+    """
+    
+    def __init__(self, capacity: int):
+        if capacity <= 0:
+            raise ValueError("Capacity must be greater than 0")
+        
+        self.capacity = capacity
+        self.queue = deque()
+        self.closed = False
+        self.lock = asyncio.Lock()
+        self.not_full = asyncio.Condition(self.lock)
+        self.not_empty = asyncio.Condition(self.lock)
+    
+    async def put(self, item: Any, timeout: Optional[float] = None) -> None:
+        """Add item to queue. Suspends if queue is full. Raises QueueClosed if closed.
+        
+        Once timeout (in seconds) expires while the queue is still full,
+        raises QueueFull instead.
+        """
+        async with self.not_full:
+            await self._wait(self.not_full, self._has_room, timeout)
+            if self.closed:
+                raise QueueClosed("put() on a closed queue")
+            if not self._has_room():
+                raise QueueFull("put() timed out on a full queue")
+            self.queue.append(item)
+            self.not_empty.notify()
+    
+    async def get(self, timeout: Optional[float] = None) -> Any:
+        """Remove and return item from queue. Suspends if queue is empty.
+        
+        Once timeout (in seconds) expires with the queue still empty, raises
+        QueueEmpty. Raises QueueClosed once the queue is closed and fully drained.
+        """
+        async with self.not_empty:
+            await self._wait(self.not_empty, self._has_items, timeout)
+            if not self.queue:
+                if self.closed:
+                    raise QueueClosed("get() on a closed, empty queue")
+                raise QueueEmpty("get() timed out on an empty queue")
+            item = self.queue.popleft()
+            self.not_full.notify()
+            return item
+    
+    async def put_many(self, items: Iterable[Any]) -> None:
+        """Add all items to queue, moving as many as fit per wakeup.
+        
+        Raises QueueClosed if the queue is closed before all items are moved.
+        """
+        pending = deque(items)
+        if not pending:
+            return
+        async with self.not_full:
+            while pending:
+                await self._wait(self.not_full, self._has_room, None)
+                if self.closed:
+                    raise QueueClosed("put_many() on a closed queue")
+                moved = min(self.capacity - len(self.queue), len(pending))
+                for _ in range(moved):
+                    self.queue.append(pending.popleft())
+                self.not_empty.notify(moved)
+    
+    async def get_many(self, max_items: int, timeout: Optional[float] = None) -> List[Any]:
+        """Remove and return up to max_items items once at least one is available.
+        
+        Returns an empty list if timeout (in seconds) expires first. Raises
+        QueueClosed once the queue is closed and fully drained.
+        """
+        if max_items <= 0:
+            raise ValueError("max_items must be greater than 0")
+        
+        async with self.not_empty:
+            await self._wait(self.not_empty, self._has_items, timeout)
+            if not self.queue:
+                if self.closed:
+                    raise QueueClosed("get_many() on a closed, empty queue")
+                return []
+            taken = min(max_items, len(self.queue))
+            items = [self.queue.popleft() for _ in range(taken)]
+            self.not_full.notify(taken)
+            return items
+    
+    async def close(self) -> None:
+        """Stop accepting puts and wake all suspended producers and consumers.
+        
+        Items already buffered stay available to get(). Closing twice is a no-op.
+        """
+        async with self.lock:
+            self.closed = True
+            self.not_full.notify_all()
+            self.not_empty.notify_all()
+    
+    def bridge(self, loop: Optional[asyncio.AbstractEventLoop] = None) -> "ThreadBridge":
+        """Return a blocking put/get facade for threads, bound to loop."""
+        return ThreadBridge(self, loop)
+    
+    def _has_room(self) -> bool:
+        return len(self.queue) < self.capacity
+    
+    def _has_items(self) -> bool:
+        return bool(self.queue)
+    
+    async def _wait(self, condition: asyncio.Condition, ready: Callable[[], bool],
+                    timeout: Optional[float]) -> None:
+        """Wait on condition until ready(), the queue closes or timeout (in seconds) expires.
+        
+        Callers hold the condition's lock and re-check the queue afterwards, so
+        the deadline is enforced on the loop: an operation that gave up can
+        never complete later behind the caller's back.
+        """
+        if timeout is not None and timeout < 0:
+            raise ValueError("timeout must not be negative")
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while not ready() and not self.closed:
+            if deadline is None:
+                await condition.wait()
+                continue
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return
+            try:
+                await asyncio.wait_for(condition.wait(), remaining)
+            except asyncio.TimeoutError:
+                pass
+    
+    def __repr__(self) -> str:
+        """String representation of the queue."""
+        state = ", closed" if self.closed else ""
+        return f"AsyncBoundedQueue(capacity={self.capacity}, size={len(self.queue)}{state})"
+
+
+class ThreadBridge:
+    """Blocking put/get facade that lets threads use an AsyncBoundedQueue.
+    
+    Each call schedules the coroutine on the queue's event loop and blocks only
+    the calling thread until it completes, so a threaded Producer can feed
+    async consumers (and async producers can feed a threaded Consumer) without
+    a helper thread per waiter. Must not be called from the loop's own thread.
+    
+    put()/get() accept the same timeout as BoundedBlockingQueue and close()
+    closes the async queue, so Producer(put_timeout=..., on_finish="close")
+    and Consumer(get_timeout=...) work through a bridge unchanged.
+    """
+    
+    def __init__(self, queue: AsyncBoundedQueue,
+                 loop: Optional[asyncio.AbstractEventLoop] = None):
+        self.queue = queue
+        self.loop = loop or asyncio.get_running_loop()
+    
+    def put(self, item: Any, timeout: Optional[float] = None) -> None:
+        """Add item to the async queue. Blocks the calling thread if full.
+        
+        Raises QueueFull once timeout (in seconds) expires, QueueClosed if closed.
+        """
+        asyncio.run_coroutine_threadsafe(self.queue.put(item, timeout), self.loop).result()
+    
+    def get(self, timeout: Optional[float] = None) -> Any:
+        """Remove and return an item. Blocks the calling thread if empty.
+        
+        Raises QueueEmpty once timeout (in seconds) expires, QueueClosed once
+        the queue is closed and drained.
+        """
+        return asyncio.run_coroutine_threadsafe(self.queue.get(timeout), self.loop).result()
+    
+    def put_many(self, items: Iterable[Any]) -> None:
+        """Add all items with one loop round-trip. Blocks the calling thread while full."""
+        asyncio.run_coroutine_threadsafe(self.queue.put_many(list(items)), self.loop).result()
+    
+    def get_many(self, max_items: int, timeout: Optional[float] = None) -> List[Any]:
+        """Remove up to max_items items with one loop round-trip."""
+        return asyncio.run_coroutine_threadsafe(
+            self.queue.get_many(max_items, timeout), self.loop).result()
+    
+    def close(self) -> None:
+        """Close the async queue and wake every waiter, thread or coroutine."""
+        asyncio.run_coroutine_threadsafe(self.queue.close(), self.loop).result()
+    
+    def __repr__(self) -> str:
+        """String representation of the bridge."""
+        return f"ThreadBridge({self.queue!r})"
@@ -0,0 +1,146 @@
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from assignment_1.async_logger import AsyncLogger, default_logger
+from assignment_1.blocking_queue import BoundedBlockingQueue
+from assignment_1.producer_consumer import Consumer, _SENTINEL
+
+
+class ConsumerAutoscaler(threading.Thread):
+    """Supervisor thread that sizes a pool of consumers to the load on one queue.
+    
+    Every interval seconds it samples the queue depth and, when the queue was
+    created with metrics=True, the share of consumer time spent waiting for
+    items. A consumer is added when the queue has been at least high_water
+    full for scale_up_after samples in a row while consumers waited less than
+    idle_threshold of the time (so a momentary burst that consumers are
+    already absorbing does not count). One is retired, by enqueueing a
+    _SENTINEL, when the queue has been empty for scale_down_after samples.
+    The pool always stays within min_consumers..max_consumers.
+    
+    consumer_factory(name) builds each consumer; it defaults to a Consumer
+    with its own ListSink and may return ProcessConsumer instances instead.
+    Shut down by closing the queue (Producer(on_finish="close")): a single
+    sentinel only stops one consumer. The supervisor exits once the queue is
+    closed and every consumer has finished, or when stop() is called.
+    Every consumer ever started is kept in self.consumers.
+    """
+    
+    def __init__(self, queue: BoundedBlockingQueue,
+                 consumer_factory: Optional[Callable[[str], Any]] = None,
+                 min_consumers: int = 1, max_consumers: int = 4, interval: float = 0.05,
+                 high_water: float = 0.8, idle_threshold: float = 0.5,
+                 scale_up_after: int = 2, scale_down_after: int = 10,
+                 name: Optional[str] = None, logger: Optional[AsyncLogger] = None):
+        super().__init__(name=name or "Autoscaler", daemon=True)
+        if min_consumers <= 0:
+            raise ValueError("min_consumers must be greater than 0")
+        if max_consumers < min_consumers:
+            raise ValueError("max_consumers must be at least min_consumers")
+        if interval <= 0:
+            raise ValueError("interval must be greater than 0")
+        
+        self.queue = queue
+        self.logger = logger or default_logger
+        self.consumer_factory = consumer_factory or (
+            lambda consumer_name: Consumer(queue, name=consumer_name, logger=self.logger))
+        self.min_consumers = min_consumers
+        self.max_consumers = max_consumers
+        self.interval = interval
+        self.high_water = high_water
+        self.idle_threshold = idle_threshold
+        self.scale_up_after = scale_up_after
+        self.scale_down_after = scale_down_after
+        self.consumers: List[Any] = []
+        self.events: List[Dict[str, Any]] = []
+        self.peak_consumers = 0
+        self._active: List[Any] = []
+        self._retiring = 0
+        self._stopping = threading.Event()
+    
+    def start(self) -> None:
+        """Start min_consumers consumers, then the supervisor loop."""
+        for _ in range(self.min_consumers):
+            self._add_consumer()
+        super().start()
+    
+    def stop(self) -> None:
+        """Stop supervising; running consumers are left to finish on their own."""
+        self._stopping.set()
+    
+    def join_consumers(self, timeout: Optional[float] = None) -> None:
+        """Wait for the supervisor and every consumer it started to finish."""
+        self.join(timeout)
+        for consumer in list(self.consumers):
+            consumer.join(timeout)
+    
+    def run(self) -> None:
+        """Sample load every interval and add or retire consumers."""
+        busy_samples = 0
+        idle_samples = 0
+        last_wait = self._get_wait_seconds()
+        start_time = time.monotonic()
+        while not self._stopping.wait(self.interval):
+            running = len(self._active)
+            self._active = [consumer for consumer in self._active if consumer.is_alive()]
+            self._retiring = max(0, self._retiring - (running - len(self._active)))
+            if getattr(self.queue, 'closed', False):
+                if not self._active:
+                    break
+                continue  # Draining: let consumers exit on QueueClosed
+            
+            depth = self.queue.qsize()
+            consumers = len(self._active) - self._retiring
+            wait = self._get_wait_seconds()
+            idle = None
+            if wait is not None and consumers > 0:
+                idle = (wait - last_wait) / (self.interval * consumers)
+                last_wait = wait
+            
+            if depth >= self.high_water * self.queue.capacity and (
+                    idle is None or idle < self.idle_threshold):
+                busy_samples += 1
+                idle_samples = 0
+            elif depth == 0:
+                idle_samples += 1
+                busy_samples = 0
+            else:
+                busy_samples = idle_samples = 0
+            
+            elapsed = time.monotonic() - start_time
+            if busy_samples >= self.scale_up_after and consumers < self.max_consumers:
+                self._add_consumer()
+                self._record("scale_up", elapsed, depth, consumers + 1)
+                busy_samples = 0
+            elif idle_samples >= self.scale_down_after and consumers > self.min_consumers:
+                if self._retire_one():
+                    self._retiring += 1
+                    self._record("scale_down", elapsed, depth, consumers - 1)
+                idle_samples = 0
+    
+    def _add_consumer(self) -> None:
+        consumer = self.consumer_factory(f"Consumer-{len(self.consumers) + 1}")
+        consumer.start()
+        self.consumers.append(consumer)
+        self._active.append(consumer)
+        self.peak_consumers = max(self.peak_consumers, len(self._active) - self._retiring)
+    
+    def _retire_one(self) -> bool:
+        """Enqueue a sentinel for whichever consumer takes it next."""
+        try_put = getattr(self.queue, 'try_put', None)
+        if try_put is None:
+            self.queue.put(_SENTINEL)  # The queue was just seen empty, so this is immediate
+            return True
+        return try_put(_SENTINEL)  # Never block the supervisor if a burst just arrived
+    
+    def _record(self, action: str, elapsed: float, depth: int, consumers: int) -> None:
+        self.events.append({'time': elapsed, 'action': action, 'depth': depth,
+                            'consumers': consumers})
+        self.logger.info("[%s] %s to %d consumers (depth %d)", self.name, action, consumers, depth)
+    
+    def _get_wait_seconds(self) -> Optional[float]:
+        """Total consumer wait time on the queue, or None without queue metrics."""
+        if getattr(self.queue, '_stats', None) is None:
+            return None
+        return self.queue.stats()['get_wait']['total_seconds']
@@ -0,0 +1,49 @@
+import argparse
+import threading
+import time
+from typing import Callable, List
+
+from assignment_1.blocking_queue import BoundedBlockingQueue, SPSCQueue
+
+
+def measure_ops_per_sec(queue_factory: Callable[[int], object], capacity: int,
+                        num_items: int) -> float:
+    """Transfer num_items from one producer thread to one consumer thread.
+    
+    Returns items transferred per second (one put plus one get per item).
+    """
+    queue = queue_factory(capacity)
+    
+    def produce():
+        for i in range(num_items):
+            queue.put(i)
+    
+    producer = threading.Thread(target=produce)
+    start_time = time.perf_counter()
+    producer.start()
+    for _ in range(num_items):
+        queue.get()
+    producer.join()
+    return num_items / (time.perf_counter() - start_time)
+
+
+def main(argv: List[str] = None):
+    """Compare SPSCQueue against BoundedBlockingQueue for one producer and one consumer."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("--items", type=int, default=200_000)
+    parser.add_argument("--capacities", type=int, nargs="+", default=[1, 16, 1024])
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="runs per configuration; the best run is reported")
+    args = parser.parse_args(argv)
+    
+    print(f"{'capacity':>8s}  {'BoundedBlockingQueue':>20s}  {'SPSCQueue':>12s}  {'speedup':>7s}")
+    for capacity in args.capacities:
+        baseline = max(measure_ops_per_sec(BoundedBlockingQueue, capacity, args.items)
+                       for _ in range(args.repeat))
+        spsc = max(measure_ops_per_sec(SPSCQueue, capacity, args.items)
+                   for _ in range(args.repeat))
+        print(f"{capacity:8d}  {baseline:17,.0f} /s  {spsc:9,.0f} /s  {spsc / baseline:6.2f}x")
+
+
+if __name__ == "__main__":
+    main()
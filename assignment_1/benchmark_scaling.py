@@ -0,0 +1,222 @@
+import argparse
+import itertools
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import sysconfig
+import tempfile
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from assignment_1.blocking_queue import BoundedBlockingQueue, QueueClosed
+
+_KEY_FIELDS = ("capacity", "item_size", "producers", "consumers")
+
+
+def environment() -> Dict[str, Any]:
+    """Describe the running interpreter, including whether the GIL is disabled."""
+    free_threaded_build = bool(sysconfig.get_config_var("Py_GIL_DISABLED"))
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return {
+        "implementation": platform.python_implementation(),
+        "python_version": platform.python_version(),
+        "executable": sys.executable,
+        "free_threaded_build": free_threaded_build,
+        "gil_enabled": is_gil_enabled() if is_gil_enabled is not None else True,
+        "cpu_count": os.cpu_count(),
+        "platform": platform.platform(),
+    }
+
+
+def run_label(env: Dict[str, Any]) -> str:
+    """Short name of an interpreter, e.g. "CPython-3.13t" for a build running without the GIL."""
+    suffix = "t" if not env['gil_enabled'] else ""
+    return f"{env['implementation']}-{'.'.join(env['python_version'].split('.')[:2])}{suffix}"
+
+
+def _percentile(sorted_values: List[int], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return float(sorted_values[index])
+
+
+def run_scenario(capacity: int, item_size: int, producers: int, consumers: int,
+                 num_items: int) -> Dict[str, Any]:
+    """Move num_items through one BoundedBlockingQueue and measure it.
+    
+    Each producer allocates a fresh item_size-byte payload per item and
+    stamps it with time.perf_counter_ns() just before put(); consumers take
+    the difference on get(). The queue is closed once all producers finish.
+    Returns throughput, p50/p99/max put-to-get latency in microseconds, and
+    process CPU time as seconds and as a percentage of wall time.
+    """
+    queue = BoundedBlockingQueue(capacity)
+    shares = [num_items // producers + (i < num_items % producers) for i in range(producers)]
+    latencies: List[List[int]] = [[] for _ in range(consumers)]
+    
+    def produce(count: int) -> None:
+        clock = time.perf_counter_ns
+        for _ in range(count):
+            queue.put((clock(), bytearray(item_size)))
+    
+    def consume(samples: List[int]) -> None:
+        clock = time.perf_counter_ns
+        while True:
+            try:
+                stamp, _ = queue.get()
+            except QueueClosed:
+                return
+            samples.append(clock() - stamp)
+    
+    producer_threads = [threading.Thread(target=produce, args=(share,)) for share in shares]
+    consumer_threads = [threading.Thread(target=consume, args=(samples,)) for samples in latencies]
+    cpu_start = time.process_time()
+    start = time.perf_counter()
+    for thread in consumer_threads + producer_threads:
+        thread.start()
+    for thread in producer_threads:
+        thread.join()
+    queue.close()
+    for thread in consumer_threads:
+        thread.join()
+    wall = time.perf_counter() - start
+    cpu = time.process_time() - cpu_start
+    
+    merged = sorted(itertools.chain.from_iterable(latencies))
+    return {
+        "capacity": capacity,
+        "item_size": item_size,
+        "producers": producers,
+        "consumers": consumers,
+        "items": len(merged),
+        "wall_seconds": wall,
+        "items_per_second": len(merged) / wall,
+        "latency_p50_us": _percentile(merged, 0.50) / 1000,
+        "latency_p99_us": _percentile(merged, 0.99) / 1000,
+        "latency_max_us": (merged[-1] if merged else 0) / 1000,
+        "cpu_seconds": cpu,
+        "cpu_percent": 100.0 * cpu / wall,
+    }
+
+
+def sweep(capacities: List[int], item_sizes: List[int], producer_counts: List[int],
+          consumer_counts: List[int], num_items: int, repeat: int = 3) -> List[Dict[str, Any]]:
+    """Run every combination of the given dimensions; keeps the best-throughput run of each."""
+    results = []
+    for capacity, item_size, producers, consumers in itertools.product(
+            capacities, item_sizes, producer_counts, consumer_counts):
+        runs = [run_scenario(capacity, item_size, producers, consumers, num_items)
+                for _ in range(repeat)]
+        results.append(max(runs, key=lambda run: run['items_per_second']))
+    return results
+
+
+def compare(runs: List[Dict[str, Any]], baseline: List[Dict[str, Any]],
+            tolerance: float = 0.10) -> List[Dict[str, Any]]:
+    """Scenarios that regressed against baseline, matched by interpreter label and dimensions.
+    
+    A scenario regresses when its throughput drops, or its p99 latency
+    rises, by more than tolerance (a fraction). Scenarios missing from the
+    baseline are ignored.
+    """
+    expected = {}
+    for run in baseline:
+        for result in run['results']:
+            expected[(run['label'],) + tuple(result[field] for field in _KEY_FIELDS)] = result
+    
+    regressions = []
+    for run in runs:
+        for result in run['results']:
+            key = (run['label'],) + tuple(result[field] for field in _KEY_FIELDS)
+            reference = expected.get(key)
+            if reference is None:
+                continue
+            for metric, worse in (("items_per_second", -1), ("latency_p99_us", 1)):
+                old, new = reference[metric], result[metric]
+                if old and worse * (new - old) / old > tolerance:
+                    regressions.append({"label": run['label'], **dict(zip(_KEY_FIELDS, key[1:])),
+                                        "metric": metric, "baseline": old, "current": new,
+                                        "change": (new - old) / old})
+    return regressions
+
+
+def _run_elsewhere(interpreter: str, argv: List[str]) -> Optional[List[Dict[str, Any]]]:
+    """Repeat this benchmark under another interpreter and return its runs, or None if unavailable."""
+    executable = shutil.which(interpreter)
+    if executable is None:
+        print(f"Skipping {interpreter}: not found", file=sys.stderr)
+        return None
+    with tempfile.TemporaryDirectory() as tmp:
+        output = os.path.join(tmp, "results.json")
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        subprocess.run([executable, "-m", "assignment_1.benchmark_scaling", *argv,
+                        "--output", output], cwd=root, check=True)
+        with open(output) as f:
+            return json.load(f)['runs']
+
+
+def _print_results(label: str, results: List[Dict[str, Any]]) -> None:
+    print(f"\n{label}")
+    print(f"{'capacity':>8s} {'size':>6s} {'prod':>4s} {'cons':>4s} {'items/s':>11s} "
+          f"{'p50 us':>9s} {'p99 us':>9s} {'cpu %':>6s}")
+    for r in results:
+        print(f"{r['capacity']:8d} {r['item_size']:6d} {r['producers']:4d} {r['consumers']:4d} "
+              f"{r['items_per_second']:11,.0f} {r['latency_p50_us']:9.1f} "
+              f"{r['latency_p99_us']:9.1f} {r['cpu_percent']:6.1f}")
+
+
+def main(argv: List[str] = None) -> int:
+    """Sweep BoundedBlockingQueue over capacities, item sizes and producer/consumer counts."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("--items", type=int, default=50_000)
+    parser.add_argument("--capacities", type=int, nargs="+", default=[1, 16, 1024])
+    parser.add_argument("--item-sizes", type=int, nargs="+", default=[16, 4096],
+                        help="payload bytes allocated per item")
+    parser.add_argument("--producers", type=int, nargs="+", default=[1, 4])
+    parser.add_argument("--consumers", type=int, nargs="+", default=[1, 4])
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="runs per configuration; the best run is reported")
+    parser.add_argument("--output", help="write results as JSON to this path")
+    parser.add_argument("--baseline", help="JSON results to compare against; exit 1 on regression")
+    parser.add_argument("--tolerance", type=float, default=0.10,
+                        help="allowed fractional throughput drop or p99 latency rise")
+    parser.add_argument("--also-run", nargs="+", default=[], metavar="INTERPRETER",
+                        help="repeat the sweep under other interpreters, e.g. python3.13t")
+    args = parser.parse_args(argv)
+    
+    env = environment()
+    runs = [{"label": run_label(env), "environment": env,
+             "results": sweep(args.capacities, args.item_sizes, args.producers,
+                              args.consumers, args.items, args.repeat)}]
+    sweep_argv = ["--items", str(args.items), "--repeat", str(args.repeat)]
+    for flag, values in (("--capacities", args.capacities), ("--item-sizes", args.item_sizes),
+                         ("--producers", args.producers), ("--consumers", args.consumers)):
+        sweep_argv += [flag, *map(str, values)]
+    for interpreter in args.also_run:
+        runs += _run_elsewhere(interpreter, sweep_argv) or []
+    
+    for run in runs:
+        _print_results(run['label'], run['results'])
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"runs": runs}, f, indent=2)
+    
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(runs, json.load(f)['runs'], args.tolerance)
+        for r in regressions:
+            print(f"REGRESSION {r['label']} capacity={r['capacity']} item_size={r['item_size']} "
+                  f"producers={r['producers']} consumers={r['consumers']}: {r['metric']} "
+                  f"{r['baseline']:,.1f} -> {r['current']:,.1f} ({r['change']:+.0%})")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
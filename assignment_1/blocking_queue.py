@@ -1,40 +1,350 @@
 import threading
+import time
 from collections import deque
-from typing import Any
+from typing import Any, Dict, Iterable, List, Optional
+from assignment_1.queue_stats import QueueStats, TimedCondition
+from assignment_1.tracing import Tracer
+
+
+class QueueClosed(Exception):
+    """Raised by put() on a closed queue, or by get() on a closed, drained queue."""
+
+
+class QueueEmpty(Exception):
+    """Raised by get() when no item is available before its deadline."""
+
+
+class QueueFull(Exception):
+    """Raised by put() when no slot frees up before its deadline."""
+
+
+def _deadline(block: bool, timeout: Optional[float]) -> Optional[float]:
+    """Absolute time.monotonic() deadline for a wait, or None to wait forever."""
+    if not block:
+        return 0.0  # Already passed: fail instead of waiting
+    if timeout is None:
+        return None
+    if timeout < 0:
+        raise ValueError("timeout must not be negative")
+    return time.monotonic() + timeout
+
+
+def _wait_until(condition: threading.Condition, deadline: Optional[float]) -> bool:
+    """Wait on condition for at most the time left before deadline.
+    
+    Returns False without waiting once the deadline has passed. Callers loop
+    on their predicate, so a spurious or stolen wakeup waits again for the
+    remaining time only, instead of restarting the full timeout.
+    """
+    if deadline is None:
+        condition.wait()
+        return True
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        return False
+    condition.wait(remaining)
+    return True
 
 
 class BoundedBlockingQueue:
-    """Thread-safe blocking queue that blocks when full or empty."""
+    """Thread-safe blocking queue that blocks when full or empty.
     
-    def __init__(self, capacity: int):
+    close() stops new puts and wakes every waiter at once; consumers can keep
+    draining buffered items and get QueueClosed once the queue is empty.
+    With metrics=True, depth, throughput, wait times and lock hold time are
+    tracked and exposed via stats(); when disabled, plain locks are used.
+    With a tracer, every wait on not_full/not_empty is recorded as a span;
+    Producers and Consumers on the queue record into the same tracer.
+    """
+    
+    def __init__(self, capacity: int, metrics: bool = False, tracer: Optional[Tracer] = None):
         if capacity <= 0:
             raise ValueError("Capacity must be greater than 0")
         
         self.capacity = capacity
         self.queue = deque()
+        self.closed = False
+        self.tracer = tracer
+        if metrics:
+            self._stats = QueueStats(capacity)
+            self.lock = self._stats.lock
+            self.not_full = TimedCondition(self.lock, self._stats.put_wait)
+            self.not_empty = TimedCondition(self.lock, self._stats.get_wait)
+        else:
+            self._stats = None
+            self.lock = threading.Lock()
+            self.not_full = threading.Condition(self.lock)
+            self.not_empty = threading.Condition(self.lock)
+    
+    def put(self, item: Any, block: bool = True, timeout: Optional[float] = None) -> None:
+        """Add item to queue. Blocks if queue is full. Raises QueueClosed if closed.
+        
+        With block=False, or once timeout (in seconds) expires while the queue
+        is still full, raises QueueFull instead.
+        """
+        self._put(item, 1, block, timeout)
+    
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> Any:
+        """Remove and return item from queue. Blocks if queue is empty.
+        
+        With block=False, or once timeout (in seconds) expires with the queue
+        still empty, raises QueueEmpty. Raises QueueClosed once the queue is
+        closed and fully drained.
+        """
+        deadline = None if block and timeout is None else _deadline(block, timeout)
+        with self.not_empty:
+            if not self.queue:
+                self._wait_not_empty(deadline)
+                if not self.queue:
+                    if self.closed:
+                        raise QueueClosed("get() on a closed, empty queue")
+                    raise QueueEmpty("get() timed out on an empty queue")
+            item = self.queue.popleft()
+            if self._stats is not None:
+                self._stats.record_get(1)
+            self._on_dequeue(1)
+            return item
+    
+    def put_many(self, items: Iterable[Any]) -> None:
+        """Add all items to queue, moving as many as fit per wakeup.
+        
+        Blocks while the queue is full. Each transfer is followed by a single
+        notify covering every item moved, instead of one lock cycle per item.
+        Raises QueueClosed if the queue is closed before all items are moved.
+        """
+        pending = deque(items)
+        if not pending:
+            return
+        with self.not_full:
+            while pending:
+                weight = self._weigh(pending[0])
+                if not self._has_room(weight) and not self.closed:
+                    self._wait_not_full(None, weight)
+                if self.closed:
+                    raise QueueClosed("put_many() on a closed queue")
+                moved = self._move_fitting(pending)
+                if self._stats is not None:
+                    self._stats.record_put(moved, len(self.queue))
+                self.not_empty.notify(moved)
+    
+    def get_many(self, max_items: int, timeout: Optional[float] = None) -> List[Any]:
+        """Remove and return up to max_items items under one lock acquisition.
+        
+        Blocks until at least one item is available. Returns an empty list if
+        timeout (in seconds) expires first. Raises QueueClosed once the queue
+        is closed and fully drained.
+        """
+        if max_items <= 0:
+            raise ValueError("max_items must be greater than 0")
+        
+        deadline = _deadline(True, timeout)
+        with self.not_empty:
+            if not self.queue:
+                self._wait_not_empty(deadline)
+                if not self.queue:
+                    if self.closed:
+                        raise QueueClosed("get_many() on a closed, empty queue")
+                    return []
+            taken = min(max_items, len(self.queue))
+            items = [self.queue.popleft() for _ in range(taken)]
+            if self._stats is not None:
+                self._stats.record_get(taken)
+            self._on_dequeue(taken)
+            return items
+    
+    def try_put(self, item: Any, timeout: float = 0.0) -> bool:
+        """Add item if a slot is free within timeout seconds (default: now).
+        
+        Returns False instead of raising QueueFull. Raises QueueClosed if closed.
+        """
+        try:
+            self.put(item, timeout=timeout)
+        except QueueFull:
+            return False
+        return True
+    
+    def try_get(self, timeout: float = 0.0, default: Any = None) -> Any:
+        """Remove and return an item if one arrives within timeout seconds (default: now).
+        
+        Returns default instead of raising QueueEmpty. Raises QueueClosed once
+        the queue is closed and fully drained.
+        """
+        try:
+            return self.get(timeout=timeout)
+        except QueueEmpty:
+            return default
+    
+    def close(self) -> None:
+        """Stop accepting puts and wake all blocked producers and consumers.
+        
+        Items already buffered stay available to get(). Closing twice is a no-op.
+        """
+        with self.lock:
+            self.closed = True
+            self.not_full.notify_all()
+            self.not_empty.notify_all()
+    
+    def qsize(self) -> int:
+        """Number of items currently buffered (approximate once it is returned)."""
+        return len(self.queue)
+    
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of queue metrics. Requires the queue to be created with metrics=True.
+        
+        Returns capacity, current and high-water depth, put/get counts, wait
+        count/total/histogram for producers (put_wait) and consumers (get_wait),
+        and lock acquisitions, contended acquisitions and total hold time.
+        """
+        if self._stats is None:
+            raise RuntimeError("Metrics are disabled; create the queue with metrics=True")
+        with self.lock:
+            return self._stats.snapshot(len(self.queue))
+    
+    def _put(self, item: Any, weight: int, block: bool, timeout: Optional[float]) -> None:
+        deadline = None if block and timeout is None else _deadline(block, timeout)
+        with self.not_full:
+            if not self._has_room(weight):
+                self._wait_not_full(deadline, weight)
+                if self.closed:
+                    raise QueueClosed("put() on a closed queue")
+                if not self._has_room(weight):
+                    raise QueueFull("put() timed out on a full queue")
+            elif self.closed:
+                raise QueueClosed("put() on a closed queue")
+            self._enqueue(item, weight)
+            if self._stats is not None:
+                self._stats.record_put(1, len(self.queue))
+            self.not_empty.notify()
+    
+    # Capacity hooks: subclasses that measure capacity in something other than
+    # items (see WeightedBlockingQueue) override these, and only these
+    
+    def _weigh(self, item: Any, weight: Optional[int] = None) -> int:
+        """Share of capacity item takes up: one slot."""
+        return 1
+    
+    def _has_room(self, weight: int) -> bool:
+        """True if an item of this weight can be enqueued now. Called with the lock held."""
+        return len(self.queue) + weight <= self.capacity
+    
+    def _enqueue(self, item: Any, weight: int) -> None:
+        """Append item to self.queue and account for its weight. Called with the lock held."""
+        self.queue.append(item)
+    
+    def _on_dequeue(self, count: int) -> None:
+        """Account for count items just taken from self.queue and wake producers."""
+        self.not_full.notify(count)
+    
+    def _move_fitting(self, pending: deque) -> int:
+        """Move items from the front of pending into the queue while they fit; returns the count."""
+        moved = min(self.capacity - len(self.queue), len(pending))
+        for _ in range(moved):
+            self.queue.append(pending.popleft())
+        return moved
+    
+    def _wait_not_full(self, deadline: Optional[float], weight: int = 1) -> None:
+        """Slow path of put(): wait until there is room, the queue closes or deadline passes."""
+        tracer = self.tracer
+        start = time.perf_counter_ns() if tracer is not None else 0
+        while not self._has_room(weight) and not self.closed:
+            if not _wait_until(self.not_full, deadline):
+                break
+        if tracer is not None and deadline != 0.0:
+            tracer.record("blocked on not_full", "queue", start, time.perf_counter_ns())
+    
+    def _wait_not_empty(self, deadline: Optional[float]) -> None:
+        """Slow path of get(): wait until an item arrives, the queue closes or deadline passes."""
+        tracer = self.tracer
+        start = time.perf_counter_ns() if tracer is not None else 0
+        while not self.queue and not self.closed:
+            if not _wait_until(self.not_empty, deadline):
+                break
+        if tracer is not None and deadline != 0.0:
+            tracer.record("blocked on not_empty", "queue", start, time.perf_counter_ns())
+    
+    def __repr__(self) -> str:
+        """String representation of the queue."""
+        with self.lock:
+            state = ", closed" if self.closed else ""
+            return f"BoundedBlockingQueue(capacity={self.capacity}, size={len(self.queue)}{state})"
+
+
+class SPSCQueue:
+    """Single-producer/single-consumer ring buffer queue.
+    
+    Same blocking put/get contract as BoundedBlockingQueue (without timeouts),
+    but backed by a preallocated slot array indexed by head/tail counters.
+    Only the producer advances tail and only the consumer advances head, so
+    the fast path takes no lock; the Condition variables are used only when
+    the buffer is full or empty.
+    Not safe for more than one producer thread or more than one consumer thread.
+    """
+    
+    def __init__(self, capacity: int):
+        if capacity <= 0:
+            raise ValueError("Capacity must be greater than 0")
+        
+        self.capacity = capacity
+        self._slots = [None] * capacity
+        self._head = 0  # Total items read; advanced by the consumer only
+        self._tail = 0  # Total items written; advanced by the producer only
+        self._producer_waiting = False
+        self._consumer_waiting = False
         self.lock = threading.Lock()
         self.not_full = threading.Condition(self.lock)
         self.not_empty = threading.Condition(self.lock)
     
     def put(self, item: Any) -> None:
         """Add item to queue. Blocks if queue is full."""
-        with self.not_full:
-            while len(self.queue) >= self.capacity:
-                self.not_full.wait()
-            self.queue.append(item)
-            self.not_empty.notify()
+        if self._tail - self._head >= self.capacity:
+            with self.not_full:
+                # Flag is raised before each re-check so a concurrent get() either
+                # sees it and notifies, or frees a slot that the re-check observes.
+                while True:
+                    self._producer_waiting = True
+                    if self._tail - self._head < self.capacity:
+                        break
+                    self.not_full.wait()
+                self._producer_waiting = False
+        
+        tail = self._tail
+        self._slots[tail % self.capacity] = item
+        self._tail = tail + 1
+        if self._consumer_waiting:
+            with self.not_empty:
+                self._consumer_waiting = False
+                self.not_empty.notify()
     
     def get(self) -> Any:
         """Remove and return item from queue. Blocks if queue is empty."""
-        with self.not_empty:
-            while not self.queue:
-                self.not_empty.wait()
-            item = self.queue.popleft()
-            self.not_full.notify()
-            return item
+        if self._head == self._tail:
+            with self.not_empty:
+                while True:
+                    self._consumer_waiting = True
+                    if self._head != self._tail:
+                        break
+                    self.not_empty.wait()
+                self._consumer_waiting = False
+        
+        head = self._head
+        index = head % self.capacity
+        item = self._slots[index]
+        self._slots[index] = None  # Drop reference so the slot does not pin the item
+        self._head = head + 1
+        if self._producer_waiting:
+            with self.not_full:
+                self._producer_waiting = False
+                self.not_full.notify()
+        return item
+    
+    def __len__(self) -> int:
+        """Number of items currently buffered."""
+        return self._tail - self._head
+    
+    def qsize(self) -> int:
+        """Number of items currently buffered, like BoundedBlockingQueue.qsize()."""
+        return self._tail - self._head
     
     def __repr__(self) -> str:
         """String representation of the queue."""
-        with self.lock:
-            return f"BoundedBlockingQueue(capacity={self.capacity}, size={len(self.queue)})"
-
+        return f"SPSCQueue(capacity={self.capacity}, size={len(self)})"
@@ -0,0 +1,218 @@
+import threading
+from collections import deque
+from typing import Any, Dict, Iterable, List, Optional
+from assignment_1.blocking_queue import QueueClosed, QueueEmpty, QueueFull, _deadline, _wait_until
+
+
+class Lane:
+    """Producer-side handle for one bounded lane of a MultiLaneQueue.
+    
+    Offers put/put_many/try_put/close like BoundedBlockingQueue, so it can be
+    passed to Producer as its queue; close() ends only this lane.
+    """
+    
+    def __init__(self, owner: "MultiLaneQueue", name: str, capacity: int, weight: int):
+        self.name = name
+        self.capacity = capacity
+        self.weight = weight
+        self.items = deque()
+        self.closed = False
+        self.not_full = threading.Condition(owner.lock)
+        self._owner = owner
+    
+    def put(self, item: Any, block: bool = True, timeout: Optional[float] = None) -> None:
+        """Add item to this lane. Blocks only while this lane is full."""
+        self._owner._put(self, item, block, timeout)
+    
+    def put_many(self, items: Iterable[Any]) -> None:
+        """Add all items to this lane in order."""
+        for item in items:
+            self._owner._put(self, item, True, None)
+    
+    def try_put(self, item: Any, timeout: float = 0.0) -> bool:
+        """Add item if this lane has room within timeout seconds; False otherwise."""
+        try:
+            self._owner._put(self, item, True, timeout)
+        except QueueFull:
+            return False
+        return True
+    
+    def close(self) -> None:
+        """Stop accepting puts on this lane; buffered items stay available."""
+        self._owner._close_lane(self)
+    
+    def qsize(self) -> int:
+        """Number of items buffered in this lane."""
+        return len(self.items)
+    
+    def __repr__(self) -> str:
+        """String representation of the lane."""
+        state = ", closed" if self.closed else ""
+        return f"Lane(name={self.name!r}, capacity={self.capacity}, weight={self.weight}{state})"
+
+
+class MultiLaneQueue:
+    """Blocking queue with one bounded lane per producer and weighted round-robin get().
+    
+    Each producer writes to its own Lane (see lane()), so a fast producer can
+    only fill its own lane and never takes capacity from the others. get()
+    serves lanes in turn, taking up to weight consecutive items from a lane
+    before moving on and skipping empty lanes, so consumers keep the plain
+    get()/get_many() interface of BoundedBlockingQueue.
+    
+    Create all lanes before consumers start. get() raises QueueClosed once
+    every lane is closed and drained, which is what Producer(on_finish="close")
+    does for its lane; close() closes every lane at once.
+    """
+    
+    def __init__(self, lane_capacity: int):
+        if lane_capacity <= 0:
+            raise ValueError("lane_capacity must be greater than 0")
+        
+        self.lane_capacity = lane_capacity
+        self.lanes: List[Lane] = []
+        self.closed = False
+        self.lock = threading.Lock()
+        self.not_empty = threading.Condition(self.lock)
+        self._size = 0
+        self._open_lanes = 0
+        self._cursor = -1  # Lane being served; the first round starts at lane 0
+        self._credit = 0  # Items the lane at _cursor may still hand out this turn
+    
+    @property
+    def capacity(self) -> int:
+        """Total capacity across all lanes."""
+        return sum(lane.capacity for lane in self.lanes)
+    
+    def lane(self, name: Optional[str] = None, weight: int = 1,
+             capacity: Optional[int] = None) -> Lane:
+        """Add a lane and return its producer handle.
+        
+        weight is the number of consecutive items the lane may hand out per
+        round; capacity defaults to lane_capacity.
+        """
+        if weight <= 0:
+            raise ValueError("weight must be greater than 0")
+        capacity = self.lane_capacity if capacity is None else capacity
+        if capacity <= 0:
+            raise ValueError("Capacity must be greater than 0")
+        with self.lock:
+            if self.closed:
+                raise QueueClosed("lane() on a closed queue")
+            name = name or f"lane-{len(self.lanes) + 1}"
+            if any(lane.name == name for lane in self.lanes):
+                raise ValueError(f"Duplicate lane name: {name}")
+            lane = Lane(self, name, capacity, weight)
+            self.lanes.append(lane)
+            self._open_lanes += 1
+            return lane
+    
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> Any:
+        """Remove and return the next item in weighted round-robin order.
+        
+        Blocks while every lane is empty. With block=False, or once timeout
+        expires, raises QueueEmpty. Raises QueueClosed once all lanes are
+        closed and drained.
+        """
+        deadline = None if block and timeout is None else _deadline(block, timeout)
+        with self.not_empty:
+            while not self._size:
+                if self._finished():
+                    raise QueueClosed("get() on a closed, empty queue")
+                if not _wait_until(self.not_empty, deadline):
+                    raise QueueEmpty("get() timed out on an empty queue")
+            return self._take()
+    
+    def get_many(self, max_items: int, timeout: Optional[float] = None) -> List[Any]:
+        """Remove and return up to max_items items in weighted round-robin order.
+        
+        Returns an empty list if timeout expires first. Raises QueueClosed once
+        all lanes are closed and drained.
+        """
+        if max_items <= 0:
+            raise ValueError("max_items must be greater than 0")
+        
+        deadline = _deadline(True, timeout)
+        with self.not_empty:
+            while not self._size:
+                if self._finished():
+                    raise QueueClosed("get_many() on a closed, empty queue")
+                if not _wait_until(self.not_empty, deadline):
+                    return []
+            return [self._take() for _ in range(min(max_items, self._size))]
+    
+    def try_get(self, timeout: float = 0.0, default: Any = None) -> Any:
+        """Remove and return an item within timeout seconds, else default."""
+        try:
+            return self.get(timeout=timeout)
+        except QueueEmpty:
+            return default
+    
+    def close(self) -> None:
+        """Close every lane and refuse new ones; buffered items stay available."""
+        with self.lock:
+            self.closed = True
+            for lane in self.lanes:
+                self._close_locked(lane)
+            self.not_empty.notify_all()
+    
+    def qsize(self) -> int:
+        """Number of items buffered across all lanes."""
+        return self._size
+    
+    def depths(self) -> Dict[str, int]:
+        """Current depth of each lane, by lane name."""
+        with self.lock:
+            return {lane.name: len(lane.items) for lane in self.lanes}
+    
+    def _put(self, lane: Lane, item: Any, block: bool, timeout: Optional[float]) -> None:
+        deadline = None if block and timeout is None else _deadline(block, timeout)
+        with self.lock:
+            while len(lane.items) >= lane.capacity and not lane.closed:
+                if not _wait_until(lane.not_full, deadline):
+                    raise QueueFull("put() timed out on a full lane")
+            if lane.closed:
+                raise QueueClosed("put() on a closed lane")
+            lane.items.append(item)
+            self._size += 1
+            self.not_empty.notify()
+    
+    def _take(self) -> Any:
+        """Pop the next item in weighted round-robin order. Requires _size > 0."""
+        lane = self.lanes[self._cursor]
+        if not (self._credit and lane.items):
+            count = len(self.lanes)
+            for step in range(1, count + 1):
+                index = (self._cursor + step) % count
+                if self.lanes[index].items:
+                    break
+            self._cursor = index
+            lane = self.lanes[index]
+            self._credit = lane.weight
+        self._credit -= 1
+        self._size -= 1
+        item = lane.items.popleft()
+        lane.not_full.notify()
+        return item
+    
+    def _close_lane(self, lane: Lane) -> None:
+        with self.lock:
+            self._close_locked(lane)
+            if self._finished():
+                self.not_empty.notify_all()
+    
+    def _close_locked(self, lane: Lane) -> None:
+        if not lane.closed:
+            lane.closed = True
+            self._open_lanes -= 1
+            lane.not_full.notify_all()
+    
+    def _finished(self) -> bool:
+        # No lanes at all means producers have not registered yet, not that they are done
+        return self.closed or (bool(self.lanes) and self._open_lanes == 0)
+    
+    def __repr__(self) -> str:
+        """String representation of the queue."""
+        with self.lock:
+            state = ", closed" if self._finished() else ""
+            return f"MultiLaneQueue(lanes={len(self.lanes)}, size={self._size}{state})"
@@ -0,0 +1,207 @@
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from assignment_1.async_logger import AsyncLogger
+from assignment_1.blocking_queue import BoundedBlockingQueue
+from assignment_1.producer_consumer import Producer, Consumer
+from assignment_1.sinks import Sink, ListSink, QueueSink, merge_sinks
+
+
+class PipelineAborted(Exception):
+    """Raised inside stage workers once another stage has failed."""
+
+
+class _Stage:
+    """Declared stage: a function plus its parallelism and input queue capacity."""
+    
+    def __init__(self, func: Callable[[Any], Any], parallelism: int, capacity: int, name: str):
+        self.func = func
+        self.parallelism = parallelism
+        self.capacity = capacity
+        self.name = name
+
+
+class _GuardedSink(Sink):
+    """Wraps a stage's sink so that a failed write aborts the whole pipeline."""
+    
+    def __init__(self, sink: Sink, on_error: Callable[[BaseException], None]):
+        self.sink = sink
+        self.on_error = on_error
+    
+    def write(self, item: Any) -> None:
+        try:
+            self.sink.write(item)
+        except Exception as e:
+            self.on_error(e)
+            raise
+    
+    def write_many(self, items: List[Any]) -> None:
+        try:
+            self.sink.write_many(items)
+        except Exception as e:
+            self.on_error(e)
+            raise
+    
+    def flush(self) -> None:
+        self.sink.flush()
+
+
+class Pipeline:
+    """Multi-stage pipeline of Consumer threads chained by bounded queues.
+    
+    Each stage reads from its own BoundedBlockingQueue, applies its function
+    on parallelism worker threads and writes into the next stage's queue.
+    Shutdown propagates by closing each queue once the stage feeding it has
+    finished; an exception in any stage function or sink closes every queue
+    and is re-raised by run().
+    
+    Results are unordered when the last stage has parallelism > 1, since its
+    workers write to the sink as they finish.
+
+        pipeline = (Pipeline()
+                    .stage(parse, parallelism=2)
+                    .stage(enrich, parallelism=4, capacity=64)
+                    .stage(format_row))
+        rows = pipeline.run(lines)
+        pipeline.bottleneck()
+    """
+    
+    def __init__(self, logger: Optional[AsyncLogger] = None):
+        self.logger = logger
+        self._stages: List[_Stage] = []
+        self._stats: List[Dict[str, Any]] = []
+        self._error = None
+    
+    def stage(self, func: Callable[[Any], Any], parallelism: int = 1,
+              capacity: int = 16, name: Optional[str] = None) -> "Pipeline":
+        """Append a stage and return the pipeline for chaining."""
+        if parallelism <= 0:
+            raise ValueError("parallelism must be greater than 0")
+        if capacity <= 0:
+            raise ValueError("Capacity must be greater than 0")
+        name = name or getattr(func, '__name__', None) or f"stage-{len(self._stages) + 1}"
+        self._stages.append(_Stage(func, parallelism, capacity, name))
+        return self
+    
+    def run(self, source: Iterable[Any], sink: Optional[Sink] = None) -> List[Any]:
+        """Push source through every stage and return the final stage's output.
+        
+        If sink is given, the last stage writes there instead (shared by its
+        workers, so it must be thread-safe when parallelism > 1) and an empty
+        list is returned.
+        """
+        if not self._stages:
+            raise ValueError("Pipeline has no stages")
+        
+        self._error = None
+        queues = [BoundedBlockingQueue(stage.capacity, metrics=True) for stage in self._stages]
+        result_sinks: List[ListSink] = []
+        stage_workers = []
+        for index, stage in enumerate(self._stages):
+            workers = []
+            for worker_index in range(stage.parallelism):
+                busy = [0.0]
+                if index + 1 < len(queues):
+                    worker_sink = QueueSink(queues[index + 1])
+                elif sink is not None:
+                    worker_sink = sink
+                else:
+                    worker_sink = ListSink()
+                    result_sinks.append(worker_sink)
+                worker_sink = _GuardedSink(worker_sink, lambda e: self._abort(e, queues))
+                worker = Consumer(queues[index], sink=worker_sink,
+                                  process=self._timed(stage.func, busy, queues),
+                                  name=f"{stage.name}-{worker_index + 1}", logger=self.logger)
+                workers.append((worker, busy))
+            stage_workers.append(workers)
+        
+        producer = Producer(source, queues[0], name="Pipeline-Source",
+                            on_finish="close", logger=self.logger)
+        start_time = time.perf_counter()
+        producer.start()
+        for workers in stage_workers:
+            for worker, _ in workers:
+                worker.start()
+        
+        producer.join()
+        if producer.error is not None:
+            self._abort(producer.error, queues)
+        finished_at = []
+        for index, workers in enumerate(stage_workers):
+            for worker, _ in workers:
+                worker.join()
+            finished_at.append(time.perf_counter() - start_time)
+            if index + 1 < len(queues):
+                queues[index + 1].close()  # Downstream drains what is left, then exits
+        
+        self._stats = [self._stage_stats(stage, workers, queue, wall_seconds)
+                       for stage, workers, queue, wall_seconds
+                       in zip(self._stages, stage_workers, queues, finished_at)]
+        if self._error is None:
+            errors = [worker.error for workers in stage_workers for worker, _ in workers
+                      if worker.error is not None]
+            self._error = errors[0] if errors else None
+        if self._error is not None:
+            raise self._error
+        return merge_sinks(result_sinks)
+    
+    def stats(self) -> List[Dict[str, Any]]:
+        """Per-stage report from the last run, in stage order.
+        
+        items_per_second is items over the stage's wall time; utilization is
+        the fraction of worker time spent inside the stage function. The input
+        queue's wait totals show whether a stage was starved (get waits) or
+        pushing back on its upstream (put waits).
+        """
+        return self._stats
+    
+    def bottleneck(self) -> Optional[str]:
+        """Name of the most utilized stage in the last run, the one to widen first."""
+        if not self._stats:
+            return None
+        return max(self._stats, key=lambda stats: stats['utilization'])['name']
+    
+    def _timed(self, func: Callable[[Any], Any], busy: List[float],
+               queues: List[BoundedBlockingQueue]) -> Callable[[Any], Any]:
+        """Wrap func to accumulate its run time and abort the pipeline on error."""
+        def process(item: Any) -> Any:
+            if self._error is not None:
+                raise PipelineAborted("Pipeline aborted by an earlier error")
+            start_time = time.perf_counter()
+            try:
+                return func(item)
+            except Exception as e:
+                self._abort(e, queues)
+                raise
+            finally:
+                busy[0] += time.perf_counter() - start_time
+        return process
+    
+    def _abort(self, error: BaseException, queues: List[BoundedBlockingQueue]) -> None:
+        """Record the first error and close every queue so all workers exit."""
+        if self._error is None:
+            self._error = error
+        for queue in queues:
+            queue.close()
+    
+    @staticmethod
+    def _stage_stats(stage: _Stage, workers: List, queue: BoundedBlockingQueue,
+                     wall_seconds: float) -> Dict[str, Any]:
+        items = sum(worker.items_consumed for worker, _ in workers)
+        busy_seconds = sum(busy[0] for _, busy in workers)
+        queue_stats = queue.stats()
+        return {
+            'name': stage.name,
+            'parallelism': stage.parallelism,
+            'capacity': stage.capacity,
+            'items': items,
+            'wall_seconds': wall_seconds,
+            'busy_seconds': busy_seconds,
+            'items_per_second': items / wall_seconds if wall_seconds > 0 else 0.0,
+            'utilization': busy_seconds / (wall_seconds * stage.parallelism) if wall_seconds > 0 else 0.0,
+            'input_queue': {
+                'high_water_depth': queue_stats['high_water_depth'],
+                'put_wait_seconds': queue_stats['put_wait']['total_seconds'],
+                'get_wait_seconds': queue_stats['get_wait']['total_seconds'],
+            },
+        }
@@ -0,0 +1,174 @@
+import heapq
+import math
+import threading
+from itertools import count
+from typing import Any, Callable, Dict, Iterable, List, Optional
+from assignment_1.blocking_queue import QueueClosed, QueueEmpty, QueueFull, _deadline, _wait_until
+from assignment_1.producer_consumer import _SENTINEL
+
+
+class BoundedPriorityQueue:
+    """Bounded blocking queue that hands out the most urgent item first.
+    
+    Same capacity, blocking, timeout and close() contract as
+    BoundedBlockingQueue. Lower priority numbers are more urgent; items of
+    equal priority come out in FIFO order. Priority is passed to put(), or
+    derived with key(item) so that Producer can feed the queue unchanged.
+    _SENTINEL always sorts after queued work, so consumers drain it first.
+    
+    reserved maps a priority to a number of slots that only items of that
+    priority or a more urgent one may use. With reserved={0: 4}, bulk items
+    can fill at most capacity - 4 slots, so interactive (priority 0) puts
+    never block behind a queue full of bulk work. Producers wait on a
+    condition per priority, so a freed slot only wakes classes that may use it.
+    """
+    
+    def __init__(self, capacity: int, reserved: Optional[Dict[int, int]] = None,
+                 key: Optional[Callable[[Any], int]] = None):
+        if capacity <= 0:
+            raise ValueError("Capacity must be greater than 0")
+        reserved = dict(reserved or {})
+        if any(slots < 0 for slots in reserved.values()):
+            raise ValueError("reserved slots must not be negative")
+        if sum(reserved.values()) >= capacity:
+            raise ValueError("reserved slots must leave room below capacity")
+        
+        self.capacity = capacity
+        self.reserved = reserved
+        self.key = key
+        self.queue: List[tuple] = []  # Heap of (priority, sequence, item)
+        self.closed = False
+        self.lock = threading.Lock()
+        self.not_empty = threading.Condition(self.lock)
+        self._not_full: Dict[float, threading.Condition] = {}
+        self._put_waiters: Dict[float, int] = {}
+        self._limits: Dict[float, int] = {}
+        self._sequence = count()
+    
+    def put(self, item: Any, block: bool = True, timeout: Optional[float] = None,
+            priority: Optional[int] = None) -> None:
+        """Add item with the given (or key-derived, default 0) priority.
+        
+        Blocks while the slots open to this priority are all taken. Raises
+        QueueFull on block=False or timeout, QueueClosed if closed.
+        """
+        if item is _SENTINEL:
+            priority = math.inf  # Shut down only after all queued work
+        elif priority is None:
+            priority = self.key(item) if self.key is not None else 0
+        deadline = None if block and timeout is None else _deadline(block, timeout)
+        with self.lock:
+            limit = self._limit(priority)
+            if len(self.queue) >= limit and not self.closed:
+                not_full = self._not_full.get(priority)
+                if not_full is None:
+                    not_full = self._not_full[priority] = threading.Condition(self.lock)
+                self._put_waiters[priority] = self._put_waiters.get(priority, 0) + 1
+                try:
+                    while len(self.queue) >= limit and not self.closed:
+                        if not _wait_until(not_full, deadline):
+                            self._notify_producer()  # Pass on a wakeup we may have consumed
+                            raise QueueFull("put() timed out on a full queue")
+                finally:
+                    self._put_waiters[priority] -= 1
+            if self.closed:
+                raise QueueClosed("put() on a closed queue")
+            heapq.heappush(self.queue, (priority, next(self._sequence), item))
+            self.not_empty.notify()
+    
+    def put_many(self, items: Iterable[Any], priority: Optional[int] = None) -> None:
+        """Add items one at a time, each with its own priority."""
+        for item in items:
+            self.put(item, priority=priority)
+    
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> Any:
+        """Remove and return the most urgent item. Blocks if queue is empty.
+        
+        Raises QueueEmpty on block=False or timeout, and QueueClosed once the
+        queue is closed and fully drained.
+        """
+        deadline = None if block and timeout is None else _deadline(block, timeout)
+        with self.not_empty:
+            while not self.queue:
+                if self.closed:
+                    raise QueueClosed("get() on a closed, empty queue")
+                if not _wait_until(self.not_empty, deadline):
+                    raise QueueEmpty("get() timed out on an empty queue")
+            item = heapq.heappop(self.queue)[2]
+            self._notify_producer()
+            return item
+    
+    def get_many(self, max_items: int, timeout: Optional[float] = None) -> List[Any]:
+        """Remove and return up to max_items items, most urgent first.
+        
+        Blocks until at least one item is available. Returns an empty list if
+        timeout expires first. Raises QueueClosed once closed and drained.
+        """
+        if max_items <= 0:
+            raise ValueError("max_items must be greater than 0")
+        
+        deadline = _deadline(True, timeout)
+        with self.not_empty:
+            while not self.queue:
+                if self.closed:
+                    raise QueueClosed("get_many() on a closed, empty queue")
+                if not _wait_until(self.not_empty, deadline):
+                    return []
+            items = [heapq.heappop(self.queue)[2]
+                     for _ in range(min(max_items, len(self.queue)))]
+            for _ in items:
+                self._notify_producer()
+            return items
+    
+    def try_put(self, item: Any, timeout: float = 0.0, priority: Optional[int] = None) -> bool:
+        """Add item if a slot is free within timeout seconds; False instead of QueueFull."""
+        try:
+            self.put(item, timeout=timeout, priority=priority)
+        except QueueFull:
+            return False
+        return True
+    
+    def try_get(self, timeout: float = 0.0, default: Any = None) -> Any:
+        """Remove and return an item within timeout seconds, else default."""
+        try:
+            return self.get(timeout=timeout)
+        except QueueEmpty:
+            return default
+    
+    def qsize(self) -> int:
+        """Number of items currently buffered."""
+        return len(self.queue)
+    
+    def close(self) -> None:
+        """Stop accepting puts and wake all blocked producers and consumers."""
+        with self.lock:
+            self.closed = True
+            for not_full in self._not_full.values():
+                not_full.notify_all()
+            self.not_empty.notify_all()
+    
+    def _limit(self, priority: float) -> int:
+        """Slots usable by priority: capacity minus slots reserved for more urgent classes."""
+        limit = self._limits.get(priority)
+        if limit is None:
+            held_back = sum(slots for reserved_for, slots in self.reserved.items()
+                            if reserved_for < priority)
+            limit = self._limits[priority] = self.capacity - held_back
+        return limit
+    
+    def _notify_producer(self) -> None:
+        """Wake one waiting producer in every class that can use a free slot.
+        
+        Waking one per class rather than one overall means a wakeup can never
+        be spent on a class that is still over its limit while another class
+        could have proceeded.
+        """
+        for priority, waiters in self._put_waiters.items():
+            if waiters and len(self.queue) < self._limit(priority):
+                self._not_full[priority].notify()
+    
+    def __repr__(self) -> str:
+        """String representation of the queue."""
+        with self.lock:
+            state = ", closed" if self.closed else ""
+            return f"BoundedPriorityQueue(capacity={self.capacity}, size={len(self.queue)}{state})"
@@ -1,81 +1,521 @@
-import threading
+import asyncio
+import multiprocessing
 import sys
-from typing import List, Any, Optional
-from assignment_1.blocking_queue import BoundedBlockingQueue
+import threading
+import time
+from itertools import islice
+from typing import AsyncIterable, Callable, Dict, Iterable, List, Any, Optional, Union
+from assignment_1.async_logger import AsyncLogger, default_logger
+from assignment_1.blocking_queue import BoundedBlockingQueue, QueueClosed, QueueEmpty, QueueFull
+from assignment_1.sinks import Sink, ListSink, LockedListSink
+from assignment_1.tracing import Tracer
 
-_print_lock = threading.Lock()
 _SENTINEL = object()  # Private sentinel token placed in queue to signal shutdown
 
 
-def thread_safe_print(*args, **kwargs):
-    """Thread-safe print to prevent output interleaving."""
-    with _print_lock:
-        print(*args, **kwargs)
-        sys.stdout.flush()
-
-
 class Producer(threading.Thread):
     """Producer thread that places items from source into queue.
     
-    Signals completion by enqueueing _SENTINEL after all data items.
+    source_data may be any iterable (list, generator, open file, chunked
+    reader from assignment_1.sources) or async iterable. Items are pulled
+    lazily, one at a time (or one batch at a time), so memory is bounded by
+    queue capacity rather than input size. An async iterable is driven on a
+    private event loop in this thread and must not be bound to another loop.
+    
+    Signals completion according to on_finish: "sentinel" (default) enqueues
+    _SENTINEL after all data items, "close" closes the queue, and "none" does
+    nothing so that, with several producers, the caller can close the queue
+    once all of them have been joined. Completion is signalled on error too,
+    and the exception is kept in self.error.
+    With batch_size > 1, items are enqueued in batches via queue.put_many.
+    
+    With put_timeout set, a put still blocked after put_timeout seconds is
+    retried up to max_retries times; then, per on_timeout, the item is shed
+    ("shed": dropped and counted in items_dropped) or QueueFull is raised
+    ("raise"). Every expired wait is counted in self.timeouts.
+    
+    With a tracer (by default the queue's own, if any), the whole run is
+    recorded as one "produce" span.
     """
     
-    def __init__(self, source_data: List[Any], queue: BoundedBlockingQueue, 
-                 name: Optional[str] = None):
+    def __init__(self, source_data: Union[Iterable[Any], AsyncIterable[Any]],
+                 queue: BoundedBlockingQueue, 
+                 name: Optional[str] = None, batch_size: int = 1,
+                 on_finish: str = "sentinel", logger: Optional[AsyncLogger] = None,
+                 put_timeout: Optional[float] = None, on_timeout: str = "shed",
+                 max_retries: int = 0, tracer: Optional[Tracer] = None):
         super().__init__(name=name or "Producer")
+        if batch_size <= 0:
+            raise ValueError("batch_size must be greater than 0")
+        if on_finish not in ("sentinel", "close", "none"):
+            raise ValueError("on_finish must be 'sentinel', 'close' or 'none'")
+        if on_timeout not in ("shed", "raise"):
+            raise ValueError("on_timeout must be 'shed' or 'raise'")
+        if max_retries < 0:
+            raise ValueError("max_retries must not be negative")
+        if put_timeout is not None and batch_size > 1:
+            raise ValueError("put_timeout requires batch_size=1")
         self.source_data = source_data
         self.queue = queue
+        self.batch_size = batch_size
+        self.on_finish = on_finish
+        self.logger = logger or default_logger
+        self.put_timeout = put_timeout
+        self.on_timeout = on_timeout
+        self.max_retries = max_retries
+        self.tracer = tracer if tracer is not None else getattr(queue, 'tracer', None)
         self.items_produced = 0
+        self.items_dropped = 0
+        self.timeouts = 0
+        self.error: Optional[BaseException] = None
     
     def run(self) -> None:
         """Execute producer thread logic."""
+        if self.tracer is None:
+            self._run()
+            return
+        start = time.perf_counter_ns()
         try:
-            for item in self.source_data:
-                self.queue.put(item)
-                self.items_produced += 1
-                thread_safe_print(f"[{self.name}] Produced: {item}")
+            self._run()
+        finally:
+            self.tracer.record("produce", "producer", start, time.perf_counter_ns(),
+                               {"items": self.items_produced})
+    
+    def _run(self) -> None:
+        try:
+            if hasattr(self.source_data, '__aiter__'):
+                asyncio.run(self._produce_async())
+            elif self.batch_size > 1:
+                self._produce_batches()
+            else:
+                for item in self.source_data:
+                    self._put_item(item)
             
-            self.queue.put(_SENTINEL)  # Signal completion
-            thread_safe_print(f"[{self.name}] Finished producing {self.items_produced} items")
+            self._signal_done()
+            self.logger.info("[%s] Finished producing %d items", self.name, self.items_produced)
             
         except Exception as e:
-            thread_safe_print(f"[{self.name}] Error in producer: {e}")
+            self.error = e
+            self.logger.error("[%s] Error in producer: %s", self.name, e)
             try:
-                self.queue.put(_SENTINEL)
+                self._signal_done()
             except Exception:
                 pass
+    
+    def _signal_done(self) -> None:
+        """Signal completion to consumers as configured by on_finish."""
+        if self.on_finish == "sentinel":
+            self.queue.put(_SENTINEL)
+        elif self.on_finish == "close":
+            self.queue.close()
+    
+    def _put_item(self, item: Any) -> None:
+        """Enqueue a single item and account for it."""
+        if self.put_timeout is None:
+            self.queue.put(item)
+        elif not self._put_within_timeout(item):
+            return
+        self.items_produced += 1
+        self.logger.debug("[%s] Produced: %s", self.name, item)
+        self.logger.count("produced")
+    
+    def _put_within_timeout(self, item: Any) -> bool:
+        """Put item under the timeout policy. Returns False if the item was shed."""
+        for _ in range(self.max_retries + 1):
+            try:
+                self.queue.put(item, timeout=self.put_timeout)
+                return True
+            except QueueFull:
+                self.timeouts += 1
+        
+        if self.on_timeout == "raise":
+            raise QueueFull(f"Queue still full after {self.max_retries + 1} waits of {self.put_timeout}s")
+        self.items_dropped += 1
+        self.logger.debug("[%s] Shed: %s", self.name, item)
+        self.logger.count("dropped")
+        return False
+    
+    def _put_batch(self, batch: List[Any]) -> None:
+        """Enqueue a batch with one put_many call and account for it."""
+        self.queue.put_many(batch)
+        self.items_produced += len(batch)
+        self.logger.debug("[%s] Produced batch of %d: %s", self.name, len(batch), batch)
+        self.logger.count("produced", len(batch))
+    
+    def _produce_batches(self) -> None:
+        """Enqueue source items in batches of at most batch_size."""
+        source = iter(self.source_data)
+        while True:
+            batch = list(islice(source, self.batch_size))
+            if not batch:
+                break
+            self._put_batch(batch)
+    
+    async def _produce_async(self) -> None:
+        """Drain an async iterable, enqueueing items (or batches) as they arrive."""
+        batch = []
+        async for item in self.source_data:
+            if self.batch_size == 1:
+                self._put_item(item)
+                continue
+            batch.append(item)
+            if len(batch) >= self.batch_size:
+                self._put_batch(batch)
+                batch = []
+        if batch:
+            self._put_batch(batch)
 
 
 class Consumer(threading.Thread):
-    """Consumer thread that reads items from queue and stores in destination.
+    """Consumer thread that reads items from queue and writes them to a sink.
+    
+    Items go to a shared destination list under destination_lock if one is
+    given, otherwise to sink; by default each consumer gets its own lock-free
+    ListSink, combined after join with merge_sinks.
+    Exits when _SENTINEL is dequeued, or when the queue is closed and drained,
+    indicating producer completion.
+    With batch_size > 1, up to batch_size items are taken per queue.get_many
+    call and written to the sink in one write_many call.
+    With linger_ms set, items are collected into batches of up to batch_size
+    and each batch is written once it is full or its oldest item has waited
+    linger_ms, whichever comes first (pair with BatchCallbackSink for bulk
+    inserts).
+    If process is given, each item is replaced by process(item) before being
+    written. An exception that stops the consumer is kept in self.error.
     
-    Exits when _SENTINEL is dequeued, indicating producer completion.
+    With get_timeout set, a wait for items longer than get_timeout seconds is
+    retried up to max_retries consecutive times (None: forever); then, per
+    on_timeout, the consumer stops as if the stream had ended ("stop") or
+    raises QueueEmpty ("raise"). Every expired wait is counted in self.timeouts.
+    
+    With a tracer (by default the queue's own, if any), the whole run is
+    recorded as one "consume" span, and waits on a contended destination_lock
+    as "waiting on destination lock" spans.
     """
     
-    def __init__(self, queue: BoundedBlockingQueue, destination: List[Any],
-                 destination_lock: threading.Lock, name: Optional[str] = None):
+    def __init__(self, queue: BoundedBlockingQueue, destination: Optional[List[Any]] = None,
+                 destination_lock: Optional[threading.Lock] = None, name: Optional[str] = None,
+                 batch_size: int = 1, logger: Optional[AsyncLogger] = None,
+                 sink: Optional[Sink] = None, process: Optional[Callable[[Any], Any]] = None,
+                 linger_ms: Optional[float] = None, get_timeout: Optional[float] = None,
+                 on_timeout: str = "stop", max_retries: Optional[int] = 0,
+                 tracer: Optional[Tracer] = None):
         super().__init__(name=name or "Consumer")
+        if batch_size <= 0:
+            raise ValueError("batch_size must be greater than 0")
+        if linger_ms is not None and linger_ms < 0:
+            raise ValueError("linger_ms must not be negative")
+        if on_timeout not in ("stop", "raise"):
+            raise ValueError("on_timeout must be 'stop' or 'raise'")
+        if max_retries is not None and max_retries < 0:
+            raise ValueError("max_retries must not be negative")
+        self.tracer = tracer if tracer is not None else getattr(queue, 'tracer', None)
+        if destination is not None:
+            if destination_lock is None or sink is not None:
+                raise ValueError("destination requires destination_lock and excludes sink")
+            sink = LockedListSink(destination, destination_lock, self.tracer)
         self.queue = queue
         self.destination = destination
         self.destination_lock = destination_lock
+        self.sink = sink if sink is not None else ListSink()
+        self.batch_size = batch_size
+        self.linger_ms = linger_ms
+        self.process = process
+        self.logger = logger or default_logger
+        self.get_timeout = get_timeout
+        self.on_timeout = on_timeout
+        self.max_retries = max_retries
         self.items_consumed = 0
+        self.timeouts = 0
+        self.error: Optional[BaseException] = None
     
     def run(self) -> None:
         """Execute consumer thread logic."""
+        if self.tracer is None:
+            self._run()
+            return
+        start = time.perf_counter_ns()
         try:
+            self._run()
+        finally:
+            self.tracer.record("consume", "consumer", start, time.perf_counter_ns(),
+                               {"items": self.items_consumed})
+    
+    def _run(self) -> None:
+        try:
+            if self.linger_ms is not None:
+                self._consume_lingering()
+                self.logger.info("[%s] Finished consuming %d items", self.name, self.items_consumed)
+                return
+            if self.batch_size > 1:
+                self._consume_batches()
+                self.logger.info("[%s] Finished consuming %d items", self.name, self.items_consumed)
+                return
+            
+            get_timeout = self.get_timeout
+            idle = 0
             while True:
-                item = self.queue.get()
+                try:
+                    item = self.queue.get() if get_timeout is None else self.queue.get(timeout=get_timeout)
+                except QueueClosed:
+                    break
+                except QueueEmpty:
+                    idle += 1
+                    if self._keep_waiting(idle):
+                        continue
+                    break
+                idle = 0
                 if item is _SENTINEL:  # Shutdown signal received
                     break
                 
-                with self.destination_lock:
-                    self.destination.append(item)
+                if self.process is not None:
+                    item = self.process(item)
+                self.sink.write(item)
                 
                 self.items_consumed += 1
-                thread_safe_print(f"[{self.name}] Consumed: {item}")
+                self.logger.debug("[%s] Consumed: %s", self.name, item)
+                self.logger.count("consumed")
+            
+            self.logger.info("[%s] Finished consuming %d items", self.name, self.items_consumed)
+            
+        except Exception as e:
+            self.error = e
+            self.logger.error("[%s] Error in consumer: %s", self.name, e)
+        finally:
+            try:
+                self.sink.flush()
+            except Exception as e:
+                self.logger.error("[%s] Error flushing sink: %s", self.name, e)
+    
+    def _consume_batches(self) -> None:
+        """Dequeue items in batches until a sentinel is seen or the queue is closed.
+        
+        Items after a sentinel in the same batch belong to other producers and
+        are still consumed; surplus sentinels are put back for other consumers.
+        """
+        idle = 0
+        while True:
+            try:
+                batch = self.queue.get_many(self.batch_size, timeout=self.get_timeout)
+            except QueueClosed:
+                break
+            if not batch:  # get_timeout expired
+                idle += 1
+                if self._keep_waiting(idle):
+                    continue
+                break
+            idle = 0
+            items = [item for item in batch if item is not _SENTINEL]
+            sentinels = len(batch) - len(items)
+            
+            if items:
+                self._write_batch(items)
+            
+            if sentinels:  # Shutdown signal received
+                if sentinels > 1:
+                    self.queue.put_many([_SENTINEL] * (sentinels - 1))
+                break
+    
+    def _consume_lingering(self) -> None:
+        """Collect batches of up to batch_size items, flushing early after linger_ms.
+        
+        The linger deadline starts when the first item of a batch arrives, so
+        an idle queue costs no wakeups. A partial batch is flushed on shutdown.
+        """
+        linger = self.linger_ms / 1000.0
+        batch: List[Any] = []
+        deadline = 0.0
+        idle = 0
+        stopping = False
+        while not stopping:
+            timeout = max(0.0, deadline - time.monotonic()) if batch else self.get_timeout
+            try:
+                taken = self.queue.get_many(self.batch_size - len(batch), timeout=timeout)
+            except QueueClosed:
+                taken = []
+                stopping = True
+            if not taken and not batch and not stopping:  # get_timeout expired
+                idle += 1
+                if self._keep_waiting(idle):
+                    continue
+                break
+            if taken:
+                idle = 0
+                if not batch:
+                    deadline = time.monotonic() + linger
+            
+            sentinels = 0
+            for item in taken:
+                if item is _SENTINEL:
+                    sentinels += 1
+                else:
+                    batch.append(item)
+            if sentinels:  # Shutdown signal received
+                stopping = True
+                if sentinels > 1:
+                    self.queue.put_many([_SENTINEL] * (sentinels - 1))
+            
+            if batch and (stopping or len(batch) >= self.batch_size
+                          or time.monotonic() >= deadline):
+                self._write_batch(batch)
+                batch = []
+    
+    def _keep_waiting(self, idle: int) -> bool:
+        """Apply the timeout policy after idle consecutive expired waits.
+        
+        Returns True to wait again, False to stop consuming.
+        """
+        self.timeouts += 1
+        if self.max_retries is None or idle <= self.max_retries:
+            self.logger.debug("[%s] No item within %ss, waiting again", self.name, self.get_timeout)
+            return True
+        if self.on_timeout == "raise":
+            raise QueueEmpty(f"No item within {idle} waits of {self.get_timeout}s")
+        self.logger.warning("[%s] No item within %ss, stopping", self.name, self.get_timeout)
+        return False
+    
+    def _write_batch(self, items: List[Any]) -> None:
+        """Process items and hand them to the sink in one write_many call."""
+        if self.process is not None:
+            items = [self.process(item) for item in items]
+        self.sink.write_many(items)
+        self.items_consumed += len(items)
+        self.logger.debug("[%s] Consumed batch of %d: %s", self.name, len(items), items)
+        self.logger.count("consumed", len(items))
+
+
+class _ContextProcess(multiprocessing.Process):
+    """Process whose start method comes from the context passed to its constructor.
+    
+    Every subclass gets one variant per available start method, deriving from
+    that context's own Process class (ForkProcess, SpawnProcess, ...) and
+    defined in the subclass's module, so spawned children can unpickle it by
+    name. cls(..., context=ctx) returns an instance of the matching variant;
+    without a context, the default start method is used.
+    """
+    
+    _variants: Dict[type, type] = {}
+    
+    def __init_subclass__(cls, variant_of: Optional[type] = None, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if variant_of is not None:
+            return
+        cls._variants = {}
+        module = sys.modules[cls.__module__]
+        for method in multiprocessing.get_all_start_methods():
+            process_class = multiprocessing.get_context(method).Process
+            name = f"_{cls.__name__}_{method}"
+            namespace = {'__module__': cls.__module__, '__qualname__': name}
+            variant = type(name, (process_class, cls), namespace, variant_of=cls)
+            setattr(module, name, variant)
+            cls._variants[process_class] = variant
+    
+    def __new__(cls, *args, context: Optional[Any] = None, **kwargs):
+        process_class = context.Process if context is not None else None
+        return super().__new__(cls._variants.get(process_class, cls))
+
+
+class ProcessProducer(_ContextProcess):
+    """Process counterpart of Producer for cross-process queues.
+    
+    Places items from source into a queue that can be shared between processes
+    (e.g. SharedMemoryQueue) and signals completion according to on_finish:
+    "sentinel" (default) enqueues _SENTINEL, "close" closes the queue and
+    "none" does nothing. The process is started with context's start method
+    (default: the global one); under spawn, source_data must be picklable.
+    """
+    
+    def __init__(self, source_data: List[Any], queue: Any, name: Optional[str] = None,
+                 logger: Optional[AsyncLogger] = None, on_finish: str = "sentinel",
+                 context: Optional[Any] = None):
+        super().__init__(name=name or "ProcessProducer")
+        if on_finish not in ("sentinel", "close", "none"):
+            raise ValueError("on_finish must be 'sentinel', 'close' or 'none'")
+        context = context or multiprocessing.get_context()
+        self.source_data = source_data
+        self.queue = queue
+        self.on_finish = on_finish
+        self.logger = logger or default_logger
+        self._items_produced = context.Value('q', 0)
+    
+    @property
+    def items_produced(self) -> int:
+        """Items produced so far, readable from the parent process."""
+        return self._items_produced.value
+    
+    def run(self) -> None:
+        """Execute producer process logic."""
+        try:
+            for item in self.source_data:
+                self.queue.put(item)
+                self._items_produced.value += 1
+            
+            self._signal_done()
+            self.logger.info("[%s] Finished producing %d items", self.name, self.items_produced)
+            
+        except Exception as e:
+            self.logger.error("[%s] Error in producer: %s", self.name, e)
+            try:
+                self._signal_done()
+            except Exception:
+                pass
+        finally:
+            self.logger.close()  # Process exit skips atexit, so flush explicitly
+    
+    def _signal_done(self) -> None:
+        """Signal completion to consumers as configured by on_finish."""
+        if self.on_finish == "sentinel":
+            self.queue.put(_SENTINEL)
+        elif self.on_finish == "close":
+            self.queue.close()
+
+
+class ProcessConsumer(_ContextProcess):
+    """Process counterpart of Consumer for CPU-bound work across cores.
+    
+    Applies handler to each dequeued item and, if results is given, puts the
+    handler's return value there. Exits when _SENTINEL is dequeued, or when
+    the queue is closed and drained. The process is started with context's
+    start method (default: the global one); under spawn, handler must be
+    picklable (a module-level function).
+    """
+    
+    def __init__(self, queue: Any, handler: Optional[Callable[[Any], Any]] = None,
+                 results: Optional[Any] = None, name: Optional[str] = None,
+                 logger: Optional[AsyncLogger] = None, context: Optional[Any] = None):
+        super().__init__(name=name or "ProcessConsumer")
+        context = context or multiprocessing.get_context()
+        self.queue = queue
+        self.handler = handler
+        self.results = results
+        self.logger = logger or default_logger
+        self._items_consumed = context.Value('q', 0)
+    
+    @property
+    def items_consumed(self) -> int:
+        """Items consumed so far, readable from the parent process."""
+        return self._items_consumed.value
+    
+    def run(self) -> None:
+        """Execute consumer process logic."""
+        try:
+            while True:
+                try:
+                    item = self.queue.get()
+                except QueueClosed:
+                    break
+                if item is _SENTINEL:  # Shutdown signal received
+                    break
+                
+                result = self.handler(item) if self.handler is not None else item
+                if self.results is not None:
+                    self.results.put(result)
+                self._items_consumed.value += 1
             
-            thread_safe_print(f"[{self.name}] Finished consuming {self.items_consumed} items")
+            self.logger.info("[%s] Finished consuming %d items", self.name, self.items_consumed)
             
         except Exception as e:
-            thread_safe_print(f"[{self.name}] Error in consumer: {e}")
+            self.logger.error("[%s] Error in consumer: %s", self.name, e)
+        finally:
+            self.logger.close()  # Process exit skips atexit, so flush explicitly
 
@@ -0,0 +1,138 @@
+import threading
+import time
+from bisect import bisect_left
+from typing import Any, Dict
+
+# Upper bounds (seconds) of the wait-time histogram buckets; the last bucket is unbounded
+HISTOGRAM_BOUNDS = (1e-5, 1e-4, 1e-3, 1e-2, 1e-1, 1.0)
+
+
+class WaitHistogram:
+    """Count and total of wait durations, bucketed on a log10 scale.
+    
+    Not thread-safe by itself; callers record while holding the queue lock.
+    """
+    
+    def __init__(self):
+        self.count = 0
+        self.total_seconds = 0.0
+        self.buckets = [0] * (len(HISTOGRAM_BOUNDS) + 1)
+    
+    def record(self, seconds: float) -> None:
+        """Add one wait of the given duration."""
+        self.count += 1
+        self.total_seconds += seconds
+        self.buckets[bisect_left(HISTOGRAM_BOUNDS, seconds)] += 1
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """Plain-dict copy of the histogram, keyed by bucket upper bound."""
+        labels = [f"<={bound:g}s" for bound in HISTOGRAM_BOUNDS] + [f">{HISTOGRAM_BOUNDS[-1]:g}s"]
+        return {
+            'count': self.count,
+            'total_seconds': self.total_seconds,
+            'histogram': dict(zip(labels, self.buckets)),
+        }
+
+
+class TimedLock:
+    """threading.Lock wrapper that counts contention and accumulates hold time."""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._acquired_at = 0.0
+        self.acquisitions = 0
+        self.contended = 0
+        self.hold_seconds = 0.0
+    
+    def acquire(self, blocking: bool = True, timeout: float = -1) -> bool:
+        """Acquire the lock, counting the acquisition as contended if it had to wait."""
+        acquired = self._lock.acquire(False)
+        if not acquired:
+            if not blocking:
+                return False
+            acquired = self._lock.acquire(True, timeout)
+            if not acquired:
+                return False
+            self.contended += 1
+        self.acquisitions += 1
+        self._acquired_at = time.perf_counter()
+        return True
+    
+    def release(self) -> None:
+        """Record how long the lock was held, then release it."""
+        self.hold_seconds += time.perf_counter() - self._acquired_at
+        self._lock.release()
+    
+    def locked(self) -> bool:
+        return self._lock.locked()
+    
+    def _is_owned(self) -> bool:
+        # Used by threading.Condition in place of its acquire(False) probe
+        return self._lock.locked()
+    
+    def __enter__(self) -> bool:
+        return self.acquire()
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.release()
+
+
+class TimedCondition(threading.Condition):
+    """Condition variable that records every wait() duration in a WaitHistogram."""
+    
+    def __init__(self, lock: TimedLock, histogram: WaitHistogram):
+        super().__init__(lock)
+        self.histogram = histogram
+    
+    def wait(self, timeout: float = None) -> bool:
+        start_time = time.perf_counter()
+        try:
+            return super().wait(timeout)
+        finally:
+            # The lock is held again here, so recording is race-free
+            self.histogram.record(time.perf_counter() - start_time)
+
+
+class QueueStats:
+    """Counters behind BoundedBlockingQueue.stats().
+    
+    Updated only while the queue lock is held. A large get-wait total means
+    consumers sit idle (producer-bound pipeline); a large put-wait total means
+    producers are throttled by a full queue (consumer-bound pipeline).
+    """
+    
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.lock = TimedLock()
+        self.put_wait = WaitHistogram()
+        self.get_wait = WaitHistogram()
+        self.puts = 0
+        self.gets = 0
+        self.high_water_depth = 0
+    
+    def record_put(self, count: int, depth: int) -> None:
+        """Record count items added, leaving the queue at depth."""
+        self.puts += count
+        if depth > self.high_water_depth:
+            self.high_water_depth = depth
+    
+    def record_get(self, count: int) -> None:
+        """Record count items removed."""
+        self.gets += count
+    
+    def snapshot(self, depth: int) -> Dict[str, Any]:
+        """Plain-dict copy of all counters for the current depth."""
+        return {
+            'capacity': self.capacity,
+            'depth': depth,
+            'high_water_depth': self.high_water_depth,
+            'puts': self.puts,
+            'gets': self.gets,
+            'put_wait': self.put_wait.snapshot(),
+            'get_wait': self.get_wait.snapshot(),
+            'lock': {
+                'acquisitions': self.lock.acquisitions,
+                'contended': self.lock.contended,
+                'hold_seconds': self.lock.hold_seconds,
+            },
+        }
@@ -1,5 +1,6 @@
 import threading
 import time
+from assignment_1.async_logger import AsyncLogger, DEBUG
 from assignment_1.blocking_queue import BoundedBlockingQueue
 from assignment_1.producer_consumer import Producer, Consumer
 
@@ -28,10 +29,12 @@ def main():
     queue = BoundedBlockingQueue(capacity=queue_capacity)
     destination = []
     destination_lock = threading.Lock()
+    # Per-item activity is logged at DEBUG; the writer thread keeps stdout off the workers' path
+    logger = AsyncLogger(level=DEBUG)
     
-    producer = Producer(source_data=source_data, queue=queue, name="Producer-1")
+    producer = Producer(source_data=source_data, queue=queue, name="Producer-1", logger=logger)
     consumer = Consumer(queue=queue, destination=destination, 
-                       destination_lock=destination_lock, name="Consumer-1")
+                       destination_lock=destination_lock, name="Consumer-1", logger=logger)
     
     print("Starting producer and consumer threads...")
     print("-" * line_width)
@@ -46,6 +49,7 @@ def main():
     
     end_time = time.time()
     elapsed_time = end_time - start_time
+    logger.close()
     
     print("-" * line_width)
     print()
@@ -0,0 +1,165 @@
+import multiprocessing
+import pickle
+import struct
+from multiprocessing import shared_memory
+from typing import Any
+
+from assignment_1.blocking_queue import QueueClosed
+from assignment_1.producer_consumer import _SENTINEL
+
+_HEADER = struct.Struct("QQ?")  # head, tail: total records read / written; closed flag
+_LENGTH = struct.Struct("I")  # Per-slot payload length prefix
+_SENTINEL_LENGTH = 0xFFFFFFFF  # Reserved length marking a _SENTINEL record
+
+
+class SharedMemoryQueue:
+    """Cross-process bounded blocking queue over a shared-memory ring buffer.
+    
+    Items are pickled into fixed-size, length-prefixed slots, so any picklable
+    object whose payload fits in slot_size bytes can be transferred. put() and
+    get() block when the ring is full or empty, like BoundedBlockingQueue.
+    _SENTINEL is encoded as a reserved record and decoded back to the receiving
+    process's own _SENTINEL, so the sentinel shutdown protocol keeps working.
+    close() is the alternative, as on BoundedBlockingQueue: once closed,
+    put() raises QueueClosed and get() drains what is buffered, then raises
+    QueueClosed in every process.
+    
+    The creating process owns the segment and should call unlink() once every
+    process is done; other processes attach automatically when the queue is
+    passed to them as a Process argument.
+    """
+    
+    def __init__(self, capacity: int, slot_size: int = 1024, context=None):
+        if capacity <= 0:
+            raise ValueError("Capacity must be greater than 0")
+        if slot_size <= 0:
+            raise ValueError("slot_size must be greater than 0")
+        
+        context = context or multiprocessing.get_context()
+        self.capacity = capacity
+        self.slot_size = slot_size
+        self._shm = shared_memory.SharedMemory(
+            create=True, size=_HEADER.size + capacity * (_LENGTH.size + slot_size))
+        _HEADER.pack_into(self._shm.buf, 0, 0, 0, False)
+        self._owner = True
+        self.lock = context.Lock()
+        self.not_full = context.Condition(self.lock)
+        self.not_empty = context.Condition(self.lock)
+    
+    def put(self, item: Any) -> None:
+        """Add item to queue. Blocks if queue is full. Raises QueueClosed if closed.
+        
+        Raises ValueError if the pickled item does not fit in one slot.
+        """
+        payload = None if item is _SENTINEL else pickle.dumps(item, pickle.HIGHEST_PROTOCOL)
+        if payload is not None and len(payload) > self.slot_size:
+            raise ValueError(
+                f"Item needs {len(payload)} bytes but slot_size is {self.slot_size}")
+        
+        buf = self._shm.buf
+        with self.not_full:
+            head, tail, closed = _HEADER.unpack_from(buf, 0)
+            while tail - head >= self.capacity and not closed:
+                self.not_full.wait()
+                head, tail, closed = _HEADER.unpack_from(buf, 0)
+            if closed:
+                raise QueueClosed("put() on a closed queue")
+            
+            offset = self._slot_offset(tail)
+            if payload is None:
+                _LENGTH.pack_into(buf, offset, _SENTINEL_LENGTH)
+            else:
+                _LENGTH.pack_into(buf, offset, len(payload))
+                start = offset + _LENGTH.size
+                buf[start:start + len(payload)] = payload
+            _HEADER.pack_into(buf, 0, head, tail + 1, closed)
+            self.not_empty.notify()
+    
+    def get(self) -> Any:
+        """Remove and return item from queue. Blocks if queue is empty.
+        
+        Raises QueueClosed once the queue is closed and fully drained.
+        """
+        buf = self._shm.buf
+        with self.not_empty:
+            head, tail, closed = _HEADER.unpack_from(buf, 0)
+            while head == tail and not closed:
+                self.not_empty.wait()
+                head, tail, closed = _HEADER.unpack_from(buf, 0)
+            if head == tail:
+                raise QueueClosed("get() on a closed, empty queue")
+            
+            offset = self._slot_offset(head)
+            (length,) = _LENGTH.unpack_from(buf, offset)
+            if length == _SENTINEL_LENGTH:
+                payload = None
+            else:
+                start = offset + _LENGTH.size
+                payload = bytes(buf[start:start + length])
+            _HEADER.pack_into(buf, 0, head + 1, tail, closed)
+            self.not_full.notify()
+        
+        return _SENTINEL if payload is None else pickle.loads(payload)
+    
+    def _slot_offset(self, counter: int) -> int:
+        """Byte offset of the slot used by the given head/tail counter."""
+        return _HEADER.size + (counter % self.capacity) * (_LENGTH.size + self.slot_size)
+    
+    def qsize(self) -> int:
+        """Number of records currently buffered."""
+        with self.lock:
+            head, tail, _ = _HEADER.unpack_from(self._shm.buf, 0)
+            return tail - head
+    
+    def close(self) -> None:
+        """Close the queue in every process and wake all blocked callers.
+        
+        Items already buffered can still be taken with get(). Closing twice
+        is a no-op.
+        """
+        with self.lock:
+            head, tail, _ = _HEADER.unpack_from(self._shm.buf, 0)
+            _HEADER.pack_into(self._shm.buf, 0, head, tail, True)
+            self.not_full.notify_all()
+            self.not_empty.notify_all()
+    
+    @property
+    def closed(self) -> bool:
+        """True once any process has called close()."""
+        with self.lock:
+            return _HEADER.unpack_from(self._shm.buf, 0)[2]
+    
+    def detach(self) -> None:
+        """Unmap the segment from this process. The queue is unusable afterwards."""
+        self._shm.close()
+    
+    def unlink(self) -> None:
+        """Destroy the shared segment. Only the creating process may unlink."""
+        if not self._owner:
+            raise RuntimeError("Only the process that created the queue can unlink it")
+        self._shm.unlink()
+    
+    def __enter__(self) -> "SharedMemoryQueue":
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.detach()
+        if self._owner:
+            self.unlink()
+    
+    def __getstate__(self) -> dict:
+        """Pickle by segment name so spawned processes attach to the same buffer."""
+        state = self.__dict__.copy()
+        state["_shm"] = self._shm.name
+        state["_owner"] = False
+        return state
+    
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._shm = shared_memory.SharedMemory(name=state["_shm"])
+    
+    def __repr__(self) -> str:
+        """String representation of the queue."""
+        state = ", closed" if self.closed else ""
+        return (f"SharedMemoryQueue(capacity={self.capacity}, slot_size={self.slot_size}, "
+                f"size={self.qsize()}{state})")
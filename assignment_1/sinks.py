@@ -0,0 +1,139 @@
+import threading
+import time
+from typing import Any, Callable, Iterable, List, Optional
+from assignment_1.tracing import Tracer
+
+
+class Sink:
+    """Destination a Consumer writes consumed items to.
+    
+    Subclasses implement write(); write_many() defaults to calling it per item.
+    Sinks are not synchronized unless stated otherwise, so give each consumer
+    its own instance and combine them after join (see merge_sinks).
+    """
+    
+    def write(self, item: Any) -> None:
+        raise NotImplementedError
+    
+    def write_many(self, items: List[Any]) -> None:
+        for item in items:
+            self.write(item)
+    
+    def flush(self) -> None:
+        """Push buffered output downstream. Called when the consumer finishes."""
+    
+    def close(self) -> None:
+        self.flush()
+
+
+class ListSink(Sink):
+    """In-memory buffer owned by a single consumer; no lock on the hot path."""
+    
+    def __init__(self):
+        self.items: List[Any] = []
+        self.write = self.items.append
+        self.write_many = self.items.extend
+    
+    def __len__(self) -> int:
+        return len(self.items)
+
+
+class LockedListSink(Sink):
+    """Appends to a list shared between consumers, guarded by a lock.
+    
+    With a tracer, each write that finds the lock held records the time spent
+    waiting for it; uncontended writes record nothing.
+    """
+    
+    def __init__(self, destination: List[Any], lock: threading.Lock,
+                 tracer: Optional[Tracer] = None):
+        self.destination = destination
+        self.lock = lock
+        self.tracer = tracer
+    
+    def write(self, item: Any) -> None:
+        self._acquire()
+        try:
+            self.destination.append(item)
+        finally:
+            self.lock.release()
+    
+    def write_many(self, items: List[Any]) -> None:
+        self._acquire()
+        try:
+            self.destination.extend(items)
+        finally:
+            self.lock.release()
+    
+    def _acquire(self) -> None:
+        if self.tracer is None:
+            self.lock.acquire()
+        elif not self.lock.acquire(blocking=False):
+            start = time.perf_counter_ns()
+            self.lock.acquire()
+            self.tracer.record("waiting on destination lock", "sink", start, time.perf_counter_ns())
+
+
+class CallbackSink(Sink):
+    """Passes each item to a callable; the callable owns any synchronization."""
+    
+    def __init__(self, callback: Callable[[Any], None]):
+        self.callback = callback
+    
+    def write(self, item: Any) -> None:
+        self.callback(item)
+
+
+class BatchCallbackSink(Sink):
+    """Passes each batch to a callable in a single call, e.g. a bulk database insert."""
+    
+    def __init__(self, callback: Callable[[List[Any]], None]):
+        self.callback = callback
+    
+    def write(self, item: Any) -> None:
+        self.callback([item])
+    
+    def write_many(self, items: List[Any]) -> None:
+        self.callback(items)
+
+
+class QueueSink(Sink):
+    """Forwards items into another queue, e.g. the input queue of a downstream stage."""
+    
+    def __init__(self, queue: Any):
+        self.queue = queue
+    
+    def write(self, item: Any) -> None:
+        self.queue.put(item)
+    
+    def write_many(self, items: List[Any]) -> None:
+        self.queue.put_many(items)
+
+
+class FileSink(Sink):
+    """Streams one formatted line per item to a text file owned by one consumer."""
+    
+    def __init__(self, path: str, formatter: Callable[[Any], str] = str, mode: str = 'w'):
+        self.path = path
+        self.formatter = formatter
+        self._file = open(path, mode, encoding='utf-8')
+    
+    def write(self, item: Any) -> None:
+        self._file.write(self.formatter(item) + '\n')
+    
+    def write_many(self, items: List[Any]) -> None:
+        self._file.write(''.join(self.formatter(item) + '\n' for item in items))
+    
+    def flush(self) -> None:
+        self._file.flush()
+    
+    def close(self) -> None:
+        self._file.close()
+
+
+def merge_sinks(sinks: Iterable[ListSink]) -> List[Any]:
+    """Concatenate per-consumer ListSink buffers once all consumers have joined."""
+    merged: List[Any] = []
+    for sink in sinks:
+        merged.extend(sink.items)
+    return merged
@@ -0,0 +1,27 @@
+from typing import Iterator
+
+
+def iter_lines(path: str, encoding: str = 'utf-8') -> Iterator[str]:
+    """Lazily yield lines of a text file without trailing newlines.
+    
+    The file is opened on the first next() call and closed when exhausted.
+    """
+    with open(path, 'r', encoding=encoding) as file:
+        for line in file:
+            yield line.rstrip('\n')
+
+
+def iter_chunks(path: str, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+    """Lazily yield a binary file in chunks of at most chunk_size bytes."""
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be greater than 0")
+    return _read_chunks(path, chunk_size)
+
+
+def _read_chunks(path: str, chunk_size: int) -> Iterator[bytes]:
+    with open(path, 'rb') as file:
+        while True:
+            chunk = file.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
@@ -0,0 +1,244 @@
+import mmap
+import os
+import pickle
+import struct
+import tempfile
+import threading
+from collections import deque
+from typing import Any, Dict, Iterable, List, Optional
+from assignment_1.blocking_queue import QueueClosed, QueueEmpty, _deadline, _wait_until
+from assignment_1.producer_consumer import _SENTINEL
+
+_LENGTH = struct.Struct("I")  # Per-record payload length prefix
+_SENTINEL_LENGTH = 0xFFFFFFFF  # Reserved length marking a _SENTINEL record
+
+
+class _Segment:
+    """Append-only spill file of length-prefixed records, mapped into memory."""
+    
+    def __init__(self, path: str, size: int):
+        self.path = path
+        self.size = size
+        self.read_offset = 0
+        self.write_offset = 0
+        self._file = open(path, 'w+b')
+        self._file.truncate(size)
+        self._map = mmap.mmap(self._file.fileno(), size)
+    
+    def append(self, payload: Optional[bytes]) -> bool:
+        """Write one record (None for _SENTINEL); False if the segment is full."""
+        length = 0 if payload is None else len(payload)
+        end = self.write_offset + _LENGTH.size + length
+        if end > self.size:
+            return False
+        _LENGTH.pack_into(self._map, self.write_offset,
+                          _SENTINEL_LENGTH if payload is None else length)
+        self._map[self.write_offset + _LENGTH.size:end] = payload or b""
+        self.write_offset = end
+        return True
+    
+    def read(self) -> Optional[bytes]:
+        """Read the next record (None for _SENTINEL). Only valid if not exhausted."""
+        (length,) = _LENGTH.unpack_from(self._map, self.read_offset)
+        start = self.read_offset + _LENGTH.size
+        if length == _SENTINEL_LENGTH:
+            self.read_offset = start
+            return None
+        self.read_offset = start + length
+        return self._map[start:self.read_offset]
+    
+    def exhausted(self) -> bool:
+        return self.read_offset == self.write_offset
+    
+    def remove(self) -> None:
+        self._map.close()
+        self._file.close()
+        os.remove(self.path)
+
+
+class SpillingQueue:
+    """Queue that never blocks producers: items beyond capacity spill to disk.
+    
+    Up to capacity items live in an in-memory deque. Once it is full, further
+    items are pickled into append-only, memory-mapped segment files under a
+    private temporary directory, and keep going there until consumers have
+    read every spilled item, which preserves FIFO order. Bursts therefore
+    slow to disk speed instead of stalling Producer.run; local disk space is
+    the only bound. Spilled items must be picklable.
+    
+    get()/get_many() follow the BoundedBlockingQueue contract, including
+    timeouts and close(). Call release() (or use the queue as a context
+    manager) to delete the spill directory.
+    """
+    
+    def __init__(self, capacity: int, directory: Optional[str] = None,
+                 segment_size: int = 16 * 1024 * 1024):
+        if capacity <= 0:
+            raise ValueError("Capacity must be greater than 0")
+        if segment_size <= _LENGTH.size:
+            raise ValueError(f"segment_size must be greater than {_LENGTH.size}")
+        
+        self.capacity = capacity
+        self.segment_size = segment_size
+        self.closed = False
+        self.items_spilled = 0
+        self.lock = threading.Lock()
+        self.not_empty = threading.Condition(self.lock)
+        self._hot = deque()
+        self._segments = deque()
+        self._spilled = 0  # Items currently on disk
+        self._segment_count = 0
+        self._directory = tempfile.TemporaryDirectory(prefix="spill-", dir=directory)
+    
+    def put(self, item: Any) -> None:
+        """Add item to the in-memory buffer, or spill it to disk when that is full.
+        
+        Never waits for consumers. Raises QueueClosed if the queue is closed.
+        """
+        # While spilling, pickle before taking the lock so consumers are not held up
+        payload = self._encode(item) if self._spilled else None
+        with self.lock:
+            if self.closed:
+                raise QueueClosed("put() on a closed queue")
+            if not self._spilled and len(self._hot) < self.capacity:
+                self._hot.append(item)
+            else:
+                self._spill(payload if payload is not None else self._encode(item))
+            self.not_empty.notify()
+    
+    def put_many(self, items: Iterable[Any]) -> None:
+        """Add all items in order; never waits for consumers."""
+        for item in items:
+            self.put(item)
+    
+    def try_put(self, item: Any, timeout: float = 0.0) -> bool:
+        """Add item; always succeeds since overflow spills to disk."""
+        self.put(item)
+        return True
+    
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> Any:
+        """Remove and return the oldest item. Blocks if queue is empty.
+        
+        With block=False, or once timeout expires with the queue still empty,
+        raises QueueEmpty. Raises QueueClosed once closed and fully drained.
+        """
+        deadline = None if block and timeout is None else _deadline(block, timeout)
+        with self.not_empty:
+            while not self._hot and not self._spilled:
+                if self.closed:
+                    raise QueueClosed("get() on a closed, empty queue")
+                if not _wait_until(self.not_empty, deadline):
+                    raise QueueEmpty("get() timed out on an empty queue")
+            if self._hot:
+                return self._hot.popleft()
+            payload = self._read_spilled()
+        return self._decode(payload)  # Unpickle outside the lock
+    
+    def get_many(self, max_items: int, timeout: Optional[float] = None) -> List[Any]:
+        """Remove and return up to max_items of the oldest items.
+        
+        Returns an empty list if timeout expires first. Raises QueueClosed once
+        the queue is closed and fully drained.
+        """
+        if max_items <= 0:
+            raise ValueError("max_items must be greater than 0")
+        
+        deadline = _deadline(True, timeout)
+        with self.not_empty:
+            while not self._hot and not self._spilled:
+                if self.closed:
+                    raise QueueClosed("get_many() on a closed, empty queue")
+                if not _wait_until(self.not_empty, deadline):
+                    return []
+            items = [self._hot.popleft() for _ in range(min(max_items, len(self._hot)))]
+            payloads = [self._read_spilled()
+                        for _ in range(min(max_items - len(items), self._spilled))]
+        items.extend(self._decode(payload) for payload in payloads)
+        return items
+    
+    def try_get(self, timeout: float = 0.0, default: Any = None) -> Any:
+        """Remove and return an item within timeout seconds, else default."""
+        try:
+            return self.get(timeout=timeout)
+        except QueueEmpty:
+            return default
+    
+    def qsize(self) -> int:
+        """Number of items buffered in memory and on disk."""
+        return len(self._hot) + self._spilled
+    
+    def close(self) -> None:
+        """Stop accepting puts and wake all blocked consumers.
+        
+        Buffered and spilled items stay available to get().
+        """
+        with self.lock:
+            self.closed = True
+            self.not_empty.notify_all()
+    
+    def release(self) -> None:
+        """Close the queue and delete its spill files, discarding spilled items."""
+        with self.lock:
+            self.closed = True
+            while self._segments:
+                self._segments.popleft().remove()
+            self._spilled = 0
+            self.not_empty.notify_all()
+        self._directory.cleanup()
+    
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of in-memory depth, spilled depth and disk usage."""
+        with self.lock:
+            return {
+                'capacity': self.capacity,
+                'in_memory': len(self._hot),
+                'spilled': self._spilled,
+                'items_spilled': self.items_spilled,
+                'segments': len(self._segments),
+                'disk_bytes': sum(segment.size for segment in self._segments),
+            }
+    
+    def _spill(self, payload: Optional[bytes]) -> None:
+        """Append one encoded record to the newest segment, starting a new one if full."""
+        if not self._segments or not self._segments[-1].append(payload):
+            needed = _LENGTH.size + (len(payload) if payload is not None else 0)
+            self._segment_count += 1
+            path = os.path.join(self._directory.name, f"segment-{self._segment_count:06d}.spill")
+            segment = _Segment(path, max(self.segment_size, needed))
+            segment.append(payload)
+            self._segments.append(segment)
+        self._spilled += 1
+        self.items_spilled += 1
+    
+    def _read_spilled(self) -> Optional[bytes]:
+        """Read the oldest spilled record, recycling segments once fully read."""
+        segment = self._segments[0]
+        payload = segment.read()
+        self._spilled -= 1
+        if segment.exhausted():
+            if len(self._segments) > 1:
+                self._segments.popleft().remove()
+            else:
+                segment.read_offset = segment.write_offset = 0  # Reuse the file for the next burst
+        return payload
+    
+    @staticmethod
+    def _encode(item: Any) -> Optional[bytes]:
+        return None if item is _SENTINEL else pickle.dumps(item, pickle.HIGHEST_PROTOCOL)
+    
+    @staticmethod
+    def _decode(payload: Optional[bytes]) -> Any:
+        return _SENTINEL if payload is None else pickle.loads(payload)
+    
+    def __enter__(self) -> "SpillingQueue":
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.release()
+    
+    def __repr__(self) -> str:
+        """String representation of the queue."""
+        with self.lock:
+            state = ", closed" if self.closed else ""
+            return (f"SpillingQueue(capacity={self.capacity}, size={len(self._hot)}, "
+                    f"spilled={self._spilled}{state})")
@@ -0,0 +1,129 @@
+import io
+import pickle
+import threading
+import time
+from assignment_1.async_logger import AsyncLogger, DEBUG, INFO, ERROR, default_logger
+from assignment_1.blocking_queue import BoundedBlockingQueue
+from assignment_1.producer_consumer import Producer, Consumer
+
+
+class TestAsyncLogger:
+    """Test suite for the background buffered logger."""
+    
+    def test_messages_written_in_order_after_flush(self):
+        """Test that queued messages are formatted and written in order."""
+        stream = io.StringIO()
+        logger = AsyncLogger(level=DEBUG, stream=stream)
+        for i in range(100):
+            logger.debug("item %d", i)
+        assert logger.flush(timeout=1.0)
+        
+        assert stream.getvalue().splitlines() == [f"item {i}" for i in range(100)]
+        logger.close()
+    
+    def test_level_filtering(self):
+        """Test that messages below the configured level are dropped."""
+        stream = io.StringIO()
+        logger = AsyncLogger(level=INFO, stream=stream)
+        logger.debug("hidden")
+        logger.info("shown %s", "info")
+        logger.warning("shown warning")
+        logger.close()
+        
+        assert stream.getvalue().splitlines() == ["shown info", "shown warning"]
+        assert not logger.is_enabled_for(DEBUG)
+    
+    def test_quiet_mode_keeps_errors_only(self):
+        """Test that quiet mode suppresses everything but errors, including progress."""
+        stream = io.StringIO()
+        logger = AsyncLogger(level=DEBUG, quiet=True, stream=stream, progress_interval=0.01)
+        logger.info("hidden")
+        logger.count("consumed")
+        logger.error("boom")
+        logger.close()
+        
+        assert stream.getvalue() == "boom\n"
+        assert logger.level == ERROR
+    
+    def test_logging_never_starts_writer_when_disabled(self):
+        """Test that filtered messages do not start the writer thread."""
+        logger = AsyncLogger(level=ERROR, stream=io.StringIO())
+        logger.info("ignored")
+        logger.count("ignored")
+        
+        assert logger._thread is None
+        assert logger.flush()
+    
+    def test_progress_summaries(self):
+        """Test that count() totals are summarized periodically."""
+        stream = io.StringIO()
+        logger = AsyncLogger(stream=stream, progress_interval=0.05)
+        logger.count("produced", 3)
+        logger.count("consumed")
+        time.sleep(0.15)
+        logger.close()
+        
+        summaries = [line for line in stream.getvalue().splitlines() if line.startswith("[progress")]
+        assert summaries
+        assert summaries[-1].endswith("consumed=1, produced=3")
+    
+    def test_bad_format_arguments_do_not_kill_writer(self):
+        """Test that a formatting error is written verbatim instead of raising."""
+        stream = io.StringIO()
+        logger = AsyncLogger(stream=stream)
+        logger.info("%d items", "not-a-number")
+        logger.info("still alive")
+        logger.close()
+        
+        lines = stream.getvalue().splitlines()
+        assert lines[0].startswith("%d items")
+        assert lines[1] == "still alive"
+    
+    def test_closed_stream_does_not_hang_flush(self):
+        """Test that flush() returns even if the stream can no longer be written."""
+        stream = io.StringIO()
+        logger = AsyncLogger(stream=stream)
+        stream.close()
+        logger.info("lost")
+        
+        assert logger.flush(timeout=1.0)
+        logger.close()
+    
+    def test_pickles_configuration_only(self):
+        """Test that a pickled logger keeps its settings and starts its own writer."""
+        logger = AsyncLogger(level=DEBUG, stream=io.StringIO(), progress_interval=5.0)
+        logger.debug("started")
+        assert set(logger.__getstate__()) == {'level', 'quiet', 'stream', 'progress_interval'}
+        copy = pickle.loads(pickle.dumps(logger))
+        logger.close()
+        
+        assert (copy.level, copy.progress_interval) == (DEBUG, 5.0)
+        assert copy._thread is None and copy._pid is None
+    
+    def test_producer_consumer_use_logger(self):
+        """Test that Producer/Consumer route their output through the given logger."""
+        stream = io.StringIO()
+        logger = AsyncLogger(level=DEBUG, stream=stream)
+        queue = BoundedBlockingQueue(capacity=2)
+        destination = []
+        
+        producer = Producer([1, 2, 3], queue, name="P", logger=logger)
+        consumer = Consumer(queue, destination, threading.Lock(), name="C", logger=logger)
+        producer.start()
+        consumer.start()
+        producer.join(timeout=5.0)
+        consumer.join(timeout=5.0)
+        logger.close()
+        
+        lines = stream.getvalue().splitlines()
+        assert [line for line in lines if line.startswith("[P] Produced")] == [
+            "[P] Produced: 1", "[P] Produced: 2", "[P] Produced: 3"]
+        assert "[C] Finished consuming 3 items" in lines
+    
+    def test_default_logger_is_quiet(self):
+        """Test that Producer/Consumer without a logger report errors only."""
+        queue = BoundedBlockingQueue(capacity=2)
+        assert Producer([1], queue).logger is default_logger
+        assert default_logger.quiet
+        assert not default_logger.is_enabled_for(INFO)
+        assert default_logger.is_enabled_for(ERROR)
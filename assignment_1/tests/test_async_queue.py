@@ -0,0 +1,242 @@
+import asyncio
+import io
+import threading
+import pytest
+from assignment_1.async_logger import AsyncLogger
+from assignment_1.async_queue import AsyncBoundedQueue, ThreadBridge
+from assignment_1.blocking_queue import QueueClosed, QueueEmpty, QueueFull
+from assignment_1.producer_consumer import Producer, Consumer, _SENTINEL
+
+_quiet = AsyncLogger(quiet=True, stream=io.StringIO())
+
+
+class TestAsyncBoundedQueue:
+    """Test suite for AsyncBoundedQueue coroutine operations."""
+    
+    def test_init_with_invalid_capacity(self):
+        """Test queue initialization with invalid capacity."""
+        with pytest.raises(ValueError):
+            AsyncBoundedQueue(capacity=0)
+    
+    def test_put_and_get_fifo(self):
+        """Test FIFO ordering of awaited put/get."""
+        async def scenario():
+            queue = AsyncBoundedQueue(capacity=5)
+            for i in range(5):
+                await queue.put(i)
+            return [await queue.get() for _ in range(5)]
+        
+        assert asyncio.run(scenario()) == [0, 1, 2, 3, 4]
+    
+    def test_put_suspends_when_full(self):
+        """Test that put() suspends the task, not the loop, when full."""
+        async def scenario():
+            queue = AsyncBoundedQueue(capacity=1)
+            await queue.put(1)
+            blocked_put = asyncio.create_task(queue.put(2))
+            await asyncio.sleep(0.05)
+            assert not blocked_put.done()
+            
+            assert await queue.get() == 1
+            await asyncio.wait_for(blocked_put, timeout=1.0)
+            return await queue.get()
+        
+        assert asyncio.run(scenario()) == 2
+    
+    def test_many_concurrent_streams_on_one_loop(self):
+        """Test that one loop serves many queues without blocking threads."""
+        async def stream(n):
+            queue = AsyncBoundedQueue(capacity=2)
+            
+            async def produce():
+                for i in range(n):
+                    await queue.put(i)
+            
+            producer = asyncio.create_task(produce())
+            received = [await queue.get() for _ in range(n)]
+            await producer
+            return received
+        
+        async def scenario():
+            return await asyncio.gather(*(stream(20) for _ in range(500)))
+        
+        results = asyncio.run(scenario())
+        assert len(results) == 500
+        assert all(result == list(range(20)) for result in results)
+    
+    def test_put_many_and_get_many(self):
+        """Test batched coroutine transfers, including the get_many timeout."""
+        async def scenario():
+            queue = AsyncBoundedQueue(capacity=4)
+            consumer = asyncio.create_task(queue.get_many(10))
+            await queue.put_many(range(3))
+            first = await consumer
+            empty = await queue.get_many(2, timeout=0.01)
+            return first, empty
+        
+        assert asyncio.run(scenario()) == ([0, 1, 2], [])
+    
+    def test_put_and_get_timeouts(self):
+        """Test that expired put()/get() raise QueueFull/QueueEmpty without side effects."""
+        async def scenario():
+            queue = AsyncBoundedQueue(capacity=1)
+            with pytest.raises(QueueEmpty):
+                await queue.get(timeout=0.01)
+            await queue.put(1, timeout=0.01)
+            with pytest.raises(QueueFull):
+                await queue.put(2, timeout=0.01)
+            with pytest.raises(ValueError):
+                await queue.put(2, timeout=-1)
+            return [await queue.get(timeout=0.01)], len(queue.queue)
+        
+        assert asyncio.run(scenario()) == ([1], 0)
+    
+    def test_close_wakes_waiters_and_drains(self):
+        """Test that close() rejects puts, wakes a suspended get and lets buffered items drain."""
+        async def scenario():
+            queue = AsyncBoundedQueue(capacity=2)
+            waiter = asyncio.create_task(queue.get_many(2))
+            await asyncio.sleep(0.01)
+            await queue.close()
+            with pytest.raises(QueueClosed):
+                await waiter
+            
+            queue = AsyncBoundedQueue(capacity=2)
+            await queue.put_many([1, 2])
+            await queue.close()
+            await queue.close()
+            with pytest.raises(QueueClosed):
+                await queue.put(3)
+            with pytest.raises(QueueClosed):
+                await queue.put_many([3])
+            drained = [await queue.get(), await queue.get()]
+            with pytest.raises(QueueClosed):
+                await queue.get()
+            return drained, repr(queue)
+        
+        assert asyncio.run(scenario()) == ([1, 2], "AsyncBoundedQueue(capacity=2, size=0, closed)")
+    
+    def test_get_many_invalid_max_items(self):
+        """Test that get_many rejects non-positive max_items."""
+        with pytest.raises(ValueError):
+            asyncio.run(AsyncBoundedQueue(capacity=1).get_many(0))
+    
+    def test_repr(self):
+        """Test string representation of the queue."""
+        assert repr(AsyncBoundedQueue(capacity=3)) == "AsyncBoundedQueue(capacity=3, size=0)"
+
+
+class TestThreadBridge:
+    """Test bridging threaded Producer/Consumer with asyncio tasks."""
+    
+    def test_threaded_producer_feeds_async_consumer(self):
+        """Test that a threaded Producer can feed an async consumer."""
+        source_data = list(range(100))
+        
+        async def scenario():
+            queue = AsyncBoundedQueue(capacity=3)
+            producer = Producer(source_data, queue.bridge(), logger=_quiet)
+            producer.start()
+            
+            received = []
+            while True:
+                item = await queue.get()
+                if item is _SENTINEL:
+                    break
+                received.append(item)
+            
+            await asyncio.to_thread(producer.join)
+            return received
+        
+        assert asyncio.run(scenario()) == source_data
+    
+    def test_async_producer_feeds_threaded_consumer(self):
+        """Test that async producers can feed a threaded Consumer."""
+        destination = []
+        
+        async def scenario():
+            queue = AsyncBoundedQueue(capacity=3)
+            consumer = Consumer(ThreadBridge(queue), destination, threading.Lock(), logger=_quiet)
+            consumer.start()
+            
+            for i in range(50):
+                await queue.put(i)
+            await queue.put(_SENTINEL)
+            
+            await asyncio.to_thread(consumer.join)
+            return consumer.items_consumed
+        
+        assert asyncio.run(scenario()) == 50
+        assert destination == list(range(50))
+    
+    def test_batched_producer_and_consumer_through_bridge(self):
+        """Test batch-mode Producer and Consumer sharing one async queue via bridges."""
+        source_data = list(range(200))
+        destination = []
+        
+        async def scenario():
+            queue = AsyncBoundedQueue(capacity=8)
+            producer = Producer(source_data, queue.bridge(), batch_size=16, logger=_quiet)
+            consumer = Consumer(queue.bridge(), destination, threading.Lock(), batch_size=16,
+                                logger=_quiet)
+            producer.start()
+            consumer.start()
+            await asyncio.to_thread(producer.join)
+            await asyncio.to_thread(consumer.join)
+        
+        asyncio.run(scenario())
+        assert destination == source_data
+    
+    def test_bridge_requires_loop_outside_coroutine(self):
+        """Test that a bridge created outside a running loop needs an explicit loop."""
+        with pytest.raises(RuntimeError):
+            ThreadBridge(AsyncBoundedQueue(capacity=1))
+    
+    def test_producer_put_timeout_through_bridge(self):
+        """Test that Producer(put_timeout=...) sheds items when nothing drains the async queue."""
+        async def scenario():
+            queue = AsyncBoundedQueue(capacity=2)
+            producer = Producer(range(5), queue.bridge(), on_finish="none", put_timeout=0.01,
+                                logger=_quiet)
+            producer.start()
+            await asyncio.to_thread(producer.join)
+            return producer, [await queue.get(), await queue.get()]
+        
+        producer, buffered = asyncio.run(scenario())
+        assert producer.error is None
+        assert buffered == [0, 1]
+        assert producer.items_dropped == 3
+    
+    def test_consumer_get_timeout_through_bridge(self):
+        """Test that Consumer(get_timeout=...) stops once no item arrives in time."""
+        async def scenario():
+            queue = AsyncBoundedQueue(capacity=2)
+            await queue.put(1)
+            consumer = Consumer(queue.bridge(), get_timeout=0.02, logger=_quiet)
+            consumer.start()
+            await asyncio.to_thread(consumer.join)
+            return consumer
+        
+        consumer = asyncio.run(scenario())
+        assert consumer.items_consumed == 1
+        assert consumer.timeouts == 1
+    
+    def test_close_through_bridge(self):
+        """Test that Producer(on_finish="close") shuts down several Consumers via bridges."""
+        source_data = list(range(100))
+        destination = []
+        lock = threading.Lock()
+        
+        async def scenario():
+            queue = AsyncBoundedQueue(capacity=4)
+            producer = Producer(source_data, queue.bridge(), on_finish="close", logger=_quiet)
+            consumers = [Consumer(queue.bridge(), destination, lock, logger=_quiet)
+                         for _ in range(3)]
+            for thread in [producer, *consumers]:
+                thread.start()
+            for thread in [producer, *consumers]:
+                await asyncio.to_thread(thread.join)
+            return queue
+        
+        assert asyncio.run(scenario()).closed
+        assert sorted(destination) == source_data
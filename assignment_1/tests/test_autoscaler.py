@@ -0,0 +1,99 @@
+import io
+import time
+import pytest
+from assignment_1.async_logger import AsyncLogger
+from assignment_1.autoscaler import ConsumerAutoscaler
+from assignment_1.blocking_queue import BoundedBlockingQueue
+from assignment_1.producer_consumer import Producer, Consumer
+from assignment_1.sinks import merge_sinks
+
+_quiet = AsyncLogger(quiet=True, stream=io.StringIO())
+
+
+def _slow_consumer(queue, delay=0.005):
+    """Consumer factory whose consumers take delay seconds per item."""
+    def process(item):
+        time.sleep(delay)
+        return item
+    return lambda name: Consumer(queue, name=name, process=process, logger=_quiet)
+
+
+class TestConsumerAutoscaler:
+    """Test suite for ConsumerAutoscaler."""
+    
+    def test_scales_up_under_load(self):
+        """Test that a queue held near capacity gets more consumers, up to the maximum."""
+        queue = BoundedBlockingQueue(capacity=8, metrics=True)
+        autoscaler = ConsumerAutoscaler(queue, _slow_consumer(queue), min_consumers=1,
+                                        max_consumers=3, interval=0.02, logger=_quiet)
+        producer = Producer(range(300), queue, on_finish="close", logger=_quiet)
+        
+        autoscaler.start()
+        producer.start()
+        producer.join(timeout=10.0)
+        autoscaler.join_consumers(timeout=10.0)
+        
+        assert autoscaler.peak_consumers == 3
+        assert any(event['action'] == "scale_up" for event in autoscaler.events)
+        assert not autoscaler.is_alive()
+        results = merge_sinks(consumer.sink for consumer in autoscaler.consumers)
+        assert sorted(results) == list(range(300))
+    
+    def test_scales_down_when_idle(self):
+        """Test that consumers are retired after the queue stays empty, down to the minimum."""
+        queue = BoundedBlockingQueue(capacity=4)
+        autoscaler = ConsumerAutoscaler(queue, _slow_consumer(queue), min_consumers=1,
+                                        max_consumers=3, interval=0.01,
+                                        scale_down_after=3, logger=_quiet)
+        autoscaler.start()
+        queue.put_many(range(100))  # Burst: scale up
+        deadline = time.monotonic() + 5.0
+        while time.monotonic() < deadline and sum(
+                consumer.is_alive() for consumer in autoscaler.consumers) > 1:
+            time.sleep(0.02)
+        
+        assert autoscaler.peak_consumers > 1
+        assert sum(consumer.is_alive() for consumer in autoscaler.consumers) == 1
+        assert any(event['action'] == "scale_down" for event in autoscaler.events)
+        
+        queue.close()
+        autoscaler.join_consumers(timeout=5.0)
+        assert sum(consumer.items_consumed for consumer in autoscaler.consumers) == 100
+    
+    def test_stays_at_minimum_without_load(self):
+        """Test that an idle queue never drops below min_consumers."""
+        queue = BoundedBlockingQueue(capacity=4)
+        autoscaler = ConsumerAutoscaler(queue, min_consumers=2, max_consumers=4,
+                                        interval=0.01, scale_down_after=1, logger=_quiet)
+        autoscaler.start()
+        time.sleep(0.1)
+        
+        assert len(autoscaler.consumers) == 2
+        assert autoscaler.events == []
+        
+        queue.close()
+        autoscaler.join_consumers(timeout=5.0)
+        assert not any(consumer.is_alive() for consumer in autoscaler.consumers)
+    
+    def test_stop(self):
+        """Test that stop() ends supervision without touching the consumers."""
+        queue = BoundedBlockingQueue(capacity=4)
+        autoscaler = ConsumerAutoscaler(queue, interval=0.01, logger=_quiet)
+        autoscaler.start()
+        autoscaler.stop()
+        autoscaler.join(timeout=1.0)
+        
+        assert not autoscaler.is_alive()
+        assert autoscaler.consumers[0].is_alive()
+        queue.close()
+        autoscaler.consumers[0].join(timeout=1.0)
+    
+    def test_invalid_bounds(self):
+        """Test that inconsistent bounds are rejected."""
+        queue = BoundedBlockingQueue(capacity=4)
+        with pytest.raises(ValueError):
+            ConsumerAutoscaler(queue, min_consumers=0)
+        with pytest.raises(ValueError):
+            ConsumerAutoscaler(queue, min_consumers=3, max_consumers=2)
+        with pytest.raises(ValueError):
+            ConsumerAutoscaler(queue, interval=0)
@@ -1,7 +1,7 @@
 import pytest
 import threading
 import time
-from assignment_1.blocking_queue import BoundedBlockingQueue
+from assignment_1.blocking_queue import BoundedBlockingQueue, SPSCQueue, QueueClosed, QueueEmpty, QueueFull
 from assignment_1.producer_consumer import _SENTINEL
 
 
@@ -64,6 +64,15 @@ class TestBoundedBlockingQueue:
         queue.put(2)
         repr_str = repr(queue)
         assert "size=2" in repr_str
+    
+    
+    def test_qsize(self):
+        """Test that qsize reports the number of buffered items."""
+        queue = BoundedBlockingQueue(capacity=5)
+        queue.put_many([1, 2, 3])
+        queue.get()
+        
+        assert queue.qsize() == 2
 
 
 class TestBlockingBehavior:
@@ -292,3 +301,350 @@ class TestThreadSafety:
         # Verify no data loss
         assert len(consumed_items) == total_items
 
+
+
+class TestBatchOperations:
+    """Test put_many / get_many batch transfers."""
+    
+    def test_put_many_and_get_many(self):
+        """Test that a batch round-trips in FIFO order."""
+        queue = BoundedBlockingQueue(capacity=10)
+        queue.put_many([1, 2, 3, 4])
+        
+        assert queue.get_many(10) == [1, 2, 3, 4]
+    
+    def test_get_many_respects_max_items(self):
+        """Test that get_many never returns more than max_items."""
+        queue = BoundedBlockingQueue(capacity=10)
+        queue.put_many(range(6))
+        
+        assert queue.get_many(4) == [0, 1, 2, 3]
+        assert queue.get_many(4) == [4, 5]
+    
+    def test_get_many_invalid_max_items(self):
+        """Test that get_many rejects non-positive max_items."""
+        queue = BoundedBlockingQueue(capacity=5)
+        with pytest.raises(ValueError):
+            queue.get_many(0)
+    
+    def test_get_many_timeout_returns_empty(self):
+        """Test that get_many returns an empty list when the timeout expires."""
+        queue = BoundedBlockingQueue(capacity=5)
+        
+        start = time.monotonic()
+        assert queue.get_many(3, timeout=0.05) == []
+        assert time.monotonic() - start >= 0.05
+    
+    def test_put_many_empty_is_noop(self):
+        """Test that put_many with no items does not block or enqueue."""
+        queue = BoundedBlockingQueue(capacity=1)
+        queue.put(1)
+        queue.put_many([])
+        
+        assert queue.get() == 1
+    
+    def test_put_many_larger_than_capacity(self):
+        """Test that put_many blocks and transfers in chunks when batch exceeds capacity."""
+        queue = BoundedBlockingQueue(capacity=3)
+        items = list(range(20))
+        retrieved = []
+        
+        def consumer():
+            while len(retrieved) < len(items):
+                retrieved.extend(queue.get_many(2))
+        
+        thread = threading.Thread(target=consumer)
+        thread.start()
+        queue.put_many(items)
+        thread.join(timeout=5.0)
+        
+        assert retrieved == items
+    
+    def test_put_many_wakes_multiple_getters(self):
+        """Test that one put_many wakes every getter it can satisfy."""
+        queue = BoundedBlockingQueue(capacity=10)
+        results = []
+        lock = threading.Lock()
+        
+        def getter():
+            item = queue.get()
+            with lock:
+                results.append(item)
+        
+        threads = [threading.Thread(target=getter) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.1)
+        
+        queue.put_many([1, 2, 3])
+        for thread in threads:
+            thread.join(timeout=1.0)
+        
+        assert sorted(results) == [1, 2, 3]
+
+
+
+class TestCloseProtocol:
+    """Test close() shutdown semantics."""
+    
+    def test_put_after_close_raises(self):
+        """Test that puts are rejected once the queue is closed."""
+        queue = BoundedBlockingQueue(capacity=5)
+        queue.close()
+        
+        with pytest.raises(QueueClosed):
+            queue.put(1)
+        with pytest.raises(QueueClosed):
+            queue.put_many([1, 2])
+    
+    def test_consumers_drain_before_closed(self):
+        """Test that buffered items remain available after close."""
+        queue = BoundedBlockingQueue(capacity=5)
+        queue.put(1)
+        queue.put(2)
+        queue.close()
+        
+        assert queue.get() == 1
+        assert queue.get_many(5) == [2]
+        with pytest.raises(QueueClosed):
+            queue.get()
+        with pytest.raises(QueueClosed):
+            queue.get_many(5, timeout=1.0)
+    
+    def test_close_wakes_all_blocked_consumers(self):
+        """Test that close() releases every waiting consumer at once."""
+        queue = BoundedBlockingQueue(capacity=5)
+        released = []
+        lock = threading.Lock()
+        
+        def consumer():
+            try:
+                queue.get()
+            except QueueClosed:
+                with lock:
+                    released.append(True)
+        
+        threads = [threading.Thread(target=consumer) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.1)
+        
+        queue.close()
+        for thread in threads:
+            thread.join(timeout=1.0)
+        
+        assert len(released) == 8
+    
+    def test_close_wakes_blocked_producer(self):
+        """Test that a producer blocked on a full queue is released by close()."""
+        queue = BoundedBlockingQueue(capacity=1)
+        queue.put(1)
+        errors = []
+        
+        def producer():
+            try:
+                queue.put(2)
+            except QueueClosed as e:
+                errors.append(e)
+        
+        thread = threading.Thread(target=producer)
+        thread.start()
+        time.sleep(0.1)
+        
+        queue.close()
+        thread.join(timeout=1.0)
+        
+        assert len(errors) == 1
+        assert queue.get() == 1
+    
+    def test_close_is_idempotent(self):
+        """Test that closing twice is harmless and shown in repr."""
+        queue = BoundedBlockingQueue(capacity=2)
+        queue.close()
+        queue.close()
+        
+        assert "closed" in repr(queue)
+
+
+class TestTimeouts:
+    """Test timeout-aware queue operations."""
+    
+    def test_get_timeout_expires(self):
+        """Test that get() raises QueueEmpty once its timeout expires."""
+        queue = BoundedBlockingQueue(capacity=2)
+        
+        start_time = time.monotonic()
+        with pytest.raises(QueueEmpty):
+            queue.get(timeout=0.05)
+        assert time.monotonic() - start_time >= 0.05
+    
+    def test_get_timeout_returns_late_item(self):
+        """Test that get() returns an item put before its timeout expires."""
+        queue = BoundedBlockingQueue(capacity=2)
+        timer = threading.Timer(0.05, queue.put, args=("late",))
+        timer.start()
+        
+        assert queue.get(timeout=2.0) == "late"
+        timer.join()
+    
+    def test_get_timeout_on_closed_queue(self):
+        """Test that a closed, drained queue raises QueueClosed rather than waiting."""
+        queue = BoundedBlockingQueue(capacity=2)
+        queue.close()
+        
+        with pytest.raises(QueueClosed):
+            queue.get(timeout=1.0)
+    
+    def test_put_timeout_expires(self):
+        """Test that put() raises QueueFull once its timeout expires on a full queue."""
+        queue = BoundedBlockingQueue(capacity=1)
+        queue.put(1)
+        
+        with pytest.raises(QueueFull):
+            queue.put(2, timeout=0.05)
+        assert queue.get() == 1
+    
+    def test_non_blocking_put_and_get(self):
+        """Test that block=False fails immediately instead of waiting."""
+        queue = BoundedBlockingQueue(capacity=1)
+        with pytest.raises(QueueEmpty):
+            queue.get(block=False)
+        
+        queue.put(1, block=False)
+        with pytest.raises(QueueFull):
+            queue.put(2, block=False)
+        assert queue.get(block=False) == 1
+    
+    def test_try_put_and_try_get(self):
+        """Test that try_put/try_get report failure instead of raising."""
+        queue = BoundedBlockingQueue(capacity=1)
+        
+        assert queue.try_get(default="none") == "none"
+        assert queue.try_put("a") is True
+        assert queue.try_put("b", timeout=0.01) is False
+        assert queue.try_get() == "a"
+    
+    def test_negative_timeout_rejected(self):
+        """Test that a negative timeout is rejected."""
+        queue = BoundedBlockingQueue(capacity=1)
+        
+        with pytest.raises(ValueError):
+            queue.get(timeout=-1)
+    
+    def test_deadline_survives_spurious_wakeups(self):
+        """Test that wakeups without an item do not extend the total wait."""
+        queue = BoundedBlockingQueue(capacity=1)
+        stop = threading.Event()
+        
+        def spurious_notifier():
+            while not stop.is_set():
+                with queue.not_empty:
+                    queue.not_empty.notify_all()
+                time.sleep(0.005)
+        
+        notifier = threading.Thread(target=spurious_notifier)
+        notifier.start()
+        start_time = time.monotonic()
+        try:
+            with pytest.raises(QueueEmpty):
+                queue.get(timeout=0.2)
+        finally:
+            stop.set()
+            notifier.join()
+        
+        assert 0.2 <= time.monotonic() - start_time < 1.0
+
+
+class TestSPSCQueue:
+    """Test suite for the single-producer/single-consumer ring buffer queue."""
+    
+    def test_init_with_invalid_capacity(self):
+        """Test queue initialization with invalid capacity."""
+        with pytest.raises(ValueError):
+            SPSCQueue(capacity=0)
+    
+    def test_fifo_ordering_with_wraparound(self):
+        """Test FIFO order is kept as indices wrap around the slot array."""
+        queue = SPSCQueue(capacity=3)
+        
+        for round_start in range(0, 30, 3):
+            for i in range(round_start, round_start + 3):
+                queue.put(i)
+            assert [queue.get() for _ in range(3)] == list(range(round_start, round_start + 3))
+        assert len(queue) == 0
+    
+    def test_get_releases_slot_reference(self):
+        """Test that consumed slots do not keep items alive."""
+        queue = SPSCQueue(capacity=2)
+        queue.put("item")
+        queue.get()
+        
+        assert queue._slots == [None, None]
+    
+    def test_repr(self):
+        """Test string representation of the queue."""
+        queue = SPSCQueue(capacity=4)
+        queue.put(1)
+        
+        assert repr(queue) == "SPSCQueue(capacity=4, size=1)"
+    
+    def test_blocking_when_full(self):
+        """Test that put() blocks when the ring is full."""
+        queue = SPSCQueue(capacity=1)
+        queue.put(1)
+        put_completed = threading.Event()
+        
+        def put_item():
+            queue.put(2)
+            put_completed.set()
+        
+        thread = threading.Thread(target=put_item)
+        thread.start()
+        time.sleep(0.1)
+        assert not put_completed.is_set()
+        
+        assert queue.get() == 1
+        thread.join(timeout=1.0)
+        assert put_completed.is_set()
+        assert queue.get() == 2
+    
+    def test_blocking_when_empty(self):
+        """Test that get() blocks when the ring is empty."""
+        queue = SPSCQueue(capacity=2)
+        item_retrieved = []
+        
+        thread = threading.Thread(target=lambda: item_retrieved.append(queue.get()))
+        thread.start()
+        time.sleep(0.1)
+        assert thread.is_alive()
+        
+        queue.put(42)
+        thread.join(timeout=1.0)
+        assert item_retrieved == [42]
+    
+    def test_single_producer_single_consumer(self):
+        """Test concurrent transfer with one producer and one consumer thread."""
+        queue = SPSCQueue(capacity=4)
+        source_items = list(range(5000))
+        consumed_items = []
+        
+        def producer():
+            for item in source_items:
+                queue.put(item)
+            queue.put(_SENTINEL)
+        
+        def consumer():
+            while True:
+                item = queue.get()
+                if item is _SENTINEL:
+                    break
+                consumed_items.append(item)
+        
+        prod_thread = threading.Thread(target=producer)
+        cons_thread = threading.Thread(target=consumer)
+        prod_thread.start()
+        cons_thread.start()
+        prod_thread.join(timeout=10.0)
+        cons_thread.join(timeout=10.0)
+        
+        assert consumed_items == source_items
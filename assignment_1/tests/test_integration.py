@@ -1,8 +1,12 @@
+import io
 import threading
 import time
-from assignment_1.blocking_queue import BoundedBlockingQueue
+from assignment_1.async_logger import AsyncLogger
+from assignment_1.blocking_queue import BoundedBlockingQueue, SPSCQueue
 from assignment_1.producer_consumer import Producer, Consumer
 
+_quiet = AsyncLogger(quiet=True, stream=io.StringIO())
+
 
 class TestEndToEnd:
     """End-to-end integration tests."""
@@ -14,8 +18,8 @@ class TestEndToEnd:
         destination = []
         lock = threading.Lock()
         
-        producer = Producer(source_data, queue)
-        consumer = Consumer(queue, destination, lock)
+        producer = Producer(source_data, queue, logger=_quiet)
+        consumer = Consumer(queue, destination, lock, logger=_quiet)
         
         # Run simulation
         producer.start()
@@ -37,8 +41,8 @@ class TestEndToEnd:
         destination = []
         lock = threading.Lock()
         
-        producer = Producer(source_data, queue)
-        consumer = Consumer(queue, destination, lock)
+        producer = Producer(source_data, queue, logger=_quiet)
+        consumer = Consumer(queue, destination, lock, logger=_quiet)
         
         start_time = time.time()
         producer.start()
@@ -66,8 +70,8 @@ class TestEndToEnd:
             destination = []
             lock = threading.Lock()
             
-            producer = Producer(source_data, queue)
-            consumer = Consumer(queue, destination, lock)
+            producer = Producer(source_data, queue, logger=_quiet)
+            consumer = Consumer(queue, destination, lock, logger=_quiet)
             
             producer.start()
             consumer.start()
@@ -89,14 +93,14 @@ class TestEndToEnd:
         lock = threading.Lock()
         
         def slow_producer():
-            producer = Producer(source_data, queue)
+            producer = Producer(source_data, queue, logger=_quiet)
             producer.start()
             # Add delay to simulate slow production
             time.sleep(0.01)
             producer.join()
         
         def fast_consumer():
-            consumer = Consumer(queue, destination, lock)
+            consumer = Consumer(queue, destination, lock, logger=_quiet)
             consumer.start()
             consumer.join()
         
@@ -121,8 +125,8 @@ class TestEndToEnd:
         lock = threading.Lock()
         
         # Create producer with valid data
-        producer = Producer([1, 2, 3], queue)
-        consumer = Consumer(queue, destination, lock)
+        producer = Producer([1, 2, 3], queue, logger=_quiet)
+        consumer = Consumer(queue, destination, lock, logger=_quiet)
         
         producer.start()
         consumer.start()
@@ -146,7 +150,7 @@ class TestEndToEnd:
         operations_lock = threading.Lock()
         
         def tracked_producer():
-            producer = Producer(source_data, queue)
+            producer = Producer(source_data, queue, logger=_quiet)
             producer.start()
             with operations_lock:
                 operations.append("Producer started")
@@ -155,7 +159,7 @@ class TestEndToEnd:
                 operations.append("Producer finished")
         
         def tracked_consumer():
-            consumer = Consumer(queue, destination, lock)
+            consumer = Consumer(queue, destination, lock, logger=_quiet)
             consumer.start()
             with operations_lock:
                 operations.append("Consumer started")
@@ -179,4 +183,20 @@ class TestEndToEnd:
         # Verify both threads completed
         assert "Producer finished" in operations
         assert "Consumer finished" in operations
-
+    
+    def test_spsc_queue_workflow(self):
+        """Test Producer and Consumer running over the SPSC ring buffer queue."""
+        queue = SPSCQueue(capacity=3)
+        source_data = list(range(500))
+        destination = []
+        lock = threading.Lock()
+        
+        producer = Producer(source_data, queue, logger=_quiet)
+        consumer = Consumer(queue, destination, lock, logger=_quiet)
+        
+        producer.start()
+        consumer.start()
+        producer.join(timeout=5.0)
+        consumer.join(timeout=5.0)
+        
+        assert destination == source_data
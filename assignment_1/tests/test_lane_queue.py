@@ -0,0 +1,129 @@
+import io
+import threading
+import time
+import pytest
+from assignment_1.async_logger import AsyncLogger
+from assignment_1.blocking_queue import QueueClosed, QueueEmpty, QueueFull
+from assignment_1.lane_queue import MultiLaneQueue
+from assignment_1.producer_consumer import Producer, Consumer
+
+_quiet = AsyncLogger(quiet=True, stream=io.StringIO())
+
+
+class TestMultiLaneQueue:
+    """Test suite for MultiLaneQueue."""
+    
+    def test_round_robin(self):
+        """Test that get() alternates between lanes."""
+        queue = MultiLaneQueue(lane_capacity=10)
+        first, second = queue.lane("a"), queue.lane("b")
+        first.put_many(["a1", "a2", "a3"])
+        second.put_many(["b1", "b2"])
+        
+        assert queue.get_many(10) == ["a1", "b1", "a2", "b2", "a3"]
+    
+    def test_weighted_round_robin(self):
+        """Test that a lane with weight 2 gets two turns per round."""
+        queue = MultiLaneQueue(lane_capacity=10)
+        heavy, light = queue.lane("heavy", weight=2), queue.lane("light")
+        heavy.put_many(range(4))
+        light.put_many(["x", "y"])
+        
+        assert [queue.get() for _ in range(6)] == [0, 1, "x", 2, 3, "y"]
+    
+    def test_empty_lanes_are_skipped(self):
+        """Test that an idle lane does not hold up the others."""
+        queue = MultiLaneQueue(lane_capacity=10)
+        queue.lane("idle")
+        busy = queue.lane("busy")
+        busy.put_many([1, 2])
+        
+        assert queue.get(timeout=1.0) == 1
+        assert queue.get(timeout=1.0) == 2
+    
+    def test_lanes_are_bounded_independently(self):
+        """Test that a full lane blocks only its own producer."""
+        queue = MultiLaneQueue(lane_capacity=2)
+        fast, slow = queue.lane("fast"), queue.lane("slow")
+        fast.put_many([1, 2])
+        
+        with pytest.raises(QueueFull):
+            fast.put(3, block=False)
+        assert slow.try_put("s") is True
+        assert queue.depths() == {"fast": 2, "slow": 1}
+        assert queue.qsize() == 3
+        assert queue.capacity == 4
+    
+    def test_closed_when_all_lanes_closed_and_drained(self):
+        """Test that QueueClosed is raised only after every lane is closed and empty."""
+        queue = MultiLaneQueue(lane_capacity=4)
+        first, second = queue.lane(), queue.lane()
+        first.put(1)
+        first.close()
+        
+        with pytest.raises(QueueClosed):
+            first.put(2)
+        assert queue.get() == 1
+        with pytest.raises(QueueEmpty):
+            queue.get(timeout=0.01)
+        
+        second.close()
+        with pytest.raises(QueueClosed):
+            queue.get()
+        assert "closed" in repr(queue)
+    
+    def test_close_wakes_blocked_consumer(self):
+        """Test that close() releases a consumer waiting on empty lanes."""
+        queue = MultiLaneQueue(lane_capacity=4)
+        queue.lane()
+        errors = []
+        
+        def consumer():
+            try:
+                queue.get()
+            except QueueClosed as e:
+                errors.append(e)
+        
+        thread = threading.Thread(target=consumer)
+        thread.start()
+        time.sleep(0.05)
+        queue.close()
+        thread.join(timeout=1.0)
+        
+        assert len(errors) == 1
+        with pytest.raises(QueueClosed):
+            queue.lane()
+    
+    def test_invalid_configuration(self):
+        """Test that bad capacities, weights and duplicate names are rejected."""
+        with pytest.raises(ValueError):
+            MultiLaneQueue(lane_capacity=0)
+        queue = MultiLaneQueue(lane_capacity=1)
+        queue.lane("a")
+        with pytest.raises(ValueError):
+            queue.lane("a")
+        with pytest.raises(ValueError):
+            queue.lane(weight=0)
+    
+    def test_fast_producer_cannot_starve_slow_one(self):
+        """Test that a slow producer's items are served promptly next to a fast producer."""
+        queue = MultiLaneQueue(lane_capacity=4)
+        fast = Producer(range(1000), queue.lane("fast"), on_finish="close", logger=_quiet)
+        slow_items = [f"slow-{i}" for i in range(5)]
+        
+        def slow_source():
+            for item in slow_items:
+                time.sleep(0.01)
+                yield item
+        
+        slow = Producer(slow_source(), queue.lane("slow"), on_finish="close", logger=_quiet)
+        consumer = Consumer(queue, logger=_quiet)
+        
+        for thread in (fast, slow, consumer):
+            thread.start()
+        for thread in (fast, slow, consumer):
+            thread.join(timeout=5.0)
+        
+        results = consumer.sink.items
+        assert sorted(item for item in results if isinstance(item, int)) == list(range(1000))
+        assert [item for item in results if isinstance(item, str)] == slow_items
@@ -0,0 +1,133 @@
+import io
+import threading
+import time
+import pytest
+from assignment_1.async_logger import AsyncLogger
+from assignment_1.blocking_queue import BoundedBlockingQueue
+from assignment_1.pipeline import Pipeline
+from assignment_1.sinks import CallbackSink, ListSink, QueueSink
+
+# Keep expected worker errors out of the test output
+_quiet = AsyncLogger(quiet=True, stream=io.StringIO())
+
+
+class TestPipeline:
+    """Test suite for Pipeline."""
+    
+    def test_single_stage(self):
+        """Test that a one-stage pipeline applies its function to every item."""
+        results = Pipeline(logger=_quiet).stage(lambda x: x * 2).run(range(10))
+        
+        assert results == [x * 2 for x in range(10)]
+    
+    def test_chained_stages(self):
+        """Test that items flow through every stage in declaration order."""
+        pipeline = (Pipeline(logger=_quiet)
+                    .stage(lambda x: x + 1, parallelism=2)
+                    .stage(lambda x: x * 10, parallelism=3, capacity=4)
+                    .stage(str))
+        results = pipeline.run(range(100))
+        
+        assert sorted(results, key=int) == [str((x + 1) * 10) for x in range(100)]
+    
+    def test_single_worker_preserves_order(self):
+        """Test that output order matches input order when every stage has one worker."""
+        pipeline = Pipeline(logger=_quiet).stage(lambda x: x + 1).stage(lambda x: x - 1)
+        
+        assert pipeline.run(range(50)) == list(range(50))
+    
+    def test_custom_sink(self):
+        """Test that the last stage writes into a given sink."""
+        sink = ListSink()
+        results = Pipeline(logger=_quiet).stage(lambda x: -x).run([1, 2, 3], sink=sink)
+        
+        assert results == []
+        assert sink.items == [-1, -2, -3]
+    
+    def test_stage_error_propagates(self):
+        """Test that an exception in a middle stage stops the pipeline and is re-raised."""
+        def fail_on_seven(x):
+            if x == 7:
+                raise RuntimeError("bad item")
+            return x
+        
+        pipeline = (Pipeline(logger=_quiet)
+                    .stage(fail_on_seven, parallelism=2, capacity=2)
+                    .stage(lambda x: x, parallelism=2, capacity=2))
+        with pytest.raises(RuntimeError, match="bad item"):
+            pipeline.run(range(1000))
+    
+    def test_sink_error_propagates(self):
+        """Test that an exception in the final sink stops every stage instead of hanging run()."""
+        def fail_on_five(item):
+            if item == 5:
+                raise IOError("sink failed")
+        
+        pipeline = (Pipeline(logger=_quiet)
+                    .stage(lambda x: x, parallelism=2, capacity=2)
+                    .stage(lambda x: x, capacity=2))
+        errors = []
+        
+        def run():
+            try:
+                pipeline.run(range(1000), sink=CallbackSink(fail_on_five))
+            except Exception as e:
+                errors.append(e)
+        
+        thread = threading.Thread(target=run, daemon=True)
+        thread.start()
+        thread.join(timeout=5.0)
+        
+        assert not thread.is_alive()
+        assert len(errors) == 1 and isinstance(errors[0], IOError)
+    
+    def test_source_error_propagates(self):
+        """Test that an error raised by the source iterable is re-raised."""
+        def source():
+            yield 1
+            raise OSError("read failed")
+        
+        with pytest.raises(OSError, match="read failed"):
+            Pipeline(logger=_quiet).stage(lambda x: x).run(source())
+    
+    def test_stats(self):
+        """Test that per-stage stats count items and identify the slow stage."""
+        def slow(x):
+            time.sleep(0.002)
+            return x
+        
+        pipeline = (Pipeline(logger=_quiet)
+                    .stage(lambda x: x, name="fast")
+                    .stage(slow, name="slow"))
+        pipeline.run(range(30))
+        stats = pipeline.stats()
+        
+        assert [stage['name'] for stage in stats] == ["fast", "slow"]
+        assert all(stage['items'] == 30 for stage in stats)
+        assert stats[1]['busy_seconds'] >= 30 * 0.002
+        assert stats[1]['items_per_second'] > 0
+        assert stats[0]['input_queue']['high_water_depth'] <= stats[0]['capacity']
+        assert pipeline.bottleneck() == "slow"
+    
+    def test_invalid_configuration(self):
+        """Test that empty pipelines and non-positive stage settings are rejected."""
+        with pytest.raises(ValueError):
+            Pipeline().run([1])
+        with pytest.raises(ValueError):
+            Pipeline().stage(str, parallelism=0)
+        with pytest.raises(ValueError):
+            Pipeline().stage(str, capacity=0)
+        assert Pipeline().bottleneck() is None
+
+
+class TestQueueSink:
+    """Test suite for QueueSink."""
+    
+    def test_forwards_items(self):
+        """Test that written items are put on the target queue."""
+        queue = BoundedBlockingQueue(10)
+        sink = QueueSink(queue)
+        sink.write(1)
+        sink.write_many([2, 3])
+        
+        assert queue.get_many(10) == [1, 2, 3]
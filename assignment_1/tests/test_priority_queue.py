@@ -0,0 +1,182 @@
+import io
+import threading
+import time
+import pytest
+from assignment_1.async_logger import AsyncLogger
+from assignment_1.blocking_queue import QueueClosed, QueueEmpty, QueueFull
+from assignment_1.priority_queue import BoundedPriorityQueue
+from assignment_1.producer_consumer import Producer, Consumer, _SENTINEL
+
+_quiet = AsyncLogger(quiet=True, stream=io.StringIO())
+
+
+class TestBoundedPriorityQueue:
+    """Test suite for BoundedPriorityQueue."""
+    
+    def test_most_urgent_first(self):
+        """Test that lower priority numbers are dequeued first."""
+        queue = BoundedPriorityQueue(capacity=10)
+        queue.put("bulk", priority=5)
+        queue.put("interactive", priority=0)
+        queue.put("normal", priority=2)
+        
+        assert [queue.get() for _ in range(3)] == ["interactive", "normal", "bulk"]
+    
+    def test_fifo_within_priority(self):
+        """Test that items of equal priority keep insertion order."""
+        queue = BoundedPriorityQueue(capacity=10)
+        for i in range(5):
+            queue.put(i, priority=1)
+        
+        assert queue.get_many(10) == [0, 1, 2, 3, 4]
+    
+    def test_unorderable_items(self):
+        """Test that items never need to be comparable with each other."""
+        queue = BoundedPriorityQueue(capacity=4)
+        queue.put({"a": 1})
+        queue.put({"b": 2})
+        
+        assert queue.get() == {"a": 1}
+    
+    def test_key_derives_priority(self):
+        """Test that key(item) sets the priority when none is passed."""
+        queue = BoundedPriorityQueue(capacity=4, key=lambda item: item[0])
+        queue.put((3, "low"))
+        queue.put((1, "high"))
+        
+        assert queue.get() == (1, "high")
+    
+    def test_sentinel_sorts_last(self):
+        """Test that _SENTINEL is dequeued only after all queued work."""
+        queue = BoundedPriorityQueue(capacity=4)
+        queue.put(_SENTINEL)
+        queue.put("bulk", priority=100)
+        
+        assert queue.get() == "bulk"
+        assert queue.get() is _SENTINEL
+    
+    def test_blocks_when_full(self):
+        """Test that put() blocks at capacity and resumes after a get()."""
+        queue = BoundedPriorityQueue(capacity=1)
+        queue.put(1)
+        done = threading.Event()
+        
+        def producer():
+            queue.put(2)
+            done.set()
+        
+        thread = threading.Thread(target=producer)
+        thread.start()
+        assert not done.wait(timeout=0.1)
+        
+        assert queue.get() == 1
+        assert done.wait(timeout=1.0)
+        thread.join()
+    
+    def test_timeouts_and_try_variants(self):
+        """Test the timeout and non-blocking contract shared with BoundedBlockingQueue."""
+        queue = BoundedPriorityQueue(capacity=1)
+        with pytest.raises(QueueEmpty):
+            queue.get(timeout=0.01)
+        assert queue.try_get(default="none") == "none"
+        
+        assert queue.try_put("a") is True
+        with pytest.raises(QueueFull):
+            queue.put("b", block=False)
+        assert queue.try_put("b", timeout=0.01) is False
+        assert queue.get_many(4, timeout=0.01) == ["a"]
+        assert queue.get_many(4, timeout=0.01) == []
+    
+    def test_close(self):
+        """Test that close() rejects puts and raises QueueClosed once drained."""
+        queue = BoundedPriorityQueue(capacity=2)
+        queue.put(1)
+        queue.close()
+        
+        with pytest.raises(QueueClosed):
+            queue.put(2)
+        assert queue.get() == 1
+        with pytest.raises(QueueClosed):
+            queue.get()
+        assert "closed" in repr(queue)
+    
+    def test_invalid_configuration(self):
+        """Test that bad capacities and reservations are rejected."""
+        with pytest.raises(ValueError):
+            BoundedPriorityQueue(capacity=0)
+        with pytest.raises(ValueError):
+            BoundedPriorityQueue(capacity=4, reserved={0: 4})
+        with pytest.raises(ValueError):
+            BoundedPriorityQueue(capacity=4, reserved={0: -1})
+
+
+class TestReservedCapacity:
+    """Tests for per-class reserved capacity."""
+    
+    def test_bulk_cannot_use_reserved_slots(self):
+        """Test that bulk items stop short of the slots reserved for urgent ones."""
+        queue = BoundedPriorityQueue(capacity=4, reserved={0: 2})
+        queue.put("bulk-1", priority=1)
+        queue.put("bulk-2", priority=1)
+        
+        assert queue.try_put("bulk-3", priority=1) is False
+        assert queue.try_put("urgent-1", priority=0) is True
+        assert queue.try_put("urgent-2", priority=0) is True
+        assert queue.try_put("urgent-3", priority=0) is False
+    
+    def test_urgent_put_never_blocks_behind_bulk(self):
+        """Test that a bulk producer blocked at its limit does not delay urgent puts."""
+        queue = BoundedPriorityQueue(capacity=3, reserved={0: 1}, key=lambda item: 1)
+        bulk = Producer(range(10), queue, on_finish="none", logger=_quiet)
+        bulk.start()
+        time.sleep(0.1)  # Bulk producer is now blocked at its limit
+        
+        start_time = time.monotonic()
+        queue.put("urgent", priority=0)
+        assert time.monotonic() - start_time < 0.1
+        assert queue.get() == "urgent"
+        
+        queue.close()
+        bulk.join(timeout=5.0)
+    
+    def test_freed_slot_wakes_eligible_class(self):
+        """Test that a get() wakes a waiting urgent producer even when bulk is also waiting."""
+        queue = BoundedPriorityQueue(capacity=2, reserved={0: 1})
+        queue.put("bulk", priority=1)
+        queue.put("urgent", priority=0)
+        results = []
+        
+        def put(item, priority):
+            try:
+                queue.put(item, priority=priority)
+                results.append(item)
+            except QueueClosed:
+                pass
+        
+        threads = [threading.Thread(target=put, args=("bulk-2", 1)),
+                   threading.Thread(target=put, args=("urgent-2", 0))]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.1)
+        
+        assert queue.get() == "urgent"  # Frees a reserved slot only
+        threads[1].join(timeout=1.0)
+        assert results == ["urgent-2"]
+        
+        queue.close()
+        threads[0].join(timeout=1.0)
+    
+    def test_with_producer_and_consumer(self):
+        """Test end-to-end transfer with key-based priorities and sentinel shutdown."""
+        queue = BoundedPriorityQueue(capacity=4, reserved={0: 1}, key=lambda item: item % 2)
+        destination = []
+        lock = threading.Lock()
+        producer = Producer(range(50), queue, logger=_quiet)
+        consumer = Consumer(queue, destination, lock, logger=_quiet)
+        
+        producer.start()
+        consumer.start()
+        producer.join(timeout=5.0)
+        consumer.join(timeout=5.0)
+        
+        assert sorted(destination) == list(range(50))
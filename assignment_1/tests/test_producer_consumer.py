@@ -1,7 +1,13 @@
+import io
+import pytest
 import threading
 import time
-from assignment_1.blocking_queue import BoundedBlockingQueue
+from assignment_1.async_logger import AsyncLogger
+from assignment_1.blocking_queue import BoundedBlockingQueue, QueueEmpty, QueueFull
 from assignment_1.producer_consumer import Producer, Consumer, _SENTINEL
+from assignment_1.sinks import BatchCallbackSink
+
+_quiet = AsyncLogger(quiet=True, stream=io.StringIO())
 
 
 class TestProducer:
@@ -12,7 +18,7 @@ class TestProducer:
         queue = BoundedBlockingQueue(capacity=10)
         source_data = [1, 2, 3, 4, 5]
         
-        producer = Producer(source_data=source_data, queue=queue)
+        producer = Producer(source_data=source_data, queue=queue, logger=_quiet)
         producer.start()
         producer.join(timeout=5.0)
         
@@ -28,7 +34,7 @@ class TestProducer:
         queue = BoundedBlockingQueue(capacity=5)
         source_data = []
         
-        producer = Producer(source_data=source_data, queue=queue)
+        producer = Producer(source_data=source_data, queue=queue, logger=_quiet)
         producer.start()
         producer.join(timeout=5.0)
         
@@ -60,7 +66,7 @@ class TestProducer:
                 raise StopIteration
         
         source_data = ErrorSource()
-        producer = Producer(source_data=source_data, queue=queue)
+        producer = Producer(source_data=source_data, queue=queue, logger=_quiet)
         producer.start()
         producer.join(timeout=5.0)
         
@@ -81,7 +87,7 @@ class TestProducer:
         source_data = [1, 2, 3]
         
         # This will trigger the inner except block (lines 60-61)
-        producer = Producer(source_data=source_data, queue=queue)
+        producer = Producer(source_data=source_data, queue=queue, logger=_quiet)
         producer.start()
         producer.join(timeout=5.0)
         
@@ -105,7 +111,7 @@ class TestConsumer:
         queue.put(_SENTINEL)
         
         consumer = Consumer(queue=queue, destination=destination, 
-                          destination_lock=lock)
+                          destination_lock=lock, logger=_quiet)
         consumer.start()
         consumer.join(timeout=5.0)
         
@@ -119,7 +125,7 @@ class TestConsumer:
         lock = threading.Lock()
         
         consumer = Consumer(queue=queue, destination=destination,
-                          destination_lock=lock)
+                          destination_lock=lock, logger=_quiet)
         consumer.start()
         
         # Consumer should be waiting
@@ -147,7 +153,7 @@ class TestConsumer:
         queue.put(_SENTINEL)
         
         consumer = Consumer(queue=queue, destination=destination,
-                          destination_lock=lock)
+                          destination_lock=lock, logger=_quiet)
         consumer.start()
         consumer.join(timeout=2.0)
         
@@ -168,7 +174,7 @@ class TestConsumer:
         
         # This will trigger the exception handler (lines 103-104)
         consumer = Consumer(queue=queue, destination=destination,
-                          destination_lock=lock)
+                          destination_lock=lock, logger=_quiet)
         consumer.start()
         consumer.join(timeout=5.0)
         
@@ -188,9 +194,9 @@ class TestProducerConsumerIntegration:
         destination = []
         lock = threading.Lock()
         
-        producer = Producer(source_data=source_data, queue=queue)
+        producer = Producer(source_data=source_data, queue=queue, logger=_quiet)
         consumer = Consumer(queue=queue, destination=destination,
-                          destination_lock=lock)
+                          destination_lock=lock, logger=_quiet)
         
         producer.start()
         consumer.start()
@@ -210,8 +216,8 @@ class TestProducerConsumerIntegration:
         destination = []
         lock = threading.Lock()
         
-        producer = Producer(source_data, queue)
-        consumer = Consumer(queue, destination, lock)
+        producer = Producer(source_data, queue, logger=_quiet)
+        consumer = Consumer(queue, destination, lock, logger=_quiet)
         
         # Start consumer first (will block waiting for items)
         consumer.start()
@@ -235,9 +241,9 @@ class TestProducerConsumerIntegration:
         destination = []
         lock = threading.Lock()
         
-        producer = Producer(source_data=source_data, queue=queue)
+        producer = Producer(source_data=source_data, queue=queue, logger=_quiet)
         consumer = Consumer(queue=queue, destination=destination,
-                          destination_lock=lock)
+                          destination_lock=lock, logger=_quiet)
         
         producer.start()
         consumer.start()
@@ -250,3 +256,263 @@ class TestProducerConsumerIntegration:
         assert destination == source_data  # Preserve order including None
         assert None in destination  # None values are present
 
+
+
+class TestBatchMode:
+    """Tests for Producer and Consumer running in batch mode."""
+    
+    def test_batch_producer_consumer(self):
+        """Test end-to-end transfer with batched producer and consumer."""
+        queue = BoundedBlockingQueue(capacity=8)
+        source_data = list(range(100))
+        destination = []
+        lock = threading.Lock()
+        
+        producer = Producer(source_data, queue, batch_size=16, logger=_quiet)
+        consumer = Consumer(queue, destination, lock, batch_size=16, logger=_quiet)
+        
+        producer.start()
+        consumer.start()
+        producer.join(timeout=5.0)
+        consumer.join(timeout=5.0)
+        
+        assert producer.items_produced == len(source_data)
+        assert consumer.items_consumed == len(source_data)
+        assert destination == source_data
+    
+    def test_batch_consumer_with_single_item_producer(self):
+        """Test that a batched consumer works with an unbatched producer."""
+        queue = BoundedBlockingQueue(capacity=5)
+        source_data = list(range(30))
+        destination = []
+        lock = threading.Lock()
+        
+        producer = Producer(source_data, queue, logger=_quiet)
+        consumer = Consumer(queue, destination, lock, batch_size=4, logger=_quiet)
+        
+        producer.start()
+        consumer.start()
+        producer.join(timeout=5.0)
+        consumer.join(timeout=5.0)
+        
+        assert destination == source_data
+    
+    def test_batch_consumer_requeues_extra_sentinels(self):
+        """Test that surplus sentinels in a batch are put back for other consumers."""
+        queue = BoundedBlockingQueue(capacity=10)
+        queue.put_many([1, _SENTINEL, 2, _SENTINEL])
+        destination = []
+        lock = threading.Lock()
+        
+        consumer = Consumer(queue, destination, lock, batch_size=10, logger=_quiet)
+        consumer.start()
+        consumer.join(timeout=5.0)
+        
+        assert destination == [1, 2]
+        assert queue.get() is _SENTINEL
+    
+    def test_invalid_batch_size(self):
+        """Test that non-positive batch sizes are rejected."""
+        queue = BoundedBlockingQueue(capacity=5)
+        with pytest.raises(ValueError):
+            Producer([1], queue, batch_size=0)
+        with pytest.raises(ValueError):
+            Consumer(queue, [], threading.Lock(), batch_size=0)
+    
+    def test_invalid_on_finish(self):
+        """Test that unknown completion modes are rejected."""
+        with pytest.raises(ValueError):
+            Producer([1], BoundedBlockingQueue(capacity=1), on_finish="explode")
+
+
+class TestLingerBatching:
+    """Tests for Consumer micro-batching with a linger deadline."""
+    
+    def test_full_batches_flush_immediately(self):
+        """Test that a burst of items is handed over in batches of batch_size."""
+        queue = BoundedBlockingQueue(capacity=32)
+        batches = []
+        consumer = Consumer(queue, sink=BatchCallbackSink(batches.append),
+                            batch_size=10, linger_ms=5000, logger=_quiet)
+        
+        queue.put_many(list(range(25)))
+        queue.put(_SENTINEL)
+        consumer.start()
+        consumer.join(timeout=5.0)
+        
+        assert [len(batch) for batch in batches] == [10, 10, 5]
+        assert sum(batches, []) == list(range(25))
+        assert consumer.items_consumed == 25
+    
+    def test_partial_batch_flushes_after_linger(self):
+        """Test that a partial batch is written once linger_ms has passed."""
+        queue = BoundedBlockingQueue(capacity=8)
+        batches = []
+        flushed = threading.Event()
+        
+        def on_batch(batch):
+            batches.append(batch)
+            flushed.set()
+        
+        consumer = Consumer(queue, sink=BatchCallbackSink(on_batch), batch_size=100, linger_ms=50,
+                            logger=_quiet)
+        consumer.start()
+        queue.put_many([1, 2, 3])
+        
+        assert flushed.wait(timeout=2.0)
+        assert batches == [[1, 2, 3]]
+        
+        queue.close()
+        consumer.join(timeout=5.0)
+        assert not consumer.is_alive()
+    
+    def test_linger_with_producer_and_close(self):
+        """Test end-to-end transfer in linger mode with close-based shutdown."""
+        queue = BoundedBlockingQueue(capacity=4)
+        batches = []
+        producer = Producer(range(100), queue, on_finish="close", logger=_quiet)
+        consumer = Consumer(queue, sink=BatchCallbackSink(batches.append),
+                            batch_size=8, linger_ms=1, logger=_quiet)
+        
+        producer.start()
+        consumer.start()
+        producer.join(timeout=5.0)
+        consumer.join(timeout=5.0)
+        
+        assert sum(batches, []) == list(range(100))
+        assert all(len(batch) <= 8 for batch in batches)
+    
+    def test_negative_linger_rejected(self):
+        """Test that a negative linger_ms is rejected."""
+        with pytest.raises(ValueError):
+            Consumer(BoundedBlockingQueue(capacity=1), linger_ms=-1)
+
+
+class TestTimeoutPolicies:
+    """Tests for Producer and Consumer put/get timeout policies."""
+    
+    def test_producer_sheds_load(self):
+        """Test that a producer drops items it cannot enqueue within put_timeout."""
+        queue = BoundedBlockingQueue(capacity=2)
+        producer = Producer(range(5), queue, on_finish="none", put_timeout=0.01, logger=_quiet)
+        
+        producer.start()
+        producer.join(timeout=5.0)
+        
+        assert producer.items_produced == 2
+        assert producer.items_dropped == 3
+        assert producer.timeouts == 3
+        assert producer.error is None
+    
+    def test_producer_retries_then_raises(self):
+        """Test that on_timeout='raise' fails the producer after its retries."""
+        queue = BoundedBlockingQueue(capacity=1)
+        producer = Producer([1, 2], queue, on_finish="none", put_timeout=0.01,
+                            on_timeout="raise", max_retries=2, logger=_quiet)
+        
+        producer.start()
+        producer.join(timeout=5.0)
+        
+        assert isinstance(producer.error, QueueFull)
+        assert producer.timeouts == 3
+        assert producer.items_produced == 1
+    
+    def test_producer_retry_succeeds_when_space_frees(self):
+        """Test that a retried put succeeds once a consumer frees a slot."""
+        queue = BoundedBlockingQueue(capacity=1)
+        queue.put("blocker")
+        producer = Producer([1], queue, on_finish="none", put_timeout=0.02, max_retries=100,
+                            logger=_quiet)
+        
+        producer.start()
+        time.sleep(0.1)
+        assert queue.get() == "blocker"
+        producer.join(timeout=5.0)
+        
+        assert producer.items_produced == 1
+        assert producer.items_dropped == 0
+        assert queue.get() == 1
+    
+    def test_consumer_stops_when_idle(self):
+        """Test that a consumer with get_timeout exits when the queue stays empty."""
+        queue = BoundedBlockingQueue(capacity=5)
+        queue.put_many([1, 2])
+        consumer = Consumer(queue, get_timeout=0.02, max_retries=1, logger=_quiet)
+        
+        consumer.start()
+        consumer.join(timeout=5.0)
+        
+        assert not consumer.is_alive()
+        assert consumer.sink.items == [1, 2]
+        assert consumer.timeouts == 2
+        assert consumer.error is None
+    
+    def test_consumer_raises_on_timeout(self):
+        """Test that on_timeout='raise' records QueueEmpty as the consumer error."""
+        queue = BoundedBlockingQueue(capacity=5)
+        consumer = Consumer(queue, batch_size=4, get_timeout=0.01, on_timeout="raise",
+                            logger=_quiet)
+        
+        consumer.start()
+        consumer.join(timeout=5.0)
+        
+        assert isinstance(consumer.error, QueueEmpty)
+    
+    def test_invalid_timeout_policies(self):
+        """Test that unknown policies and conflicting options are rejected."""
+        queue = BoundedBlockingQueue(capacity=1)
+        with pytest.raises(ValueError):
+            Producer([], queue, on_timeout="stop")
+        with pytest.raises(ValueError):
+            Producer([], queue, batch_size=4, put_timeout=1.0)
+        with pytest.raises(ValueError):
+            Consumer(queue, on_timeout="shed")
+        with pytest.raises(ValueError):
+            Consumer(queue, max_retries=-1)
+
+
+class TestCloseShutdown:
+    """Tests for shutting down consumers by closing the queue."""
+    
+    def test_single_producer_closes_queue_for_many_consumers(self):
+        """Test that on_finish="close" releases every consumer without sentinels."""
+        queue = BoundedBlockingQueue(capacity=4)
+        source_data = list(range(200))
+        destination = []
+        lock = threading.Lock()
+        
+        producer = Producer(source_data, queue, on_finish="close", logger=_quiet)
+        consumers = [Consumer(queue, destination, lock, logger=_quiet) for _ in range(4)]
+        consumers.append(Consumer(queue, destination, lock, batch_size=8, logger=_quiet))
+        
+        producer.start()
+        for consumer in consumers:
+            consumer.start()
+        producer.join(timeout=5.0)
+        for consumer in consumers:
+            consumer.join(timeout=5.0)
+        
+        assert not any(consumer.is_alive() for consumer in consumers)
+        assert sorted(destination) == source_data
+        assert sum(consumer.items_consumed for consumer in consumers) == len(source_data)
+    
+    def test_many_producers_then_close(self):
+        """Test M producers and N consumers shut down by closing after producers join."""
+        queue = BoundedBlockingQueue(capacity=4)
+        destination = []
+        lock = threading.Lock()
+        
+        producers = [Producer(list(range(i * 50, (i + 1) * 50)), queue, on_finish="none",
+                              logger=_quiet)
+                     for i in range(3)]
+        consumers = [Consumer(queue, destination, lock, logger=_quiet) for _ in range(3)]
+        
+        for thread in producers + consumers:
+            thread.start()
+        for producer in producers:
+            producer.join(timeout=5.0)
+        queue.close()
+        for consumer in consumers:
+            consumer.join(timeout=5.0)
+        
+        assert sorted(destination) == list(range(150))
@@ -0,0 +1,125 @@
+import io
+import threading
+import time
+import pytest
+from assignment_1.async_logger import AsyncLogger
+from assignment_1.blocking_queue import BoundedBlockingQueue
+from assignment_1.producer_consumer import Producer, Consumer
+from assignment_1.queue_stats import WaitHistogram, TimedLock
+
+_quiet = AsyncLogger(quiet=True, stream=io.StringIO())
+
+
+class TestQueueMetrics:
+    """Test suite for BoundedBlockingQueue instrumentation."""
+    
+    def test_stats_disabled_by_default(self):
+        """Test that stats() is unavailable unless metrics are enabled."""
+        queue = BoundedBlockingQueue(capacity=2)
+        with pytest.raises(RuntimeError):
+            queue.stats()
+    
+    def test_counts_and_depth(self):
+        """Test put/get counts, current depth and high-water depth."""
+        queue = BoundedBlockingQueue(capacity=10, metrics=True)
+        queue.put_many([1, 2, 3])
+        queue.put(4)
+        queue.get()
+        queue.get_many(2)
+        
+        stats = queue.stats()
+        assert stats['capacity'] == 10
+        assert stats['puts'] == 4
+        assert stats['gets'] == 3
+        assert stats['depth'] == 1
+        assert stats['high_water_depth'] == 4
+    
+    def test_consumer_wait_time_recorded(self):
+        """Test that time blocked in not_empty.wait() is recorded for consumers."""
+        queue = BoundedBlockingQueue(capacity=2, metrics=True)
+        thread = threading.Thread(target=queue.get)
+        thread.start()
+        time.sleep(0.1)
+        queue.put(1)
+        thread.join(timeout=1.0)
+        
+        get_wait = queue.stats()['get_wait']
+        assert get_wait['count'] >= 1
+        assert get_wait['total_seconds'] >= 0.05
+        assert sum(get_wait['histogram'].values()) == get_wait['count']
+        assert queue.stats()['put_wait']['count'] == 0
+    
+    def test_producer_wait_time_recorded(self):
+        """Test that time blocked in not_full.wait() is recorded for producers."""
+        queue = BoundedBlockingQueue(capacity=1, metrics=True)
+        queue.put(1)
+        thread = threading.Thread(target=queue.put, args=(2,))
+        thread.start()
+        time.sleep(0.1)
+        queue.get()
+        thread.join(timeout=1.0)
+        
+        put_wait = queue.stats()['put_wait']
+        assert put_wait['count'] >= 1
+        assert put_wait['total_seconds'] >= 0.05
+    
+    def test_lock_hold_time_recorded(self):
+        """Test lock acquisition and hold-time counters."""
+        queue = BoundedBlockingQueue(capacity=5, metrics=True)
+        queue.put(1)
+        queue.get()
+        
+        lock_stats = queue.stats()['lock']
+        assert lock_stats['acquisitions'] >= 2
+        assert lock_stats['hold_seconds'] > 0
+    
+    def test_instrumented_queue_in_pipeline(self):
+        """Test that metrics stay consistent under a concurrent producer/consumer run."""
+        queue = BoundedBlockingQueue(capacity=3, metrics=True)
+        source_data = list(range(500))
+        destination = []
+        
+        producer = Producer(source_data, queue, on_finish="close", logger=_quiet)
+        consumer = Consumer(queue, destination, threading.Lock(), logger=_quiet)
+        producer.start()
+        consumer.start()
+        producer.join(timeout=5.0)
+        consumer.join(timeout=5.0)
+        
+        stats = queue.stats()
+        assert destination == source_data
+        assert stats['puts'] == stats['gets'] == len(source_data)
+        assert stats['depth'] == 0
+        assert stats['high_water_depth'] <= 3
+
+
+class TestMetricPrimitives:
+    """Test the histogram and timed lock building blocks."""
+    
+    def test_histogram_buckets(self):
+        """Test that waits land in log-scale buckets."""
+        histogram = WaitHistogram()
+        for seconds in (5e-6, 5e-4, 5e-4, 2.0):
+            histogram.record(seconds)
+        
+        snapshot = histogram.snapshot()
+        assert snapshot['count'] == 4
+        assert snapshot['histogram']['<=1e-05s'] == 1
+        assert snapshot['histogram']['<=0.001s'] == 2
+        assert snapshot['histogram']['>1s'] == 1
+    
+    def test_timed_lock_counts_contention(self):
+        """Test that acquisitions which had to wait are counted as contended."""
+        lock = TimedLock()
+        lock.acquire()
+        assert not lock.acquire(blocking=False)
+        
+        thread = threading.Thread(target=lambda: (lock.acquire(), lock.release()))
+        thread.start()
+        time.sleep(0.05)
+        lock.release()
+        thread.join(timeout=1.0)
+        
+        assert lock.acquisitions == 2
+        assert lock.contended == 1
+        assert not lock.locked()
@@ -0,0 +1,192 @@
+import multiprocessing
+import operator
+import threading
+import pytest
+from assignment_1.blocking_queue import QueueClosed
+from assignment_1.shm_queue import SharedMemoryQueue
+from assignment_1.producer_consumer import ProcessProducer, ProcessConsumer, _SENTINEL
+
+
+@pytest.fixture
+def shm_queue():
+    """Shared-memory queue that is unlinked after the test."""
+    with SharedMemoryQueue(capacity=4, slot_size=256) as queue:
+        yield queue
+
+
+class TestSharedMemoryQueue:
+    """Test suite for SharedMemoryQueue basic operations."""
+    
+    def test_init_with_invalid_arguments(self):
+        """Test queue initialization with invalid capacity or slot size."""
+        with pytest.raises(ValueError):
+            SharedMemoryQueue(capacity=0)
+        with pytest.raises(ValueError):
+            SharedMemoryQueue(capacity=1, slot_size=0)
+    
+    def test_put_and_get_round_trip(self, shm_queue):
+        """Test that picklable objects round-trip in FIFO order."""
+        items = [1, "two", (3, 4.0), {"five": [5]}, None]
+        for item in items[:4]:
+            shm_queue.put(item)
+        assert [shm_queue.get() for _ in range(4)] == items[:4]
+        
+        shm_queue.put(None)
+        assert shm_queue.get() is None
+    
+    def test_sentinel_is_preserved(self, shm_queue):
+        """Test that _SENTINEL decodes to the local sentinel object."""
+        shm_queue.put(_SENTINEL)
+        assert shm_queue.get() is _SENTINEL
+    
+    def test_oversized_item_rejected(self, shm_queue):
+        """Test that items larger than a slot are rejected before enqueueing."""
+        with pytest.raises(ValueError):
+            shm_queue.put(b"x" * 1024)
+        assert shm_queue.qsize() == 0
+    
+    def test_ring_wraparound(self, shm_queue):
+        """Test FIFO order across many wraparounds of the ring."""
+        for i in range(50):
+            shm_queue.put(i)
+            assert shm_queue.get() == i
+    
+    def test_blocking_when_full(self, shm_queue):
+        """Test that put() blocks when the ring is full."""
+        for i in range(4):
+            shm_queue.put(i)
+        put_completed = threading.Event()
+        
+        def put_item():
+            shm_queue.put(4)
+            put_completed.set()
+        
+        thread = threading.Thread(target=put_item)
+        thread.start()
+        assert not put_completed.wait(0.1)
+        
+        assert shm_queue.get() == 0
+        thread.join(timeout=1.0)
+        assert put_completed.is_set()
+    
+    def test_repr(self, shm_queue):
+        """Test string representation of the queue."""
+        shm_queue.put(1)
+        assert "size=1" in repr(shm_queue)
+    
+    def test_close_drains_then_raises(self, shm_queue):
+        """Test that a closed queue rejects puts and drains buffered items before raising."""
+        shm_queue.put(1)
+        shm_queue.close()
+        shm_queue.close()
+        
+        assert shm_queue.closed
+        assert "closed" in repr(shm_queue)
+        with pytest.raises(QueueClosed):
+            shm_queue.put(2)
+        assert shm_queue.get() == 1
+        with pytest.raises(QueueClosed):
+            shm_queue.get()
+    
+    def test_close_wakes_blocked_get(self, shm_queue):
+        """Test that close() releases a get() waiting on an empty queue."""
+        errors = []
+        
+        def get_item():
+            try:
+                shm_queue.get()
+            except QueueClosed as e:
+                errors.append(e)
+        
+        thread = threading.Thread(target=get_item)
+        thread.start()
+        thread.join(timeout=0.1)
+        assert thread.is_alive()
+        
+        shm_queue.close()
+        thread.join(timeout=1.0)
+        assert len(errors) == 1
+    
+    def test_only_owner_can_unlink(self, shm_queue):
+        """Test that an attached (unpickled) copy cannot destroy the segment."""
+        attached = SharedMemoryQueue.__new__(SharedMemoryQueue)
+        attached.__setstate__(shm_queue.__getstate__())
+        try:
+            with pytest.raises(RuntimeError):
+                attached.unlink()
+        finally:
+            attached.detach()
+
+
+class TestProcessProducerConsumer:
+    """Integration tests for process-based producers and consumers."""
+    
+    @pytest.mark.parametrize("start_method", ["fork", "spawn"])
+    def test_processes_transfer_all_items(self, start_method):
+        """Test producer and consumer processes transferring through shared memory."""
+        context = multiprocessing.get_context(start_method)
+        source_data = list(range(200))
+        results = context.Queue()
+        
+        with SharedMemoryQueue(capacity=8, slot_size=64, context=context) as queue:
+            producer = ProcessProducer(source_data, queue, context=context)
+            consumer = ProcessConsumer(queue, handler=operator.neg, results=results,
+                                       context=context)
+            producer.start()
+            consumer.start()
+            
+            received = [results.get(timeout=10.0) for _ in source_data]
+            producer.join(timeout=10.0)
+            consumer.join(timeout=10.0)
+        
+        assert isinstance(producer, context.Process) and isinstance(consumer, context.Process)
+        assert producer._popen.method == consumer._popen.method == start_method
+        assert received == [-item for item in source_data]
+        assert producer.items_produced == len(source_data)
+        assert consumer.items_consumed == len(source_data)
+    
+    def test_multiple_consumer_processes(self):
+        """Test that several consumer processes share the work without loss."""
+        context = multiprocessing.get_context("fork")
+        source_data = list(range(300))
+        num_consumers = 3
+        results = context.Queue()
+        
+        with SharedMemoryQueue(capacity=16, slot_size=64, context=context) as queue:
+            producers = [ProcessProducer(source_data[i::num_consumers], queue, context=context)
+                         for i in range(num_consumers)]
+            consumers = [ProcessConsumer(queue, results=results, context=context)
+                         for _ in range(num_consumers)]
+            for process in producers + consumers:
+                process.start()
+            
+            received = [results.get(timeout=10.0) for _ in source_data]
+            for process in producers + consumers:
+                process.join(timeout=10.0)
+        
+        assert sorted(received) == source_data
+        assert sum(consumer.items_consumed for consumer in consumers) == len(source_data)
+    
+    @pytest.mark.parametrize("start_method", ["fork", "spawn"])
+    def test_close_stops_every_consumer(self, start_method):
+        """Test that a producer closing the queue stops all consumer processes without sentinels."""
+        context = multiprocessing.get_context(start_method)
+        source_data = list(range(100))
+        results = context.Queue()
+        
+        with SharedMemoryQueue(capacity=8, slot_size=64, context=context) as queue:
+            producer = ProcessProducer(source_data, queue, on_finish="close", context=context)
+            consumers = [ProcessConsumer(queue, results=results, context=context)
+                         for _ in range(3)]
+            for process in [producer] + consumers:
+                process.start()
+            
+            received = [results.get(timeout=10.0) for _ in source_data]
+            for process in [producer] + consumers:
+                process.join(timeout=10.0)
+            
+            assert queue.closed
+        
+        assert sorted(received) == source_data
+        assert all(process.exitcode == 0 for process in [producer] + consumers)
+        assert sum(consumer.items_consumed for consumer in consumers) == len(source_data)
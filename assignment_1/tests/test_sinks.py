@@ -0,0 +1,135 @@
+import io
+import threading
+import pytest
+from assignment_1.async_logger import AsyncLogger
+from assignment_1.blocking_queue import BoundedBlockingQueue
+from assignment_1.producer_consumer import Producer, Consumer
+from assignment_1.sinks import (
+    Sink, ListSink, LockedListSink, CallbackSink, BatchCallbackSink, FileSink, merge_sinks
+)
+
+_quiet = AsyncLogger(quiet=True, stream=io.StringIO())
+
+
+class TestSinks:
+    """Test suite for the individual sink implementations."""
+    
+    def test_base_sink_requires_write(self):
+        """Test that the base class cannot be written to directly."""
+        with pytest.raises(NotImplementedError):
+            Sink().write_many([1])
+    
+    def test_list_sink_buffers_items(self):
+        """Test that a ListSink keeps items in write order."""
+        sink = ListSink()
+        sink.write(1)
+        sink.write_many([2, 3])
+        
+        assert sink.items == [1, 2, 3]
+        assert len(sink) == 3
+    
+    def test_locked_list_sink_appends_to_shared_list(self):
+        """Test that LockedListSink writes into the caller's list."""
+        destination = []
+        sink = LockedListSink(destination, threading.Lock())
+        sink.write(1)
+        sink.write_many([2, 3])
+        
+        assert destination == [1, 2, 3]
+    
+    def test_callback_sink(self):
+        """Test that CallbackSink forwards every item, including batches."""
+        received = []
+        sink = CallbackSink(received.append)
+        sink.write(1)
+        sink.write_many([2, 3])
+        sink.close()
+        
+        assert received == [1, 2, 3]
+    
+    def test_batch_callback_sink(self):
+        """Test that BatchCallbackSink passes each batch in a single call."""
+        batches = []
+        sink = BatchCallbackSink(batches.append)
+        sink.write(1)
+        sink.write_many([2, 3])
+        
+        assert batches == [[1], [2, 3]]
+    
+    def test_file_sink_writes_lines(self, tmp_path):
+        """Test that FileSink streams formatted lines to disk."""
+        path = tmp_path / "out.txt"
+        sink = FileSink(str(path), formatter=lambda item: f"item-{item}")
+        sink.write(1)
+        sink.write_many([2, 3])
+        sink.close()
+        
+        assert path.read_text().splitlines() == ["item-1", "item-2", "item-3"]
+    
+    def test_merge_sinks(self):
+        """Test that per-consumer buffers are concatenated."""
+        first, second = ListSink(), ListSink()
+        first.write_many([1, 2])
+        second.write(3)
+        
+        assert merge_sinks([first, second]) == [1, 2, 3]
+
+
+class TestConsumerSinks:
+    """Test Consumer with per-consumer sinks instead of a shared destination."""
+    
+    def test_default_sink_is_private_list(self):
+        """Test that a Consumer without destination gets its own ListSink."""
+        queue = BoundedBlockingQueue(capacity=5)
+        consumer = Consumer(queue)
+        
+        assert isinstance(consumer.sink, ListSink)
+        assert consumer.sink is not Consumer(queue).sink
+    
+    def test_destination_arguments_validated(self):
+        """Test that destination needs a lock and cannot be combined with sink."""
+        queue = BoundedBlockingQueue(capacity=5)
+        with pytest.raises(ValueError):
+            Consumer(queue, destination=[])
+        with pytest.raises(ValueError):
+            Consumer(queue, destination=[], destination_lock=threading.Lock(), sink=ListSink())
+    
+    @pytest.mark.parametrize("batch_size", [1, 8])
+    def test_many_consumers_merge_at_join(self, batch_size):
+        """Test that lock-free per-consumer buffers merge into the full result."""
+        queue = BoundedBlockingQueue(capacity=8)
+        source_data = list(range(1000))
+        
+        producer = Producer(source_data, queue, on_finish="close", logger=_quiet)
+        consumers = [Consumer(queue, batch_size=batch_size, logger=_quiet) for _ in range(4)]
+        producer.start()
+        for consumer in consumers:
+            consumer.start()
+        producer.join(timeout=5.0)
+        for consumer in consumers:
+            consumer.join(timeout=5.0)
+        
+        merged = merge_sinks(consumer.sink for consumer in consumers)
+        assert sorted(merged) == source_data
+    
+    def test_consumers_stream_to_files(self, tmp_path):
+        """Test that each consumer can stream to its own file sink."""
+        queue = BoundedBlockingQueue(capacity=4)
+        source_data = list(range(200))
+        sinks = [FileSink(str(tmp_path / f"part-{i}.txt")) for i in range(2)]
+        
+        producer = Producer(source_data, queue, on_finish="close", logger=_quiet)
+        consumers = [Consumer(queue, sink=sink, logger=_quiet) for sink in sinks]
+        producer.start()
+        for consumer in consumers:
+            consumer.start()
+        producer.join(timeout=5.0)
+        for consumer in consumers:
+            consumer.join(timeout=5.0)
+        for sink in sinks:
+            sink.close()
+        
+        lines = []
+        for i in range(2):
+            lines.extend((tmp_path / f"part-{i}.txt").read_text().splitlines())
+        assert sorted(int(line) for line in lines) == source_data
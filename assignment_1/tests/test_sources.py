@@ -0,0 +1,142 @@
+import asyncio
+import io
+import time
+import pytest
+from assignment_1.async_logger import AsyncLogger
+from assignment_1.blocking_queue import BoundedBlockingQueue
+from assignment_1.producer_consumer import Producer, Consumer, _SENTINEL
+from assignment_1.sources import iter_lines, iter_chunks
+
+_quiet = AsyncLogger(quiet=True, stream=io.StringIO())
+
+
+class TestFileSources:
+    """Test suite for lazy file readers."""
+    
+    def test_iter_lines(self, tmp_path):
+        """Test that lines are yielded without newlines."""
+        path = tmp_path / "input.txt"
+        path.write_text("a\nb\nc\n")
+        
+        assert list(iter_lines(str(path))) == ["a", "b", "c"]
+    
+    def test_iter_chunks(self, tmp_path):
+        """Test that binary chunks cover the file exactly."""
+        path = tmp_path / "input.bin"
+        path.write_bytes(b"0123456789")
+        
+        assert list(iter_chunks(str(path), chunk_size=4)) == [b"0123", b"4567", b"89"]
+    
+    def test_iter_chunks_invalid_size(self, tmp_path):
+        """Test that a non-positive chunk size is rejected immediately."""
+        with pytest.raises(ValueError):
+            iter_chunks(str(tmp_path / "missing.bin"), chunk_size=0)
+    
+    def test_readers_are_lazy(self, tmp_path):
+        """Test that creating a reader does not open the file."""
+        reader = iter_lines(str(tmp_path / "does-not-exist.txt"))
+        
+        with pytest.raises(FileNotFoundError):
+            next(reader)
+
+
+class TestStreamingProducer:
+    """Test Producer pulling lazily from iterators, generators and files."""
+    
+    def test_generator_is_pulled_lazily(self):
+        """Test that read-ahead is bounded by queue capacity, not input size."""
+        queue = BoundedBlockingQueue(capacity=3)
+        pulled = []
+        
+        def generate():
+            for i in range(1000):
+                pulled.append(i)
+                yield i
+        
+        producer = Producer(generate(), queue, on_finish="close", logger=_quiet)
+        producer.start()
+        time.sleep(0.1)
+        
+        # capacity items queued plus one blocked in put()
+        assert len(pulled) == 4
+        
+        consumer = Consumer(queue, logger=_quiet)
+        consumer.start()
+        producer.join(timeout=5.0)
+        consumer.join(timeout=5.0)
+        assert consumer.sink.items == list(range(1000))
+    
+    def test_first_item_available_before_source_finishes(self):
+        """Test that start-up latency is the time to produce the first item."""
+        queue = BoundedBlockingQueue(capacity=10)
+        
+        def slow_source():
+            yield "first"
+            time.sleep(0.5)
+            yield "second"
+        
+        producer = Producer(slow_source(), queue, logger=_quiet)
+        start_time = time.monotonic()
+        producer.start()
+        
+        assert queue.get() == "first"
+        assert time.monotonic() - start_time < 0.4
+        producer.join(timeout=5.0)
+    
+    def test_batched_generator(self):
+        """Test that batch mode also pulls lazily from a generator."""
+        queue = BoundedBlockingQueue(capacity=4)
+        
+        producer = Producer((i * i for i in range(50)), queue, batch_size=4, on_finish="close",
+                            logger=_quiet)
+        consumer = Consumer(queue, batch_size=4, logger=_quiet)
+        producer.start()
+        consumer.start()
+        producer.join(timeout=5.0)
+        consumer.join(timeout=5.0)
+        
+        assert consumer.sink.items == [i * i for i in range(50)]
+    
+    @pytest.mark.parametrize("batch_size", [1, 3])
+    def test_async_iterable_source(self, batch_size):
+        """Test that async generators can feed a threaded Producer."""
+        async def generate():
+            for i in range(10):
+                await asyncio.sleep(0)
+                yield i
+        
+        queue = BoundedBlockingQueue(capacity=2)
+        producer = Producer(generate(), queue, batch_size=batch_size, on_finish="close",
+                            logger=_quiet)
+        consumer = Consumer(queue, logger=_quiet)
+        producer.start()
+        consumer.start()
+        producer.join(timeout=5.0)
+        consumer.join(timeout=5.0)
+        
+        assert producer.items_produced == 10
+        assert consumer.sink.items == list(range(10))
+    
+    def test_file_lines_source(self, tmp_path):
+        """Test streaming a file line by line through the pipeline."""
+        path = tmp_path / "input.txt"
+        path.write_text("".join(f"line-{i}\n" for i in range(100)))
+        queue = BoundedBlockingQueue(capacity=5)
+        
+        producer = Producer(iter_lines(str(path)), queue, logger=_quiet)
+        consumer = Consumer(queue, logger=_quiet)
+        producer.start()
+        consumer.start()
+        producer.join(timeout=5.0)
+        consumer.join(timeout=5.0)
+        
+        assert consumer.sink.items == [f"line-{i}" for i in range(100)]
+    
+    def test_missing_file_still_signals_completion(self, tmp_path):
+        """Test that a source failing on first pull still releases consumers."""
+        queue = BoundedBlockingQueue(capacity=5)
+        producer = Producer(iter_lines(str(tmp_path / "missing.txt")), queue, logger=_quiet)
+        producer.start()
+        producer.join(timeout=5.0)
+        
+        assert queue.get() is _SENTINEL
@@ -0,0 +1,122 @@
+import io
+import os
+import threading
+import pytest
+from assignment_1.async_logger import AsyncLogger
+from assignment_1.blocking_queue import QueueClosed, QueueEmpty
+from assignment_1.producer_consumer import Producer, Consumer, _SENTINEL
+from assignment_1.spill_queue import SpillingQueue
+
+_quiet = AsyncLogger(quiet=True, stream=io.StringIO())
+
+
+class TestSpillingQueue:
+    """Test suite for SpillingQueue."""
+    
+    def test_in_memory_below_capacity(self):
+        """Test that nothing touches disk while the hot buffer has room."""
+        with SpillingQueue(capacity=5) as queue:
+            for i in range(5):
+                queue.put(i)
+            
+            assert queue.stats()['spilled'] == 0
+            assert queue.stats()['segments'] == 0
+            assert queue.get_many(10) == [0, 1, 2, 3, 4]
+    
+    def test_overflow_spills_in_fifo_order(self):
+        """Test that items past capacity go to disk and come back in order."""
+        with SpillingQueue(capacity=3) as queue:
+            for i in range(10):
+                queue.put({"id": i})
+            
+            stats = queue.stats()
+            assert stats['in_memory'] == 3
+            assert stats['spilled'] == 7
+            assert [queue.get()["id"] for _ in range(10)] == list(range(10))
+    
+    def test_puts_after_spill_keep_order(self):
+        """Test that new items queue behind spilled ones even when memory frees up."""
+        with SpillingQueue(capacity=2) as queue:
+            queue.put_many([1, 2, 3])
+            assert queue.get() == 1
+            queue.put(4)  # Memory has room, but 3 is still on disk
+            
+            assert queue.get_many(10) == [2, 3, 4]
+            assert queue.stats()['spilled'] == 0
+    
+    def test_segments_roll_over_and_are_removed(self, tmp_path):
+        """Test that small segments roll over and are deleted once read."""
+        with SpillingQueue(capacity=1, directory=str(tmp_path), segment_size=64) as queue:
+            payloads = [b"x" * 40 for _ in range(5)]
+            queue.put(b"hot")
+            queue.put_many(payloads)
+            assert queue.stats()['segments'] == 5
+            
+            queue.get()
+            assert queue.get_many(10) == payloads
+            assert queue.stats()['segments'] == 1  # Last segment is kept for reuse
+    
+    def test_oversized_record_gets_own_segment(self):
+        """Test that a record bigger than segment_size still spills."""
+        with SpillingQueue(capacity=1, segment_size=16) as queue:
+            queue.put("hot")
+            queue.put("y" * 1000)
+            
+            assert queue.get() == "hot"
+            assert queue.get() == "y" * 1000
+    
+    def test_sentinel_round_trips_through_disk(self):
+        """Test that a spilled _SENTINEL is decoded back to the same object."""
+        with SpillingQueue(capacity=1) as queue:
+            queue.put("hot")
+            queue.put(_SENTINEL)
+            
+            queue.get()
+            assert queue.get() is _SENTINEL
+    
+    def test_timeouts_and_close(self):
+        """Test the get timeout and close contract shared with BoundedBlockingQueue."""
+        with SpillingQueue(capacity=1) as queue:
+            with pytest.raises(QueueEmpty):
+                queue.get(timeout=0.01)
+            assert queue.try_get(default="none") == "none"
+            
+            queue.put_many([1, 2])
+            queue.close()
+            with pytest.raises(QueueClosed):
+                queue.put(3)
+            assert queue.get_many(10) == [1, 2]
+            with pytest.raises(QueueClosed):
+                queue.get()
+    
+    def test_release_deletes_spill_directory(self):
+        """Test that release() removes every spill file."""
+        queue = SpillingQueue(capacity=1)
+        queue.put_many(range(10))
+        directory = queue._directory.name
+        assert os.listdir(directory)
+        
+        queue.release()
+        assert not os.path.exists(directory)
+    
+    def test_producer_never_blocks(self):
+        """Test that a producer finishes a burst with no consumer running."""
+        with SpillingQueue(capacity=4) as queue:
+            producer = Producer(range(1000), queue, logger=_quiet)
+            producer.start()
+            producer.join(timeout=5.0)
+            assert not producer.is_alive()
+            
+            destination = []
+            consumer = Consumer(queue, destination, threading.Lock(), batch_size=64, logger=_quiet)
+            consumer.start()
+            consumer.join(timeout=5.0)
+            
+            assert destination == list(range(1000))
+    
+    def test_invalid_configuration(self):
+        """Test that non-positive capacity and tiny segments are rejected."""
+        with pytest.raises(ValueError):
+            SpillingQueue(capacity=0)
+        with pytest.raises(ValueError):
+            SpillingQueue(capacity=1, segment_size=4)
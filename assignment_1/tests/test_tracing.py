@@ -0,0 +1,121 @@
+import io
+import json
+import threading
+import time
+import pytest
+from assignment_1.async_logger import AsyncLogger
+from assignment_1.blocking_queue import BoundedBlockingQueue, QueueEmpty
+from assignment_1.producer_consumer import Producer, Consumer
+from assignment_1.tracing import Tracer
+
+_quiet = AsyncLogger(quiet=True, stream=io.StringIO())
+
+
+class TestTracer:
+    """Test suite for Tracer."""
+    
+    def test_span_records_on_calling_thread(self):
+        """Test that span() records name, category, duration and args per thread."""
+        tracer = Tracer()
+        with tracer.span("work", "app", step=1):
+            time.sleep(0.01)
+        
+        def worker():
+            with tracer.span("other"):
+                pass
+        
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+        
+        events = tracer.events()
+        assert [event['name'] for event in events] == ["work", "other"]
+        assert events[0]['ph'] == "X"
+        assert events[0]['dur'] >= 10_000
+        assert events[0]['args'] == {"step": 1}
+        assert events[0]['tid'] != events[1]['tid']
+    
+    def test_ring_buffer_keeps_newest_spans(self):
+        """Test that a full ring buffer overwrites its oldest spans and counts them."""
+        tracer = Tracer(buffer_size=3)
+        for i in range(5):
+            tracer.record(f"span-{i}", "app", i, i + 1)
+        
+        assert [event['name'] for event in tracer.events()] == ["span-2", "span-3", "span-4"]
+        assert tracer.dropped() == 2
+        
+        tracer.clear()
+        assert tracer.events() == []
+        assert tracer.dropped() == 0
+    
+    def test_disabled_tracer_records_nothing(self):
+        """Test that spans are ignored while enabled is False."""
+        tracer = Tracer()
+        tracer.enabled = False
+        with tracer.span("ignored"):
+            pass
+        
+        assert tracer.events() == []
+    
+    def test_queue_records_blocked_waits(self):
+        """Test that the queue records waits on not_full and not_empty, but not fast paths."""
+        tracer = Tracer()
+        queue = BoundedBlockingQueue(capacity=1, tracer=tracer)
+        queue.put(1)
+        queue.get()
+        with pytest.raises(QueueEmpty):
+            queue.get(block=False)
+        assert tracer.events() == []
+        
+        with pytest.raises(QueueEmpty):
+            queue.get(timeout=0.01)
+        queue.put(1)
+        threading.Timer(0.02, queue.get).start()
+        queue.put(2)
+        
+        names = [event['name'] for event in tracer.events()]
+        assert names == ["blocked on not_empty", "blocked on not_full"]
+    
+    def test_producer_consumer_run_exports_chrome_trace(self):
+        """Test that a traced run exports producer, consumer, wait and lock spans as JSON."""
+        tracer = Tracer()
+        queue = BoundedBlockingQueue(capacity=2, tracer=tracer)
+        destination, lock = [], threading.Lock()
+        producer = Producer(range(200), queue, name="P", on_finish="close", logger=_quiet)
+        consumers = [Consumer(queue, destination, lock, name=f"C{i}", logger=_quiet)
+                     for i in range(2)]
+        lock.acquire()  # Hold the destination lock so consumers must wait on it
+        threading.Timer(0.02, lock.release).start()
+        
+        for thread in (producer, *consumers):
+            thread.start()
+        for thread in (producer, *consumers):
+            thread.join(timeout=5.0)
+        
+        out = io.StringIO()
+        tracer.export_chrome_trace(out)
+        trace = json.loads(out.getvalue())
+        names = {event['name'] for event in trace['traceEvents']}
+        threads = {event['args']['name'] for event in trace['traceEvents'] if event['ph'] == "M"}
+        
+        assert sorted(destination) == list(range(200))
+        assert {"produce", "consume", "blocked on not_full",
+                "waiting on destination lock"} <= names
+        assert {"P", "C0", "C1"} <= threads
+        produce = [event for event in trace['traceEvents'] if event['name'] == "produce"]
+        assert produce[0]['args'] == {"items": 200}
+    
+    def test_export_to_path(self, tmp_path):
+        """Test that export_chrome_trace() accepts a file path."""
+        tracer = Tracer()
+        with tracer.span("work"):
+            pass
+        path = tmp_path / "trace.json"
+        tracer.export_chrome_trace(str(path))
+        
+        assert json.loads(path.read_text())['traceEvents'][-1]['name'] == "work"
+    
+    def test_invalid_buffer_size(self):
+        """Test that a non-positive buffer size is rejected."""
+        with pytest.raises(ValueError):
+            Tracer(buffer_size=0)
@@ -0,0 +1,124 @@
+import io
+import threading
+import pytest
+from assignment_1.async_logger import AsyncLogger
+from assignment_1.blocking_queue import QueueClosed, QueueFull
+from assignment_1.producer_consumer import Producer, Consumer
+from assignment_1.tracing import Tracer
+from assignment_1.weighted_queue import WeightedBlockingQueue
+
+_quiet = AsyncLogger(quiet=True, stream=io.StringIO())
+
+
+class TestWeightedBlockingQueue:
+    """Test suite for WeightedBlockingQueue."""
+    
+    def test_capacity_counts_weight(self):
+        """Test that the budget is spent by item weight, not item count."""
+        queue = WeightedBlockingQueue(capacity=10, sizeof=len)
+        queue.put(b"x" * 4)
+        queue.put(b"x" * 6)
+        
+        assert queue.weight == 10
+        assert queue.try_put(b"x") is False
+        assert queue.get() == b"x" * 4
+        assert queue.weight == 6
+        assert queue.try_put(b"y" * 4) is True
+    
+    def test_explicit_weight(self):
+        """Test that a weight passed to put() overrides sizeof."""
+        queue = WeightedBlockingQueue(capacity=100, sizeof=len)
+        queue.put("small", weight=90)
+        
+        with pytest.raises(QueueFull):
+            queue.put("tiny", block=False, weight=11)
+        queue.put("tiny", weight=10)
+        assert queue.weight == 100
+    
+    def test_oversized_item_admitted_when_empty(self):
+        """Test that an item heavier than capacity fits into an empty queue only."""
+        queue = WeightedBlockingQueue(capacity=10, sizeof=len)
+        queue.put(b"x" * 50)
+        assert queue.try_put(b"y") is False
+        
+        queue.get()
+        queue.put(b"y")
+        assert queue.try_put(b"z" * 50) is False
+    
+    def test_get_wakes_producer_when_weight_fits(self):
+        """Test that a producer blocked on weight resumes once enough is freed."""
+        queue = WeightedBlockingQueue(capacity=10, sizeof=len)
+        queue.put(b"a" * 5)
+        queue.put(b"b" * 5)
+        done = threading.Event()
+        
+        def producer():
+            queue.put(b"c" * 8)
+            done.set()
+        
+        thread = threading.Thread(target=producer)
+        thread.start()
+        queue.get()
+        assert not done.wait(timeout=0.1)  # 5 + 8 still exceeds the budget
+        
+        queue.get()
+        assert done.wait(timeout=1.0)
+        thread.join()
+        assert queue.weight == 8
+    
+    def test_tracer_records_weight_waits(self):
+        """Test that a put blocked on weight is traced like on BoundedBlockingQueue."""
+        tracer = Tracer()
+        queue = WeightedBlockingQueue(capacity=10, sizeof=len, tracer=tracer)
+        queue.put(b"a" * 8)
+        threading.Timer(0.02, queue.get).start()
+        queue.put(b"b" * 5)
+        
+        assert [event['name'] for event in tracer.events()] == ["blocked on not_full"]
+        assert queue.weight == 5
+    
+    def test_batch_operations(self):
+        """Test that put_many and get_many keep the running weight consistent."""
+        queue = WeightedBlockingQueue(capacity=100, sizeof=len)
+        queue.put_many(["ab", "cde", "f"])
+        
+        assert queue.weight == 6
+        assert queue.get_many(2) == ["ab", "cde"]
+        assert queue.weight == 1
+    
+    def test_negative_weight_rejected(self):
+        """Test that negative weights are rejected."""
+        queue = WeightedBlockingQueue(capacity=10)
+        
+        with pytest.raises(ValueError):
+            queue.put("x", weight=-1)
+    
+    def test_close(self):
+        """Test that the close protocol is inherited."""
+        queue = WeightedBlockingQueue(capacity=10, sizeof=len)
+        queue.put("abc")
+        queue.close()
+        
+        with pytest.raises(QueueClosed):
+            queue.put("d")
+        assert queue.get() == "abc"
+        with pytest.raises(QueueClosed):
+            queue.get()
+        assert "weight=0" in repr(queue)
+    
+    def test_with_producer_and_consumer(self):
+        """Test end-to-end transfer of variable-size payloads under a byte budget."""
+        queue = WeightedBlockingQueue(capacity=1000, sizeof=len)
+        source_data = [b"x" * (i * 37 % 700) for i in range(200)]
+        destination = []
+        lock = threading.Lock()
+        producer = Producer(source_data, queue, batch_size=8, logger=_quiet)
+        consumer = Consumer(queue, destination, lock, logger=_quiet)
+        
+        producer.start()
+        consumer.start()
+        producer.join(timeout=5.0)
+        consumer.join(timeout=5.0)
+        
+        assert destination == source_data
+        assert queue.weight == 0
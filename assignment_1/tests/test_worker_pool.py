@@ -0,0 +1,168 @@
+import io
+import random
+import threading
+import time
+import pytest
+from assignment_1.async_logger import AsyncLogger
+from assignment_1.sinks import ListSink, CallbackSink
+from assignment_1.worker_pool import OrderedWorkerPool, ReorderBuffer, ReorderAborted
+
+# Keep expected worker errors out of the test output
+_quiet = AsyncLogger(quiet=True, stream=io.StringIO())
+
+
+class TestReorderBuffer:
+    """Test suite for ReorderBuffer."""
+    
+    def test_emits_in_sequence_order(self):
+        """Test that out-of-order writes are emitted in sequence order."""
+        sink = ListSink()
+        reorder = ReorderBuffer(sink, window=10)
+        for sequence in (2, 0, 3, 1):
+            reorder.write((sequence, f"r{sequence}"))
+        
+        assert sink.items == ["r0", "r1", "r2", "r3"]
+        assert reorder.next_sequence == 4
+    
+    def test_invalid_window(self):
+        """Test that a non-positive window is rejected."""
+        with pytest.raises(ValueError):
+            ReorderBuffer(ListSink(), window=0)
+    
+    def test_writer_blocks_outside_window(self):
+        """Test that a result too far ahead waits for the window to advance."""
+        sink = ListSink()
+        reorder = ReorderBuffer(sink, window=2)
+        written = threading.Event()
+        
+        def write_ahead():
+            reorder.write((2, "r2"))
+            written.set()
+        
+        thread = threading.Thread(target=write_ahead)
+        thread.start()
+        assert not written.wait(0.1)
+        
+        reorder.write((0, "r0"))
+        assert written.wait(1.0)
+        reorder.write((1, "r1"))
+        thread.join(timeout=1.0)
+        
+        assert sink.items == ["r0", "r1", "r2"]
+    
+    def test_abort_releases_blocked_writers(self):
+        """Test that abort() fails writers waiting on the window."""
+        reorder = ReorderBuffer(ListSink(), window=1)
+        errors = []
+        
+        def write_ahead():
+            try:
+                reorder.write((5, "r5"))
+            except ReorderAborted as e:
+                errors.append(e)
+        
+        thread = threading.Thread(target=write_ahead)
+        thread.start()
+        time.sleep(0.05)
+        reorder.abort(RuntimeError("boom"))
+        thread.join(timeout=1.0)
+        
+        assert len(errors) == 1
+        with pytest.raises(ReorderAborted):
+            reorder.write((0, "r0"))
+    
+    def test_sink_error_aborts_buffer(self):
+        """Test that a failing sink aborts the buffer and reports the error."""
+        def fail_on_one(item):
+            if item == "r1":
+                raise IOError("sink failed")
+        
+        reported = []
+        reorder = ReorderBuffer(CallbackSink(fail_on_one), window=4, on_error=reported.append)
+        reorder.write((1, "r1"))
+        with pytest.raises(IOError, match="sink failed"):
+            reorder.write((0, "r0"))
+        
+        assert [str(e) for e in reported] == ["sink failed"]
+        with pytest.raises(ReorderAborted):
+            reorder.write((2, "r2"))
+
+
+class TestOrderedWorkerPool:
+    """Test suite for OrderedWorkerPool."""
+    
+    def test_results_in_source_order(self):
+        """Test that parallel processing with jittered latency preserves order."""
+        def slow_square(x):
+            time.sleep(random.uniform(0, 0.002))
+            return x * x
+        
+        pool = OrderedWorkerPool(slow_square, num_workers=4, capacity=8, window=8, logger=_quiet)
+        source_data = list(range(300))
+        
+        assert pool.run(source_data) == [x * x for x in source_data]
+    
+    def test_small_window_with_slow_items(self):
+        """Test that a window smaller than the worker count still makes progress."""
+        sink = ListSink()
+        pool = OrderedWorkerPool(lambda x: time.sleep(0.01 if x % 10 == 0 else 0) or x,
+                                 num_workers=4, window=1, logger=_quiet)
+        
+        assert pool.run(range(100), sink=sink) == []
+        assert sink.items == list(range(100))
+    
+    def test_streams_into_callback_sink(self):
+        """Test that ordered results can be streamed to any sink."""
+        received = []
+        pool = OrderedWorkerPool(str, num_workers=3, logger=_quiet)
+        pool.run(range(20), sink=CallbackSink(received.append))
+        
+        assert received == [str(i) for i in range(20)]
+    
+    def test_worker_error_propagates(self):
+        """Test that an exception in func tears the pool down and is re-raised."""
+        def fail_on_seven(x):
+            if x == 7:
+                raise ValueError("bad item")
+            return x
+        
+        pool = OrderedWorkerPool(fail_on_seven, num_workers=3, capacity=2, window=2, logger=_quiet)
+        with pytest.raises(ValueError, match="bad item"):
+            pool.run(range(1000))
+    
+    def test_sink_error_propagates(self):
+        """Test that an exception in the sink tears the pool down instead of hanging run()."""
+        def fail_on_five(item):
+            if item == 5:
+                raise IOError("sink failed")
+        
+        pool = OrderedWorkerPool(lambda x: x, num_workers=3, capacity=2, window=2, logger=_quiet)
+        errors = []
+        
+        def run():
+            try:
+                pool.run(range(1000), sink=CallbackSink(fail_on_five))
+            except Exception as e:
+                errors.append(e)
+        
+        thread = threading.Thread(target=run, daemon=True)
+        thread.start()
+        thread.join(timeout=5.0)
+        
+        assert not thread.is_alive()
+        assert len(errors) == 1 and isinstance(errors[0], IOError)
+    
+    def test_source_error_propagates(self):
+        """Test that an exception raised by the source is re-raised by run()."""
+        def broken_source():
+            yield 1
+            raise IOError("source failed")
+        
+        pool = OrderedWorkerPool(lambda x: x, num_workers=2, logger=_quiet)
+        with pytest.raises(IOError, match="source failed"):
+            pool.run(broken_source())
+    
+    def test_invalid_num_workers(self):
+        """Test that at least one worker is required."""
+        with pytest.raises(ValueError):
+            OrderedWorkerPool(lambda x: x, num_workers=0)
@@ -0,0 +1,124 @@
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, IO, Iterator, List, Optional, Union
+
+
+class _ThreadBuffer:
+    """Fixed-size ring of spans recorded by one thread; only that thread writes to it."""
+    
+    def __init__(self, size: int):
+        thread = threading.current_thread()
+        self.thread_name = thread.name
+        self.tid = threading.get_native_id()
+        self.slots: List[Optional[tuple]] = [None] * size
+        self.size = size
+        self.count = 0  # Spans ever recorded; slots hold the last `size` of them
+    
+    def append(self, span: tuple) -> None:
+        self.slots[self.count % self.size] = span
+        self.count += 1
+    
+    def spans(self) -> List[tuple]:
+        """Recorded spans still in the ring, oldest first."""
+        if self.count <= self.size:
+            return self.slots[:self.count]
+        start = self.count % self.size
+        return self.slots[start:] + self.slots[:start]
+
+
+class Tracer:
+    """Opt-in recorder of per-thread timeline spans, exported as Chrome trace-event JSON.
+    
+    Pass one tracer to BoundedBlockingQueue(tracer=...) and every Producer and
+    Consumer on that queue picks it up. Spans are recorded only at coarse
+    points, never per item: one "produce"/"consume" span per thread run, plus
+    one span each time a thread actually blocks on not_full, not_empty or a
+    contended destination lock, so the uncontended hot path costs nothing.
+    
+    Each thread appends to its own ring buffer of buffer_size spans without
+    locking; once full, the oldest spans are overwritten and counted in
+    dropped(). Load the output of export_chrome_trace() in chrome://tracing
+    or Perfetto to see which thread was blocked on what, and when.
+    """
+    
+    def __init__(self, buffer_size: int = 65536):
+        if buffer_size <= 0:
+            raise ValueError("buffer_size must be greater than 0")
+        
+        self.buffer_size = buffer_size
+        self.enabled = True
+        self._buffers: List[_ThreadBuffer] = []
+        self._lock = threading.Lock()  # Guards _buffers registration only
+        self._local = threading.local()
+        self._origin = time.perf_counter_ns()
+    
+    def record(self, name: str, category: str, start_ns: int, end_ns: int,
+               args: Optional[Dict[str, Any]] = None) -> None:
+        """Record a completed span on the calling thread; times come from time.perf_counter_ns()."""
+        if not self.enabled:
+            return
+        buffer = getattr(self._local, 'buffer', None)
+        if buffer is None:
+            buffer = self._register()
+        buffer.append((name, category, start_ns, end_ns, args))
+    
+    @contextmanager
+    def span(self, name: str, category: str = "app", **args: Any) -> Iterator[None]:
+        """Record the duration of the with-block as a span on the calling thread."""
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.record(name, category, start, time.perf_counter_ns(), args or None)
+    
+    def events(self) -> List[Dict[str, Any]]:
+        """Recorded spans as Chrome "complete" events (microsecond ts/dur), sorted by start."""
+        pid = os.getpid()
+        with self._lock:
+            buffers = list(self._buffers)
+        events = []
+        for buffer in buffers:
+            for name, category, start, end, args in buffer.spans():
+                event = {"name": name, "cat": category, "ph": "X", "pid": pid, "tid": buffer.tid,
+                         "ts": (start - self._origin) / 1000, "dur": (end - start) / 1000}
+                if args:
+                    event['args'] = args
+                events.append(event)
+        events.sort(key=lambda event: event['ts'])
+        return events
+    
+    def dropped(self) -> int:
+        """Number of spans overwritten because a thread's ring buffer was full."""
+        with self._lock:
+            return sum(max(0, buffer.count - buffer.size) for buffer in self._buffers)
+    
+    def export_chrome_trace(self, destination: Union[str, IO[str]]) -> None:
+        """Write all spans, with thread names, as Chrome trace-event JSON to a path or file."""
+        pid = os.getpid()
+        with self._lock:
+            names = [(buffer.tid, buffer.thread_name) for buffer in self._buffers]
+        metadata = [{"name": "thread_name", "ph": "M", "pid": pid, "tid": tid,
+                     "args": {"name": thread_name}} for tid, thread_name in names]
+        trace = {"traceEvents": metadata + self.events(), "displayTimeUnit": "ms"}
+        if isinstance(destination, str):
+            with open(destination, "w") as f:
+                json.dump(trace, f)
+        else:
+            json.dump(trace, destination)
+    
+    def clear(self) -> None:
+        """Drop every recorded span. Call only while no traced thread is running."""
+        with self._lock:
+            for buffer in self._buffers:
+                buffer.slots = [None] * buffer.size
+                buffer.count = 0
+    
+    def _register(self) -> _ThreadBuffer:
+        buffer = _ThreadBuffer(self.buffer_size)
+        self._local.buffer = buffer
+        with self._lock:
+            self._buffers.append(buffer)
+        return buffer
@@ -0,0 +1,75 @@
+import sys
+from collections import deque
+from typing import Any, Callable, Optional
+from assignment_1.blocking_queue import BoundedBlockingQueue
+from assignment_1.producer_consumer import _SENTINEL
+from assignment_1.tracing import Tracer
+
+
+class WeightedBlockingQueue(BoundedBlockingQueue):
+    """BoundedBlockingQueue whose capacity is a total weight, such as bytes, not an item count.
+    
+    Each item weighs sizeof(item), or the weight passed to put(). Producers
+    block while the item would push the total past capacity, except that any
+    single item is admitted into an empty queue, so an oversized item can
+    never deadlock. The default sizeof, sys.getsizeof, is shallow: pass e.g.
+    len for bytes payloads or a custom function for nested objects.
+    
+    Since a freed slot may fit several small items or none of a large one,
+    get() wakes every waiting producer to re-check its own item. Only the
+    capacity hooks of BoundedBlockingQueue are overridden, so blocking,
+    timeouts, metrics and tracing behave exactly as on the base queue.
+    """
+    
+    def __init__(self, capacity: int, sizeof: Callable[[Any], int] = sys.getsizeof,
+                 metrics: bool = False, tracer: Optional[Tracer] = None):
+        super().__init__(capacity, metrics, tracer)
+        self.sizeof = sizeof
+        self.weight = 0
+        self._weights = deque()
+    
+    def put(self, item: Any, block: bool = True, timeout: Optional[float] = None,
+            weight: Optional[int] = None) -> None:
+        """Add item, blocking until its weight fits. Raises QueueClosed if closed.
+        
+        With block=False, or once timeout expires without room, raises QueueFull.
+        """
+        self._put(item, self._weigh(item, weight), block, timeout)
+    
+    def _weigh(self, item: Any, weight: Optional[int] = None) -> int:
+        """Weight of item: the explicit weight if given, else sizeof(item)."""
+        if weight is None:
+            weight = 0 if item is _SENTINEL else self.sizeof(item)
+        if weight < 0:
+            raise ValueError("weight must not be negative")
+        return weight
+    
+    def _has_room(self, weight: int) -> bool:
+        # An empty queue admits anything, so one oversized item cannot block forever
+        return self.weight + weight <= self.capacity or not self.queue
+    
+    def _enqueue(self, item: Any, weight: int) -> None:
+        self.queue.append(item)
+        self._weights.append(weight)
+        self.weight += weight
+    
+    def _on_dequeue(self, count: int) -> None:
+        self.weight -= sum(self._weights.popleft() for _ in range(count))
+        self.not_full.notify_all()
+    
+    def _move_fitting(self, pending: deque) -> int:
+        moved = 0
+        while pending:
+            weight = self._weigh(pending[0])
+            if not self._has_room(weight):
+                break
+            self._enqueue(pending.popleft(), weight)
+            moved += 1
+        return moved
+    
+    def __repr__(self) -> str:
+        """String representation of the queue."""
+        with self.lock:
+            state = ", closed" if self.closed else ""
+            return (f"WeightedBlockingQueue(capacity={self.capacity}, weight={self.weight}, "
+                    f"size={len(self.queue)}{state})")
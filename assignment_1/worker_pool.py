@@ -0,0 +1,147 @@
+import threading
+from typing import Any, Callable, Iterable, List, Optional, Tuple
+
+from assignment_1.async_logger import AsyncLogger
+from assignment_1.blocking_queue import BoundedBlockingQueue
+from assignment_1.producer_consumer import Producer, Consumer
+from assignment_1.sinks import Sink, ListSink
+
+
+class ReorderAborted(Exception):
+    """Raised by ReorderBuffer.write() after the buffer has been aborted."""
+
+
+class ReorderBuffer(Sink):
+    """Sink that takes (sequence, result) pairs in any order and emits results in order.
+    
+    Sequence numbers start at 0. At most window results can be held back: a
+    writer whose sequence is window or more ahead of the next one expected
+    blocks until the gap closes, which bounds memory and applies backpressure
+    to workers racing ahead of a slow item.
+    
+    If the downstream sink raises, the buffer aborts itself with that error,
+    calls on_error (if given) and re-raises, so that no writer is left waiting
+    for a sequence number that will never be emitted.
+    """
+    
+    def __init__(self, sink: Sink, window: int,
+                 on_error: Optional[Callable[[BaseException], None]] = None):
+        if window <= 0:
+            raise ValueError("window must be greater than 0")
+        
+        self.sink = sink
+        self.window = window
+        self.on_error = on_error
+        self.next_sequence = 0
+        self.max_pending = 0
+        self._pending = {}
+        self._error = None
+        self._advanced = threading.Condition()
+    
+    def write(self, entry: Tuple[int, Any]) -> None:
+        """Accept one result; emit it and any results it unblocks, in order."""
+        sequence, result = entry
+        try:
+            self._emit(sequence, result)
+        except ReorderAborted:
+            raise
+        except Exception as e:
+            self.abort(e)
+            if self.on_error is not None:
+                self.on_error(e)
+            raise
+    
+    def _emit(self, sequence: int, result: Any) -> None:
+        with self._advanced:
+            while sequence >= self.next_sequence + self.window and self._error is None:
+                self._advanced.wait()
+            if self._error is not None:
+                raise ReorderAborted("Reorder buffer aborted") from self._error
+            
+            self._pending[sequence] = result
+            self.max_pending = max(self.max_pending, len(self._pending))
+            if sequence == self.next_sequence:
+                while self.next_sequence in self._pending:
+                    self.sink.write(self._pending.pop(self.next_sequence))
+                    self.next_sequence += 1
+                self._advanced.notify_all()
+    
+    def abort(self, error: BaseException) -> None:
+        """Fail all current and future writers so that workers can exit."""
+        with self._advanced:
+            self._error = error
+            self._advanced.notify_all()
+    
+    def flush(self) -> None:
+        self.sink.flush()
+
+
+class OrderedWorkerPool:
+    """Applies func to items on parallel Consumer threads, emitting results in source order.
+    
+    A Producer tags each item with its sequence number, num_workers Consumers
+    apply func concurrently, and a ReorderBuffer with a bounded window puts the
+    results back in source order before they reach the sink. If func or the
+    sink raises, the pipeline is torn down and run() re-raises the first error.
+    """
+    
+    def __init__(self, func: Callable[[Any], Any], num_workers: int = 4,
+                 capacity: int = 16, window: Optional[int] = None,
+                 logger: Optional[AsyncLogger] = None):
+        if num_workers <= 0:
+            raise ValueError("num_workers must be greater than 0")
+        
+        self.func = func
+        self.num_workers = num_workers
+        self.capacity = capacity
+        self.window = window if window is not None else 4 * num_workers
+        self.logger = logger
+        self._error = None
+    
+    def run(self, source: Iterable[Any], sink: Optional[Sink] = None) -> List[Any]:
+        """Process source and return results in source order.
+        
+        Results are written to sink if given (the return value is then empty),
+        otherwise collected and returned as a list.
+        """
+        results = sink if sink is not None else ListSink()
+        queue = BoundedBlockingQueue(self.capacity)
+        reorder = ReorderBuffer(results, self.window,
+                                on_error=lambda e: self._fail(e, queue, reorder))
+        self._error = None
+        
+        def apply(entry: Tuple[int, Any]) -> Tuple[int, Any]:
+            sequence, item = entry
+            try:
+                return sequence, self.func(item)
+            except Exception as e:
+                self._fail(e, queue, reorder)
+                raise
+        
+        producer = Producer(enumerate(source), queue, name="Pool-Producer",
+                            on_finish="close", logger=self.logger)
+        workers = [Consumer(queue, sink=reorder, process=apply, name=f"Pool-Worker-{i + 1}",
+                            logger=self.logger)
+                   for i in range(self.num_workers)]
+        
+        producer.start()
+        for worker in workers:
+            worker.start()
+        producer.join()
+        for worker in workers:
+            worker.join()
+        
+        if self._error is None:
+            errors = [thread.error for thread in [producer] + workers if thread.error is not None]
+            self._error = errors[0] if errors else None
+        if self._error is not None:
+            raise self._error
+        return results.items if sink is None else []
+    
+    def _fail(self, error: BaseException, queue: BoundedBlockingQueue,
+              reorder: ReorderBuffer) -> None:
+        """Record the first error and unblock every thread in the pool."""
+        if self._error is None:
+            self._error = error
+        reorder.abort(error)
+        queue.close()
@@ -1,5 +1,8 @@
-from assignment_2.data_loader import load_sales_data
+from assignment_2.data_loader import load_sales_data, iter_sales_data
 from assignment_2.csv_analyzer import (
+    METRICS,
+    SalesAggregate,
+    sales_report,
     total_sales,
     sales_by_region,
     sales_by_category,
@@ -7,9 +10,18 @@ from assignment_2.csv_analyzer import (
     average_sale_amount,
     monthly_sales_trend
 )
+from assignment_2.columnar import SalesColumns, load_sales_columns
+from assignment_2.parallel import parallel_sales_report
 
 __all__ = [
     'load_sales_data',
+    'iter_sales_data',
+    'load_sales_columns',
+    'SalesColumns',
+    'METRICS',
+    'SalesAggregate',
+    'sales_report',
+    'parallel_sales_report',
     'total_sales',
     'sales_by_region',
     'sales_by_category',
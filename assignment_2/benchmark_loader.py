@@ -0,0 +1,92 @@
+import argparse
+import csv
+import os
+import random
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Dict, List
+
+from assignment_2.data_loader import load_sales_data
+
+_PRODUCTS = [
+    ('Electronics', 'Laptop', 999.99), ('Electronics', 'Headphones', 149.99),
+    ('Clothing', 'T-Shirt', 19.99), ('Clothing', 'Jeans', 59.99),
+    ('Food', 'Coffee', 12.99), ('Food', 'Snack', 2.99)
+]
+_REGIONS = ['North', 'South', 'East', 'West']
+
+
+def write_sample_csv(path: str, rows: int, distinct_dates: int = 365, seed: int = 0) -> None:
+    """Write a synthetic sales CSV with rows records spread over distinct_dates days."""
+    rng = random.Random(seed)
+    start = date(2024, 1, 1)
+    dates = [(start + timedelta(days=i)).isoformat() for i in range(distinct_dates)]
+    with open(path, 'w', encoding='utf-8', newline='') as file:
+        writer = csv.writer(file)
+        writer.writerow(['date', 'region', 'category', 'product', 'quantity', 'unit_price', 'amount'])
+        for _ in range(rows):
+            category, product, price = rng.choice(_PRODUCTS)
+            quantity = rng.randint(1, 10)
+            writer.writerow([rng.choice(dates), rng.choice(_REGIONS), category, product,
+                             quantity, price, f"{quantity * price:.2f}"])
+
+
+def load_sales_data_reference(csv_path: str) -> List[Dict[str, Any]]:
+    """The previous loader: csv.DictReader with datetime.strptime on every row."""
+    def parse(row: Dict[str, str]) -> Dict[str, Any] | None:
+        try:
+            return {
+                'date': datetime.strptime(row['date'], '%Y-%m-%d').date(),
+                'region': row['region'],
+                'category': row['category'],
+                'product': row['product'],
+                'quantity': int(row['quantity']),
+                'unit_price': float(row['unit_price']),
+                'amount': float(row['amount'])
+            }
+        except (ValueError, KeyError):
+            return None
+    
+    with open(csv_path, 'r', encoding='utf-8') as file:
+        parsed = map(parse, csv.DictReader(file))
+        return list(filter(lambda r: r is not None and r['amount'] > 0 and r['quantity'] > 0,
+                           parsed))
+
+
+def best_time(loader: Callable[[str], List[Dict[str, Any]]], path: str, repeat: int) -> float:
+    """Best wall time in seconds of repeat full loads."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        loader(path)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main(argv: List[str] = None):
+    """Compare the fast csv.reader/memoized-date loader against DictReader with strptime."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--dates", type=int, default=365, help="distinct dates in the file")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="runs per loader; the best run is reported")
+    args = parser.parse_args(argv)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "sales.csv")
+        write_sample_csv(path, args.rows, args.dates)
+        if load_sales_data(path) != load_sales_data_reference(path):
+            raise AssertionError("Fast loader returned different records")
+        
+        reference = best_time(load_sales_data_reference, path, args.repeat)
+        fast = best_time(load_sales_data, path, args.repeat)
+    
+    print(f"{'loader':28s} {'seconds':>8s} {'rows/s':>11s}")
+    print(f"{'DictReader + strptime':28s} {reference:8.3f} {args.rows / reference:11,.0f}")
+    print(f"{'csv.reader + memoized dates':28s} {fast:8.3f} {args.rows / fast:11,.0f}")
+    print(f"speedup: {reference / fast:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
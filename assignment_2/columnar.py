@@ -0,0 +1,195 @@
+import operator
+from array import array
+from datetime import date
+from functools import reduce
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+from assignment_2.csv_analyzer import SalesAggregate, _units, _SCALE
+from assignment_2.data_loader import iter_sales_data
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+CATEGORICAL_FIELDS = ('region', 'category', 'product')
+
+
+# Exact NumPy sums split scaled amounts into limbs of this many bits, so that
+# float64 bincount sums of up to 2**27 limbs per code stay exact
+_LIMB_BITS = 26
+_LIMB = float(1 << _LIMB_BITS)
+
+
+def _group_totals(codes: Any, amounts: Any, size: int, exact: bool = False) -> List[Any]:
+    """Total of amounts per code (0 .. size - 1), as an aggregate of the same exactness sums them.
+    
+    Float totals are added in row order, with numpy.bincount when NumPy is
+    installed. Exact totals are whole numbers of 2**-74 units; with NumPy,
+    each scaled amount's magnitude is split into 26-bit limbs, every limb is
+    summed per code by bincount and the limb sums are recombined as integers.
+    """
+    if np is None:
+        sums = [0 if exact else 0.0] * size
+        for code, amount in zip(codes, amounts):
+            sums[code] += _units(amount) if exact else amount
+        return sums
+    if not exact:
+        return np.bincount(codes, weights=amounts, minlength=size).tolist()
+    
+    scaled = np.trunc(amounts * _SCALE)
+    if not np.isfinite(scaled).all():
+        raise OverflowError("Exact sums need finite amounts")
+    sign, magnitude = np.sign(scaled), np.abs(scaled)
+    limb_sums = []
+    while True:
+        high = np.floor(magnitude / _LIMB)
+        limb_sums.append(np.bincount(codes, weights=sign * (magnitude - high * _LIMB),
+                                     minlength=size).tolist())
+        if not high.any():
+            break
+        magnitude = high
+    return [sum(int(limbs[code]) << (_LIMB_BITS * shift) for shift, limbs in enumerate(limb_sums))
+            for code in range(size)]
+
+
+class SalesColumns:
+    """Column-oriented sales dataset backed by typed arrays.
+    
+    amount and unit_price are stored as doubles, quantity as 64-bit integers
+    and date as proleptic Gregorian ordinals (date.toordinal()). region,
+    category and product are dictionary-encoded: each column holds integer
+    codes into values[field], in first-seen order. A row costs about 40 bytes
+    instead of a dict of seven boxed objects.
+    
+    Every csv_analyzer function accepts a SalesColumns in place of a record
+    list; aggregation then runs as group-by sums over the code columns, using
+    numpy.bincount when NumPy is installed. Iterating yields record dicts.
+    """
+    
+    def __init__(self):
+        self.date = array('i')
+        self.quantity = array('q')
+        self.unit_price = array('d')
+        self.amount = array('d')
+        self.region = array('I')
+        self.category = array('I')
+        self.product = array('I')
+        self.values: Dict[str, List[str]] = {field: [] for field in CATEGORICAL_FIELDS}
+        self._codes: Dict[str, Dict[str, int]] = {field: {} for field in CATEGORICAL_FIELDS}
+    
+    @classmethod
+    def from_records(cls, records: Iterable[Dict[str, Any]]) -> 'SalesColumns':
+        """Build columns from parsed records, consuming them one at a time."""
+        return reduce(SalesColumns.append, records, cls())
+    
+    def append(self, record: Dict[str, Any]) -> 'SalesColumns':
+        """Add one parsed record. Returns self, so it can drive reduce()."""
+        self.date.append(record['date'].toordinal())
+        self.quantity.append(record['quantity'])
+        self.unit_price.append(record['unit_price'])
+        self.amount.append(record['amount'])
+        self.region.append(self._encode('region', record['region']))
+        self.category.append(self._encode('category', record['category']))
+        self.product.append(self._encode('product', record['product']))
+        return self
+    
+    def _encode(self, field: str, value: str) -> int:
+        codes = self._codes[field]
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(codes)
+            self.values[field].append(value)
+        return code
+    
+    def __len__(self) -> int:
+        return len(self.amount)
+    
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """Decode rows back into record dicts, as returned by load_sales_data."""
+        regions, categories, products = (self.values[field] for field in CATEGORICAL_FIELDS)
+        for row in zip(self.date, self.region, self.category, self.product,
+                       self.quantity, self.unit_price, self.amount):
+            yield {
+                'date': date.fromordinal(row[0]),
+                'region': regions[row[1]],
+                'category': categories[row[2]],
+                'product': products[row[3]],
+                'quantity': row[4],
+                'unit_price': row[5],
+                'amount': row[6]
+            }
+    
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the column arrays (dictionaries excluded)."""
+        columns = (self.date, self.quantity, self.unit_price, self.amount,
+                   self.region, self.category, self.product)
+        return sum(column.itemsize * len(column) for column in columns)
+    
+    def column(self, name: str) -> Any:
+        """A column as a zero-copy NumPy array if NumPy is installed, else the array itself."""
+        column = getattr(self, name)
+        return np.frombuffer(column, dtype=column.typecode) if np is not None else column
+    
+    def total(self) -> float:
+        """Sum of amount, added in row order like csv_analyzer.total_sales."""
+        if np is not None and len(self):
+            return float(np.cumsum(self.column('amount'))[-1])
+        return reduce(operator.add, self.amount, 0.0)
+    
+    def group_sums(self, field: str, exact: bool = False) -> Dict[str, Any]:
+        """Total amount per value of a dictionary-encoded field, in first-seen order.
+        
+        With exact=True the totals are whole numbers of 2**-74 units.
+        """
+        values = self.values[field]
+        sums = _group_totals(self.column(field), self.column('amount'), len(values), exact)
+        return dict(zip(values, sums))
+    
+    def month_sums(self, exact: bool = False) -> Dict[str, Any]:
+        """Total amount per "YYYY-MM" month, sorted by month.
+        
+        With exact=True the totals are whole numbers of 2**-74 units.
+        """
+        if np is not None:
+            unique, inverse = np.unique(self.column('date'), return_inverse=True)
+            ordinals = unique.tolist()
+        else:
+            ordinals = sorted(set(self.date))
+        keys = [f"{day.year}-{day.month:02d}" for day in map(date.fromordinal, ordinals)]
+        months = sorted(set(keys))
+        month_code = {month: code for code, month in enumerate(months)}
+        if np is not None:
+            row_codes = np.array([month_code[key] for key in keys], dtype=np.intp)[inverse]
+        else:
+            code_of = {ordinal: month_code[key] for ordinal, key in zip(ordinals, keys)}
+            row_codes = map(code_of.__getitem__, self.date)
+        sums = _group_totals(row_codes, self.column('amount'), len(months), exact)
+        return dict(zip(months, sums))
+    
+    def aggregate(self, metrics: Optional[Iterable[str]] = None,
+                  exact: bool = False) -> SalesAggregate:
+        """SalesAggregate for the requested metrics, filled with column-wise group-by sums.
+        
+        csv_analyzer.sales_report uses this hook instead of a row-by-row pass.
+        """
+        aggregate = SalesAggregate(metrics, exact)
+        aggregate.count = len(self)
+        if exact:
+            codes = np.zeros(len(self), dtype=np.intp) if np is not None else [0] * len(self)
+            aggregate.total = _group_totals(codes, self.column('amount'), 1, exact=True)[0]
+        else:
+            aggregate.total = self.total()
+        for field, totals in aggregate.groups.items():
+            sums = self.month_sums(exact) if field == 'month' else self.group_sums(field, exact)
+            totals.update(sums)
+        return aggregate
+    
+    def __repr__(self) -> str:
+        """String representation of the dataset."""
+        return f"SalesColumns(rows={len(self)}, nbytes={self.nbytes})"
+
+
+def load_sales_columns(csv_path: str = None) -> SalesColumns:
+    """Load sales data from CSV straight into a SalesColumns, without a list of record dicts."""
+    return SalesColumns.from_records(iter_sales_data(csv_path))
@@ -1,55 +1,165 @@
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Tuple, Iterable, Optional
 from functools import reduce
 
+METRICS = (
+    'total_sales',
+    'sales_by_region',
+    'sales_by_category',
+    'top_products',
+    'average_sale_amount',
+    'monthly_sales_trend'
+)
 
-def total_sales(records: List[Dict[str, Any]]) -> float:
-    """Calculate total sales amount."""
-    return reduce(lambda acc, r: acc + r['amount'], records, 0.0)
+# Metric -> record field its per-key totals are grouped by ('month' is derived from 'date')
+_GROUP_FIELDS = {
+    'sales_by_region': 'region',
+    'sales_by_category': 'category',
+    'top_products': 'product',
+    'monthly_sales_trend': 'month'
+}
+
+# Fixed-point unit for exact amount sums: 2**74 * amount is a whole number for any
+# float amount >= 2**-22, and int / int division rounds the exact sum correctly
+_UNIT = 1 << 74
+_SCALE = float(_UNIT)
+
+
+class SalesAggregate:
+    """Running totals behind the requested metrics, filled in a single pass over the records.
+    
+    add() folds one record into every requested accumulator at once, so a full
+    report costs one scan instead of one reduce per metric. Count and total are
+    always kept, since they are needed by total_sales and average_sale_amount.
+    
+    By default amounts are added as floats, in record order. With exact=True
+    they are summed exactly, as integer multiples of 2**-74, and rounded to
+    float once, in report(): totals then do not depend on the order records
+    are added in, so aggregates built from separate chunks of a file merge()
+    into exactly the result of one pass. Exact sums drop any part of an amount
+    below 2**-74, and add() raises OverflowError on a non-finite amount.
+    """
+    
+    def __init__(self, metrics: Optional[Iterable[str]] = None, exact: bool = False):
+        self.metrics = tuple(METRICS if metrics is None else metrics)
+        unknown = [metric for metric in self.metrics if metric not in METRICS]
+        if unknown:
+            raise ValueError(f"Unknown metrics: {', '.join(unknown)}")
+        
+        self.exact = exact
+        self.count = 0
+        self.total = 0 if exact else 0.0
+        self.groups: Dict[str, Dict[str, Any]] = {
+            _GROUP_FIELDS[metric]: {} for metric in self.metrics if metric in _GROUP_FIELDS
+        }
+        self._fields = [(field, totals) for field, totals in self.groups.items() if field != 'month']
+        self._months = self.groups.get('month')
+        self._month_keys: Dict[Any, str] = {}  # date -> "YYYY-MM"; sales files repeat few dates
+    
+    def add(self, record: Dict[str, Any]) -> 'SalesAggregate':
+        """Fold one record into every accumulator. Returns self, so it can drive reduce()."""
+        amount = record['amount']
+        if self.exact:
+            try:
+                amount = int(amount * _SCALE)
+            except (OverflowError, ValueError):
+                raise OverflowError("Exact sums need finite amounts") from None
+        self.count += 1
+        self.total += amount
+        for field, totals in self._fields:
+            key = record[field]
+            totals[key] = totals.get(key, 0) + amount
+        if self._months is not None:
+            date_obj = record['date']
+            key = self._month_keys.get(date_obj)
+            if key is None:
+                key = self._month_keys[date_obj] = f"{date_obj.year}-{date_obj.month:02d}"
+            self._months[key] = self._months.get(key, 0) + amount
+        return self
+    
+    def merge(self, other: 'SalesAggregate') -> 'SalesAggregate':
+        """Add the totals of an aggregate over later records into this one. Returns self.
+        
+        Keys new to this aggregate are appended in other's order, so merging
+        chunk aggregates in file order keeps the first-seen key order of a
+        single pass.
+        """
+        if other.metrics != self.metrics:
+            raise ValueError("Cannot merge aggregates of different metrics")
+        if other.exact != self.exact:
+            raise ValueError("Cannot merge exact and float aggregates")
+        self.count += other.count
+        self.total += other.total
+        for field, totals in self.groups.items():
+            for key, amount in other.groups[field].items():
+                totals[key] = totals.get(key, 0) + amount
+        return self
+    
+    def report(self, n: int = 5) -> Dict[str, Any]:
+        """Final value of each requested metric, keyed by metric name."""
+        total = self.total / _UNIT if self.exact else self.total
+        views = {
+            'total_sales': lambda: total,
+            'sales_by_region': lambda: self._amounts('region'),
+            'sales_by_category': lambda: self._amounts('category'),
+            'top_products': lambda: sorted(self._amounts('product').items(),
+                                           key=lambda x: x[1], reverse=True)[:n],
+            'average_sale_amount': lambda: total / self.count if self.count else 0.0,
+            'monthly_sales_trend': lambda: dict(sorted(self._amounts('month').items()))
+        }
+        return {metric: views[metric]() for metric in self.metrics}
+    
+    def _amounts(self, field: str) -> Dict[str, float]:
+        if self.exact:
+            return {key: units / _UNIT for key, units in self.groups[field].items()}
+        return dict(self.groups[field])
+
+
+def _units(amount: float) -> int:
+    """An amount as a whole number of 2**-74 units, as summed by an exact SalesAggregate."""
+    return int(amount * _SCALE)
+
+
+def sales_report(records: Iterable[Dict[str, Any]], metrics: Optional[Iterable[str]] = None,
+                 n: int = 5, exact: bool = False) -> Dict[str, Any]:
+    """Compute the requested metrics (default: all of METRICS) in one pass over records.
+    
+    records may be any iterable, including the iter_sales_data() stream, which
+    is consumed one record at a time in constant memory. n is the number of
+    products returned for 'top_products'. A columnar dataset
+    (assignment_2.columnar.SalesColumns) supplies its own aggregate() built from
+    column-wise group-by sums instead of a row-by-row pass. exact selects
+    order-independent sums (see SalesAggregate).
+    """
+    if hasattr(records, 'aggregate'):
+        return records.aggregate(metrics, exact).report(n)
+    return reduce(SalesAggregate.add, records, SalesAggregate(metrics, exact)).report(n)
 
 
-def _group_by_field(records: List[Dict[str, Any]], field: str) -> Dict[str, float]:
-    """Group sales by a field and calculate total for each value using functional programming."""
-    def accumulate(acc: Dict[str, float], record: Dict[str, Any]) -> Dict[str, float]:
-        key = record[field]
-        acc[key] = acc.get(key, 0.0) + record['amount']
-        return acc
-    return reduce(accumulate, records, {})
+def total_sales(records: Iterable[Dict[str, Any]]) -> float:
+    """Calculate total sales amount."""
+    return sales_report(records, ['total_sales'])['total_sales']
 
 
-def sales_by_region(records: List[Dict[str, Any]]) -> Dict[str, float]:
+def sales_by_region(records: Iterable[Dict[str, Any]]) -> Dict[str, float]:
     """Group sales by region and calculate total for each region."""
-    return _group_by_field(records, 'region')
+    return sales_report(records, ['sales_by_region'])['sales_by_region']
 
 
-def sales_by_category(records: List[Dict[str, Any]]) -> Dict[str, float]:
+def sales_by_category(records: Iterable[Dict[str, Any]]) -> Dict[str, float]:
     """Group sales by category and calculate total for each category."""
-    return _group_by_field(records, 'category')
+    return sales_report(records, ['sales_by_category'])['sales_by_category']
 
 
-def top_products(records: List[Dict[str, Any]], n: int = 5) -> List[Tuple[str, float]]:
+def top_products(records: Iterable[Dict[str, Any]], n: int = 5) -> List[Tuple[str, float]]:
     """Find top N products by total sales amount."""
-    product_totals = _group_by_field(records, 'product')
-    return sorted(product_totals.items(), key=lambda x: x[1], reverse=True)[:n]
+    return sales_report(records, ['top_products'], n)['top_products']
 
 
-def average_sale_amount(records: List[Dict[str, Any]]) -> float:
+def average_sale_amount(records: Iterable[Dict[str, Any]]) -> float:
     """Calculate average sale amount."""
-    if not records:
-        return 0.0
-    return total_sales(records) / len(records)
+    return sales_report(records, ['average_sale_amount'])['average_sale_amount']
 
 
-def monthly_sales_trend(records: List[Dict[str, Any]]) -> Dict[str, float]:
+def monthly_sales_trend(records: Iterable[Dict[str, Any]]) -> Dict[str, float]:
     """Calculate monthly sales trend using functional programming."""
-    def get_month_key(record: Dict[str, Any]) -> str:
-        date_obj = record['date']
-        return f"{date_obj.year}-{date_obj.month:02d}"
-    
-    def accumulate(acc: Dict[str, float], record: Dict[str, Any]) -> Dict[str, float]:
-        key = get_month_key(record)
-        acc[key] = acc.get(key, 0.0) + record['amount']
-        return acc
-    
-    monthly_totals = reduce(accumulate, records, {})
-    return dict(sorted(monthly_totals.items()))
-
+    return sales_report(records, ['monthly_sales_trend'])['monthly_sales_trend']
@@ -1,40 +1,75 @@
 import csv
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Any
-from datetime import datetime
+from typing import Iterator, List, Dict, Any, Iterable
+from datetime import date, datetime
 
+FIELDS = ('date', 'region', 'category', 'product', 'quantity', 'unit_price', 'amount')
 
-def load_sales_data(csv_path: str = None) -> List[Dict[str, Any]]:
-    """Load sales data from CSV file using functional programming approach."""
+
+def iter_sales_data(csv_path: str = None) -> Iterator[Dict[str, Any]]:
+    """Stream valid sales records from a CSV file one at a time.
+    
+    Rows are read, parsed and filtered lazily as the caller iterates, so memory
+    stays constant regardless of file size and each record can be aggregated
+    as soon as it is read. The file is closed when iteration ends.
+    """
     if csv_path is None:
         csv_path = Path(__file__).parent / "data" / "sales_data.csv"
     
-    with open(csv_path, 'r', encoding='utf-8') as file:
-        reader = csv.DictReader(file)
-        parsed = _parse_record(reader)
-        filtered = _filter_valid_records(parsed)
-        return list(filtered)
+    with open(csv_path, 'r', encoding='utf-8', newline='') as file:
+        reader = csv.reader(file)
+        parsed = _parse_record(reader, next(reader, []))
+        yield from _filter_valid_records(parsed)
+
+
+def load_sales_data(csv_path: str = None) -> List[Dict[str, Any]]:
+    """Load sales data from CSV file using functional programming approach."""
+    return list(iter_sales_data(csv_path))
+
+
+@lru_cache(maxsize=1 << 16)
+def _parse_date(text: str) -> date:
+    """Parse a YYYY-MM-DD date; memoized, since sales files repeat a few hundred dates.
+    
+    Zero-padded dates are split by position instead of going through strptime;
+    anything else falls back to strptime, so the same strings are accepted and
+    rejected as before. Invalid dates raise ValueError and are not cached.
+    """
+    if (len(text) == 10 and text.isascii() and text[4] == '-' and text[7] == '-'
+            and text[:4].isdigit() and text[5:7].isdigit() and text[8:].isdigit()):
+        return date(int(text[:4]), int(text[5:7]), int(text[8:]))
+    return datetime.strptime(text, '%Y-%m-%d').date()
 
 
-def _parse_record(reader) -> map:
-    """Parse CSV records, converting types and dates. Returns None for invalid records."""
-    def parse(row: Dict[str, str]) -> Dict[str, Any] | None:
+def _parse_record(rows: Iterable[List[str]], header: List[str]) -> map:
+    """Parse csv.reader rows, converting types and dates. Returns None for invalid records.
+    
+    Column positions are looked up once from the header (the last occurrence
+    wins, as with DictReader). If a required column is missing, every row is
+    invalid; so is a row too short to hold every column.
+    """
+    position = {name: index for index, name in enumerate(header)}
+    if not all(field in position for field in FIELDS):
+        return map(lambda row: None, rows)
+    d, r, c, p, q, u, a = (position[field] for field in FIELDS)
+    
+    def parse(row: List[str]) -> Dict[str, Any] | None:
         try:
             return {
-                'date': datetime.strptime(row['date'], '%Y-%m-%d').date(),
-                'region': row['region'],
-                'category': row['category'],
-                'product': row['product'],
-                'quantity': int(row['quantity']),
-                'unit_price': float(row['unit_price']),
-                'amount': float(row['amount'])
+                'date': _parse_date(row[d]),
+                'region': row[r],
+                'category': row[c],
+                'product': row[p],
+                'quantity': int(row[q]),
+                'unit_price': float(row[u]),
+                'amount': float(row[a])
             }
-        except (ValueError, KeyError):
+        except (ValueError, IndexError):
             return None
-    return map(parse, reader)
+    return map(parse, rows)
 
 
 def _filter_valid_records(records) -> filter:
     """Filter out invalid records (None from parsing errors, negative amounts, zero quantities, etc.)."""
     return filter(lambda r: r is not None and r['amount'] > 0 and r['quantity'] > 0, records)
-
@@ -0,0 +1,82 @@
+import csv
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+from itertools import repeat
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from assignment_2.csv_analyzer import METRICS, SalesAggregate
+from assignment_2.data_loader import _parse_record, _filter_valid_records
+
+DEFAULT_CHUNK_SIZE = 8 * 1024 * 1024
+
+
+def split_ranges(csv_path: str,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE) -> Tuple[List[str], List[Tuple[int, int]]]:
+    """Read the header and split the rest of the file into byte ranges of about chunk_size.
+    
+    Every range starts at the beginning of a line and ends just after a newline
+    (or at end of file), so each chunk can be parsed on its own.
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be greater than 0")
+    
+    with open(csv_path, 'rb') as file:
+        header_line = file.readline()
+        start = file.tell()
+        size = os.fstat(file.fileno()).st_size
+        ranges = []
+        while start < size:
+            # Back up one byte so a boundary that already falls on a line start is kept
+            file.seek(min(start + chunk_size, size) - 1)
+            file.readline()
+            end = file.tell()
+            ranges.append((start, end))
+            start = end
+    header = next(csv.reader([header_line.decode('utf-8')]), [])
+    return header, ranges
+
+
+def aggregate_range(csv_path: str, start: int, end: int, header: List[str],
+                    metrics: Optional[Iterable[str]] = None) -> SalesAggregate:
+    """Parse and aggregate the records in one byte range of a sales CSV.
+    
+    Runs in a worker process; returns the compact, mergeable exact
+    SalesAggregate instead of the parsed records.
+    """
+    with open(csv_path, 'rb') as file:
+        file.seek(start)
+        text = file.read(end - start).decode('utf-8')
+    rows = csv.reader(io.StringIO(text, newline=''))
+    records = _filter_valid_records(_parse_record(rows, header))
+    return reduce(SalesAggregate.add, records, SalesAggregate(metrics, exact=True))
+
+
+def parallel_sales_report(csv_path: str = None, metrics: Optional[Iterable[str]] = None,
+                          n: int = 5, workers: Optional[int] = None,
+                          chunk_size: int = DEFAULT_CHUNK_SIZE) -> Dict[str, Any]:
+    """sales_report over a CSV file, parsed and aggregated chunk by chunk in a process pool.
+    
+    The file is split into line-aligned byte ranges (see split_ranges); each
+    worker returns a SalesAggregate for its range, and the partials are merged
+    in file order. Sums are exact, so the result equals
+    sales_report(iter_sales_data(csv_path), metrics, n, exact=True) bit for bit.
+    workers defaults to os.cpu_count(); with one worker or one chunk, the
+    ranges are aggregated in this process. Records must not span lines (no
+    newlines inside quoted fields).
+    """
+    if csv_path is None:
+        csv_path = Path(__file__).parent / "data" / "sales_data.csv"
+    metrics = tuple(METRICS if metrics is None else metrics)
+    workers = workers or os.cpu_count() or 1
+    
+    header, ranges = split_ranges(csv_path, chunk_size)
+    starts = [start for start, _ in ranges]
+    ends = [end for _, end in ranges]
+    arguments = (repeat(csv_path), starts, ends, repeat(header), repeat(metrics))
+    merged = SalesAggregate(metrics, exact=True)
+    if workers == 1 or len(ranges) <= 1:
+        return reduce(SalesAggregate.merge, map(aggregate_range, *arguments), merged).report(n)
+    with ProcessPoolExecutor(max_workers=min(workers, len(ranges))) as pool:
+        return reduce(SalesAggregate.merge, pool.map(aggregate_range, *arguments), merged).report(n)
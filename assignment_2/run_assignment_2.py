@@ -1,12 +1,5 @@
 from assignment_2.data_loader import load_sales_data
-from assignment_2.csv_analyzer import (
-    total_sales,
-    sales_by_region,
-    sales_by_category,
-    top_products,
-    average_sale_amount,
-    monthly_sales_trend
-)
+from assignment_2.csv_analyzer import sales_report
 
 
 def main():
@@ -24,11 +17,14 @@ def main():
     print(f"Loaded {len(records)} sales records")
     print()
     
+    # All six analyses come from a single pass over the records
+    report = sales_report(records, n=5)
+    
     # Analysis 1: Total Sales
     print("-" * line_width)
     print("1. Total Sales")
     print("-" * line_width)
-    total = total_sales(records)
+    total = report['total_sales']
     print(f"Total Sales Amount: ${total:,.2f}")
     print()
     
@@ -36,7 +32,7 @@ def main():
     print("-" * line_width)
     print("2. Sales by Region")
     print("-" * line_width)
-    region_sales = sales_by_region(records)
+    region_sales = report['sales_by_region']
     for region, amount in sorted(region_sales.items(), key=lambda x: x[1], reverse=True):
         amount_str = f"${amount:,.2f}"
         print(f"  {region:10s}: {amount_str:>13s}")
@@ -46,7 +42,7 @@ def main():
     print("-" * line_width)
     print("3. Sales by Category")
     print("-" * line_width)
-    category_sales = sales_by_category(records)
+    category_sales = report['sales_by_category']
     for category, amount in sorted(category_sales.items(), key=lambda x: x[1], reverse=True):
         amount_str = f"${amount:,.2f}"
         print(f"  {category:12s}: {amount_str:>13s}")
@@ -56,7 +52,7 @@ def main():
     print("-" * line_width)
     print("4. Top 5 Products by Sales")
     print("-" * line_width)
-    top = top_products(records, n=5)
+    top = report['top_products']
     for i, (product, amount) in enumerate(top, 1):
         amount_str = f"${amount:,.2f}"
         print(f"  {i}. {product:15s}: {amount_str:>13s}")
@@ -66,7 +62,7 @@ def main():
     print("-" * line_width)
     print("5. Average Sale Amount")
     print("-" * line_width)
-    avg = average_sale_amount(records)
+    avg = report['average_sale_amount']
     amount_str = f"${avg:,.2f}"
     print(f"Average Sale Amount: {amount_str:>13s}")
     print()
@@ -75,7 +71,7 @@ def main():
     print("-" * line_width)
     print("6. Monthly Sales Trend")
     print("-" * line_width)
-    monthly = monthly_sales_trend(records)
+    monthly = report['monthly_sales_trend']
     for month, amount in monthly.items():
         amount_str = f"${amount:,.2f}"
         print(f"  {month:8s}: {amount_str:>13s}")
@@ -0,0 +1,100 @@
+import pytest
+from datetime import date
+from assignment_2 import columnar
+from assignment_2.columnar import SalesColumns, load_sales_columns
+from assignment_2.csv_analyzer import (
+    total_sales,
+    sales_by_region,
+    top_products,
+    average_sale_amount,
+    monthly_sales_trend,
+    sales_report
+)
+from assignment_2.data_loader import load_sales_data
+
+
+class TestSalesColumns:
+    """Test suite for the columnar SalesColumns dataset."""
+    
+    @pytest.fixture
+    def sample_records(self):
+        """Sample sales records for testing."""
+        return [
+            {'date': date(2024, 1, 15), 'region': 'North', 'category': 'Electronics',
+             'product': 'Laptop', 'quantity': 2, 'unit_price': 999.99, 'amount': 1999.98},
+            {'date': date(2024, 1, 20), 'region': 'South', 'category': 'Clothing',
+             'product': 'T-Shirt', 'quantity': 10, 'unit_price': 19.99, 'amount': 199.90},
+            {'date': date(2024, 2, 10), 'region': 'North', 'category': 'Clothing',
+             'product': 'Laptop', 'quantity': 1, 'unit_price': 999.99, 'amount': 999.99}
+        ]
+    
+    def test_dictionary_encoding(self, sample_records):
+        """Test that categorical fields become codes into first-seen value lists."""
+        columns = SalesColumns.from_records(sample_records)
+        
+        assert len(columns) == 3
+        assert columns.values['region'] == ['North', 'South']
+        assert list(columns.region) == [0, 1, 0]
+        assert list(columns.product) == [0, 1, 0]
+        assert list(columns.date) == [record['date'].toordinal() for record in sample_records]
+        assert columns.amount.typecode == 'd'
+    
+    def test_iteration_round_trips_records(self, sample_records):
+        """Test that iterating decodes the original records."""
+        assert list(SalesColumns.from_records(sample_records)) == sample_records
+    
+    def test_analyzer_functions_accept_columns(self, sample_records):
+        """Test that every analyzer function gives the same result for columns and records."""
+        columns = SalesColumns.from_records(sample_records)
+        
+        assert total_sales(columns) == total_sales(sample_records)
+        assert sales_by_region(columns) == sales_by_region(sample_records)
+        assert top_products(columns, n=1) == [('Laptop', 1999.98 + 999.99)]
+        assert average_sale_amount(columns) == average_sale_amount(sample_records)
+        assert monthly_sales_trend(columns) == monthly_sales_trend(sample_records)
+    
+    def test_pure_python_group_by(self, sample_records, monkeypatch):
+        """Test the array-module fallback used when NumPy is not installed."""
+        monkeypatch.setattr(columnar, 'np', None)
+        columns = SalesColumns.from_records(sample_records)
+        
+        assert sales_report(columns) == sales_report(sample_records)
+        assert columns.column('amount') is columns.amount
+    
+    def test_numpy_group_by(self, sample_records):
+        """Test that the NumPy path matches the row-by-row report."""
+        pytest.importorskip('numpy')
+        columns = SalesColumns.from_records(sample_records)
+        
+        assert sales_report(columns) == sales_report(sample_records)
+    
+    @pytest.mark.parametrize("use_numpy", [True, False])
+    def test_exact_group_by(self, sample_records, monkeypatch, use_numpy):
+        """Test that exact column sums match the exact row-by-row report."""
+        if use_numpy:
+            pytest.importorskip('numpy')
+        else:
+            monkeypatch.setattr(columnar, 'np', None)
+        records = sample_records + [dict(sample_records[0], amount=0.1, product='Tea')] * 7
+        records.append(dict(sample_records[1], amount=-1e16))
+        records.append(dict(sample_records[1], amount=1e16))
+        columns = SalesColumns.from_records(records)
+        
+        assert sales_report(columns, exact=True) == sales_report(records, exact=True)
+        assert sales_report(columns, exact=True)['sales_by_region']['South'] == 199.9
+    
+    def test_empty_columns(self):
+        """Test the report over an empty dataset."""
+        report = sales_report(SalesColumns())
+        
+        assert report['total_sales'] == 0.0
+        assert report['monthly_sales_trend'] == {}
+    
+    def test_load_sales_columns(self):
+        """Test loading the default CSV straight into columns."""
+        columns = load_sales_columns()
+        records = load_sales_data()
+        
+        assert len(columns) == len(records)
+        assert columns.nbytes < 64 * len(columns)
+        assert sales_report(columns) == sales_report(records)
@@ -6,7 +6,10 @@ from assignment_2.csv_analyzer import (
     sales_by_category,
     top_products,
     average_sale_amount,
-    monthly_sales_trend
+    monthly_sales_trend,
+    sales_report,
+    SalesAggregate,
+    METRICS
 )
 
 
@@ -124,6 +127,62 @@ class TestCSVAnalyzer:
         assert months == sorted(months)
 
 
+class TestSalesReport:
+    """Test suite for the single-pass sales_report engine."""
+    
+    @pytest.fixture
+    def sample_records(self):
+        """Sample sales records for testing."""
+        return [
+            {'date': date(2024, 1, 15), 'region': 'North', 'category': 'Electronics',
+             'product': 'Laptop', 'quantity': 2, 'unit_price': 999.99, 'amount': 1999.98},
+            {'date': date(2024, 1, 20), 'region': 'South', 'category': 'Clothing',
+             'product': 'T-Shirt', 'quantity': 10, 'unit_price': 19.99, 'amount': 199.90},
+            {'date': date(2024, 2, 10), 'region': 'North', 'category': 'Clothing',
+             'product': 'Jacket', 'quantity': 3, 'unit_price': 89.99, 'amount': 269.97}
+        ]
+    
+    def test_full_report_matches_individual_functions(self, sample_records):
+        """Test that the combined report equals each function's own result."""
+        report = sales_report(sample_records, n=2)
+        
+        assert list(report) == list(METRICS)
+        assert report['total_sales'] == total_sales(sample_records)
+        assert report['sales_by_region'] == sales_by_region(sample_records)
+        assert report['sales_by_category'] == sales_by_category(sample_records)
+        assert report['top_products'] == top_products(sample_records, n=2)
+        assert report['average_sale_amount'] == average_sale_amount(sample_records)
+        assert report['monthly_sales_trend'] == monthly_sales_trend(sample_records)
+    
+    def test_single_pass_over_iterator(self, sample_records):
+        """Test that a one-shot iterator is enough for a full report."""
+        report = sales_report(iter(sample_records))
+        
+        assert abs(report['total_sales'] - (1999.98 + 199.90 + 269.97)) < 0.01
+        assert report['monthly_sales_trend'].keys() == {'2024-01', '2024-02'}
+    
+    def test_subset_of_metrics(self, sample_records):
+        """Test that only the requested metrics are computed and returned."""
+        aggregate = SalesAggregate(['sales_by_region', 'average_sale_amount'])
+        for record in sample_records:
+            aggregate.add(record)
+        
+        assert set(aggregate.groups) == {'region'}
+        assert set(aggregate.report()) == {'sales_by_region', 'average_sale_amount'}
+    
+    def test_empty_records(self):
+        """Test the report over no records."""
+        report = sales_report([])
+        
+        assert report['total_sales'] == 0.0
+        assert report['average_sale_amount'] == 0.0
+        assert report['top_products'] == []
+    
+    def test_unknown_metric(self):
+        """Test that an unknown metric name is rejected."""
+        with pytest.raises(ValueError):
+            sales_report([], ['median_sale'])
+
 class TestCSVAnalyzerIntegration:
     """Integration tests with real data."""
     
@@ -1,7 +1,8 @@
 import pytest
 from pathlib import Path
 from datetime import date
-from assignment_2.data_loader import load_sales_data
+from assignment_2.data_loader import load_sales_data, iter_sales_data, _parse_date
+from assignment_2.csv_analyzer import sales_report
 
 
 class TestDataLoader:
@@ -66,6 +67,19 @@ class TestDataLoader:
         assert len(records) == 1
         assert records[0]['product'] == 'Laptop'
     
+    def test_load_sales_data_keeps_infinite_amount(self, tmp_path):
+        """Test that a positive infinite amount passes validation, as any amount > 0 does."""
+        csv_file = tmp_path / "test_sales.csv"
+        csv_file.write_text(
+            "date,region,category,product,quantity,unit_price,amount\n"
+            "2024-01-15,North,Electronics,Laptop,2,999.99,1999.98\n"
+            "2024-01-16,West,Food,Snack,1,inf,inf\n"
+        )
+        
+        records = load_sales_data(str(csv_file))
+        
+        assert [record['amount'] for record in records] == [1999.98, float('inf')]
+    
     def test_load_sales_data_all_records_valid(self):
         """Test that all loaded records have valid data."""
         records = load_sales_data()
@@ -92,4 +106,47 @@ class TestDataLoader:
         # Should only have 1 valid record (first one)
         assert len(records) == 1
         assert records[0]['product'] == 'Laptop'
-
+    
+    def test_iter_sales_data_streams_records(self, tmp_path):
+        """Test that iter_sales_data yields parsed, filtered records lazily."""
+        csv_file = tmp_path / "test_sales.csv"
+        csv_file.write_text(
+            "date,region,category,product,quantity,unit_price,amount\n"
+            "2024-01-15,North,Electronics,Laptop,2,999.99,1999.98\n"
+            "2024-01-16,South,Clothing,Shirt,0,19.99,0.00\n"
+            "2024-01-17,East,Food,Snack,3,2.99,8.97\n"
+        )
+        
+        stream = iter_sales_data(str(csv_file))
+        assert not isinstance(stream, list)
+        assert next(stream)['product'] == 'Laptop'
+        assert [record['product'] for record in stream] == ['Snack']
+    
+    def test_streaming_report_matches_loaded_report(self):
+        """Test that a report over the stream equals one over the loaded list."""
+        assert sales_report(iter_sales_data()) == sales_report(load_sales_data())
+    
+    def test_parse_date_fast_path_and_fallback(self):
+        """Test that padded and unpadded dates parse as with strptime, and bad dates fail."""
+        assert _parse_date('2024-01-15') == date(2024, 1, 15)
+        assert _parse_date('2024-1-5') == date(2024, 1, 5)
+        for text in ('2024-02-30', '2024-13-01', '15/01/2024', '2024-01-15 '):
+            with pytest.raises(ValueError):
+                _parse_date(text)
+    
+    def test_load_sales_data_missing_column_or_field(self, tmp_path):
+        """Test that a missing header column or a short row makes records invalid."""
+        csv_file = tmp_path / "test_sales.csv"
+        csv_file.write_text(
+            "date,region,category,product,quantity,amount\n"
+            "2024-01-15,North,Electronics,Laptop,2,1999.98\n"
+        )
+        assert load_sales_data(str(csv_file)) == []
+        
+        csv_file.write_text(
+            "date,region,category,product,quantity,unit_price,amount\n"
+            "2024-01-15,North,Electronics,Laptop,2,999.99\n"
+            "\n"
+            "2024-01-16,South,Clothing,Shirt,1,19.99,19.99\n"
+        )
+        assert [record['product'] for record in load_sales_data(str(csv_file))] == ['Shirt']
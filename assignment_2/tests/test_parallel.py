@@ -0,0 +1,124 @@
+import math
+import pytest
+from datetime import date
+from assignment_2.csv_analyzer import SalesAggregate, sales_report
+from assignment_2.data_loader import iter_sales_data
+from assignment_2.parallel import split_ranges, aggregate_range, parallel_sales_report
+
+
+class TestParallelSalesReport:
+    """Test suite for chunked, process-parallel aggregation."""
+    
+    @pytest.fixture
+    def csv_file(self, tmp_path):
+        """CSV with valid, invalid and blank rows."""
+        csv_file = tmp_path / "sales.csv"
+        csv_file.write_text(
+            "date,region,category,product,quantity,unit_price,amount\n"
+            "2024-01-15,North,Electronics,Laptop,2,999.99,1999.98\n"
+            "2024-01-16,South,Clothing,Shirt,0,19.99,0.00\n"
+            "2024-01-17,East,Food,Coffee,3,0.1,0.3\n"
+            "\n"
+            "2024-02-01,North,Food,Coffee,1,0.1,0.1\n"
+            "bad-date,West,Food,Snack,1,2.99,2.99\n"
+            "2024-03-05,West,Food,Snack,1,0.7,0.7\n"
+        )
+        return str(csv_file)
+    
+    def test_split_ranges_align_to_lines(self, csv_file):
+        """Test that ranges cover the body without gaps and start on line boundaries."""
+        header, ranges = split_ranges(csv_file, chunk_size=10)
+        with open(csv_file, 'rb') as f:
+            data = f.read()
+        
+        assert header[0] == 'date'
+        assert ranges[0][0] == data.index(b'\n') + 1
+        assert ranges[-1][1] == len(data)
+        for (_, end), (start, _) in zip(ranges, ranges[1:]):
+            assert end == start
+            assert data[start - 1:start] == b'\n'
+    
+    @pytest.mark.parametrize("chunk_size", [1, 40, 100, 1 << 20])
+    def test_matches_serial_exactly(self, csv_file, chunk_size):
+        """Test that any chunking gives exactly the serial exact report."""
+        expected = sales_report(iter_sales_data(csv_file), exact=True)
+        
+        assert parallel_sales_report(csv_file, workers=2, chunk_size=chunk_size) == expected
+        assert parallel_sales_report(csv_file, workers=1, chunk_size=chunk_size) == expected
+    
+    def test_matches_serial_on_default_data(self):
+        """Test the process pool against the serial report on the bundled dataset."""
+        expected = sales_report(iter_sales_data(), n=3, exact=True)
+        
+        assert parallel_sales_report(n=3, workers=2, chunk_size=256) == expected
+    
+    def test_infinite_amount_raises(self, tmp_path):
+        """Test that an inf amount, kept by the loader, cannot be summed exactly."""
+        csv_file = tmp_path / "sales.csv"
+        csv_file.write_text(
+            "date,region,category,product,quantity,unit_price,amount\n"
+            "2024-01-15,North,Electronics,Laptop,2,999.99,1999.98\n"
+            "2024-03-09,West,Food,Snack,1,inf,inf\n"
+        )
+        
+        assert sales_report(iter_sales_data(str(csv_file)))['total_sales'] == math.inf
+        with pytest.raises(OverflowError):
+            parallel_sales_report(str(csv_file), workers=1)
+    
+    def test_chunks_return_aggregates(self, csv_file):
+        """Test that a chunk yields a SalesAggregate over only its own records."""
+        header, ranges = split_ranges(csv_file, chunk_size=1 << 20)
+        aggregate = aggregate_range(csv_file, *ranges[0], header, ['sales_by_region'])
+        
+        assert isinstance(aggregate, SalesAggregate) and aggregate.exact
+        assert aggregate.count == 4  # Zero quantity and bad date are dropped
+        assert list(aggregate.groups) == ['region']
+
+
+class TestSalesAggregateMerge:
+    """Test suite for exact, order-independent SalesAggregate sums."""
+    
+    def _record(self, amount, product='Coffee'):
+        return {'date': date(2024, 1, 1), 'region': 'North', 'category': 'Food',
+                'product': product, 'quantity': 1, 'unit_price': amount, 'amount': amount}
+    
+    def test_sums_do_not_depend_on_order(self):
+        """Test that reordering or splitting records never changes the totals."""
+        amounts = [0.1] * 10 + [1e16, -1e16, 0.7]
+        forward = SalesAggregate(exact=True)
+        for amount in amounts:
+            forward.add(self._record(amount))
+        backward = SalesAggregate(exact=True)
+        for amount in reversed(amounts):
+            backward.add(self._record(amount))
+        
+        assert forward.report() == backward.report()
+        assert forward.report()['total_sales'] == 1.7
+    
+    def test_merge_keeps_first_seen_order(self):
+        """Test that merging chunk aggregates in order matches one pass."""
+        records = [self._record(1.5, 'Tea'), self._record(2.5, 'Coffee'), self._record(2.5, 'Milk')]
+        whole = sales_report(records)
+        first, second = SalesAggregate(), SalesAggregate()
+        first.add(records[0])
+        second.add(records[1]).add(records[2])
+        
+        assert first.merge(second).report() == whole
+        assert whole['top_products'] == [('Coffee', 2.5), ('Milk', 2.5), ('Tea', 1.5)]
+    
+    def test_default_sums_are_floats_in_record_order(self):
+        """Test that without exact=True amounts are added as floats, as before."""
+        amounts = [0.1] * 10 + [float('nan')]
+        aggregate = SalesAggregate(['total_sales'])
+        for amount in amounts[:10]:
+            aggregate.add(self._record(amount))
+        
+        assert aggregate.report()['total_sales'] == sum(amounts[:10]) != 1.0
+        assert math.isnan(aggregate.add(self._record(amounts[10])).report()['total_sales'])
+    
+    def test_merge_requires_same_metrics(self):
+        """Test that aggregates of different metrics or exactness cannot be merged."""
+        with pytest.raises(ValueError):
+            SalesAggregate(['total_sales']).merge(SalesAggregate())
+        with pytest.raises(ValueError):
+            SalesAggregate(exact=True).merge(SalesAggregate())